@@ -0,0 +1,87 @@
+"""
+Memory-per-object benchmarks for gmpy_cffi.
+
+For each type, creates ``--count`` small objects and reports the Python
+heap growth per object as measured by ``tracemalloc`` (the wrapper
+instance, its memo slots and the cffi cdata holding the C struct) and
+the ``sys.getsizeof`` of one wrapper instance. Limbs allocated by GMP
+and MPFR themselves are not traced; for small values they add one or
+two limbs per object.
+
+The object caches are disabled while measuring so that every object is
+freshly allocated. Results are written as JSON, either to stdout or to
+the file given with ``--output``; sizes are in bytes.
+
+    $ python benchmarks/bench_memory.py --count 100000
+"""
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gmpy_cffi
+
+
+# (type name, constructor taking the object index)
+TYPES = [
+    ('mpz', lambda i: gmpy_cffi.mpz(i)),
+    ('xmpz', lambda i: gmpy_cffi.xmpz(i)),
+    ('mpq', lambda i: gmpy_cffi.mpq(i, 7)),
+    ('mpfr', lambda i: gmpy_cffi.mpfr(i)),
+    ('mpc', lambda i: gmpy_cffi.mpc(i, 1)),
+]
+
+
+def measure(make, count):
+    """Return the traced bytes per object for `count` objects."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [make(i) for i in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    # Discount the list holding the objects
+    after -= sys.getsizeof(objects)
+    return (after - before) / float(count)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--count', type=int, default=100000,
+                        help='number of objects created per type')
+    parser.add_argument('--output', help='write JSON here instead of stdout')
+    args = parser.parse_args(argv)
+
+    saved = gmpy_cffi.get_cache()
+    gmpy_cffi.set_cache(0, saved[1])
+    try:
+        results = {}
+        for name, make in TYPES:
+            results[name] = {
+                'traced_per_object': measure(make, args.count),
+                'getsizeof': sys.getsizeof(make(1)),
+                'has_dict': hasattr(make(1), '__dict__'),
+            }
+    finally:
+        gmpy_cffi.set_cache(*saved)
+
+    report = {
+        'python': sys.version,
+        'executable': sys.executable,
+        'count': args.count,
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    else:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
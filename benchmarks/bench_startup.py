@@ -0,0 +1,168 @@
+"""
+Startup latency benchmarks for gmpy_cffi.
+
+Measures, each in a fresh interpreter so nothing is already imported:
+
+- the cold ``import gmpy_cffi`` time,
+- the cost of pre-populating the object pools with ``warm_cache()``,
+  in total and for each pool,
+- the first-call (and, for comparison, second-call) time of each public
+  function.
+
+Results are written as JSON, either to stdout or to the file given with
+``--output``. Every figure is the minimum over ``--repeat`` fresh
+interpreters, in seconds.
+
+    $ python benchmarks/bench_startup.py --repeat 10 --output startup.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+
+timer = getattr(time, 'perf_counter', time.time)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+POOL_INITIALISERS = [
+    '_init_mpz_cache', '_init_mpq_cache', '_init_mpfr_cache',
+    '_init_mpc_cache']
+
+# (function name, argument expression evaluated in the gmpy_cffi namespace)
+FIRST_CALLS = [
+    ('mpz', '(12345678901234567890,)'),
+    ('mpq', '(3, 7)'),
+    ('mpfr', '(1.5,)'),
+    ('mpc', '(1.5, 2.5)'),
+    ('is_prime', '(1000003,)'),
+    ('next_prime', '(1000000,)'),
+    ('gcd', '(12, 18)'),
+    ('gcdext', '(12, 18)'),
+    ('lcm', '(12, 18)'),
+    ('invert', '(3, 7)'),
+    ('jacobi', '(3, 7)'),
+    ('legendre', '(3, 7)'),
+    ('kronecker', '(3, 7)'),
+    ('fac', '(20,)'),
+    ('bincoef', '(20, 10)'),
+    ('fib', '(100,)'),
+    ('fib2', '(100,)'),
+    ('lucas', '(100,)'),
+    ('lucas2', '(100,)'),
+    ('log', '(2.5,)'),
+    ('exp', '(2.5,)'),
+    ('sin', '(2.5,)'),
+    ('cos', '(2.5,)'),
+    ('tan', '(2.5,)'),
+    ('atan2', '(1.0, 2.0)'),
+    ('sinh_cosh', '(2.5,)'),
+    ('factorial', '(20,)'),
+    ('gamma', '(2.5,)'),
+    ('zeta', '(2.5,)'),
+    ('erf', '(0.5,)'),
+    ('jn', '(2.5, 2)'),
+    ('fma', '(1.5, 2.5, 3.5)'),
+    ('agm', '(1.5, 2.5)'),
+    ('hypot', '(1.5, 2.5)'),
+    ('const_pi', '()'),
+    ('const_log2', '()'),
+]
+
+
+def child():
+    """Run the measurements in this (fresh) interpreter."""
+    result = {}
+
+    start = timer()
+    import gmpy_cffi
+    result['import'] = timer() - start
+
+    start = timer()
+    gmpy_cffi.warm_cache()
+    result['warm_cache'] = timer() - start
+
+    from gmpy_cffi import cache
+    cache._clear_cache()
+    pools = {}
+    for name in POOL_INITIALISERS:
+        init = getattr(cache, name)
+        start = timer()
+        init()
+        pools[name] = timer() - start
+    result['pools'] = pools
+
+    namespace = vars(gmpy_cffi)
+    calls = {}
+    for name, args in FIRST_CALLS:
+        func = getattr(gmpy_cffi, name)
+        args = eval(args, namespace)
+        start = timer()
+        func(*args)
+        first = timer() - start
+        start = timer()
+        func(*args)
+        second = timer() - start
+        calls[name] = {'first': first, 'second': second}
+    result['calls'] = calls
+
+    json.dump(result, sys.stdout)
+
+
+def run_child():
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [ROOT] + [p for p in [env.get('PYTHONPATH')] if p])
+    out = subprocess.check_output(
+        [sys.executable, '-B', os.path.abspath(__file__), '--child'],
+        env=env)
+    return json.loads(out.decode('UTF-8'))
+
+
+def merge_min(acc, new):
+    """Merge `new` into `acc` keeping the minimum of every leaf."""
+    for key, value in new.items():
+        if isinstance(value, dict):
+            merge_min(acc.setdefault(key, {}), value)
+        elif key in acc:
+            acc[key] = min(acc[key], value)
+        else:
+            acc[key] = value
+    return acc
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of fresh interpreters to run')
+    parser.add_argument('--output', help='write JSON here instead of stdout')
+    parser.add_argument('--child', action='store_true',
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        child()
+        return
+
+    results = {}
+    for _ in range(args.repeat):
+        merge_min(results, run_child())
+
+    report = {
+        'python': sys.version,
+        'executable': sys.executable,
+        'repeat': args.repeat,
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    else:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
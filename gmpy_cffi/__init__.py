@@ -1,10 +1,29 @@
 from .mpz import mpz
+from .xmpz import xmpz
 from .mpq import mpq
 from .mpfr import mpfr, isinf, isnan
 from .mpc import mpc
-from .cache import get_cache, set_cache
+from .binary import to_binary, from_binary
+from .parallel import pmap
+from .vector import mpz_vector
+from .numpy_support import mpz_array_from_numpy, to_numpy
+from .context import (
+    context, get_context, set_context, local_context, RoundToNearest,
+    RoundToZero, RoundUp, RoundDown, RoundAwayZero, Default, RangeError,
+    InexactResultError, OverflowResultError, UnderflowResultError,
+    InvalidOperationError, DivisionByZeroError)
+from .cache import (
+    get_cache, set_cache, warm_cache, free_cache, cache_stats,
+    reset_cache_stats)
 from .convert import MAX_UI
 from .ntheory import is_prime, next_prime, gcd, gcdext, lcm, invert, jacobi, legendre, kronecker, fac, bincoef, fib, fib2, lucas, lucas2
+from .ntheory import batch_gcd, batch_mod
+from .ntheory import (
+    is_strong_prp, is_strong_lucas_prp, is_strong_selfridge_prp, is_bpsw_prp,
+    is_prime_many)
+from .sieve import primerange, primes
+from .factor import (
+    factor, factorint, clear_factor_cache, FactorTimeoutError)
 from .special_functions import (
     log, log2, log10, exp, exp2, exp10, cos, sin, tan, sin_cos, sec, csc, cot,
     acos, asin, atan, atan2, cosh, sinh, tanh, sinh_cosh, sech, csch, coth,
@@ -12,4 +31,4 @@ from .special_functions import (
     lgamma, digamma, zeta, erf, erfc, j0, j1, jn, y0, y1, yn, fma, fms, agm,
     hypot, ai, const_log2, const_pi, const_euler, const_catalan)
 from .version import (
-    __version__, version, mp_version, mpfr_version, mpc_version)
+    __version__, version, mp_version, mpfr_version, mpc_version, mpfr_tls)
@@ -0,0 +1,1188 @@
+"""
+Out-of-line (API mode) build script for the GMP/MPFR/MPC bindings.
+
+setup.py builds this into the ``gmpy_cffi._gmp`` extension module at
+install time; at runtime ``gmpy_cffi.interface`` only imports the
+compiled module. To build in place for development run::
+
+    $ python gmpy_cffi/_gmp_build.py
+"""
+import cffi
+
+
+ffibuilder = cffi.FFI()
+
+ffibuilder.cdef("""
+    const char * const gmp_version;
+    const int mp_bits_per_limb;
+
+    // MPZ
+    typedef struct { int _mp_alloc; int _mp_size; ...; } __mpz_struct;
+    typedef __mpz_struct *mpz_t;
+    typedef unsigned long mp_bitcnt_t;
+
+    void mpz_init (mpz_t x);
+    void mpz_clear (mpz_t x);
+    void mpz_realloc2 (mpz_t x, mp_bitcnt_t n);
+
+    void mpz_set (mpz_t rop, const mpz_t op);
+    void mpz_set_ui (mpz_t rop, unsigned long int op);
+    void mpz_set_si (mpz_t rop, signed long int op);
+    void mpz_set_d (mpz_t rop, double op);
+    int mpz_set_str (mpz_t rop, char *str, int base);
+
+    unsigned long int mpz_get_ui (mpz_t op);
+    signed long int mpz_get_si (mpz_t op);
+    double mpz_get_d (mpz_t op);
+    char * mpz_get_str (char *str, int base, mpz_t op);
+    void mpz_import (mpz_t rop, size_t count, int order, size_t size, int endian, size_t nails, const void *op);
+    void * mpz_export (void *rop, size_t *countp, int order, size_t size, int endian, size_t nails, mpz_t op);
+
+    void mpz_add (mpz_t rop, mpz_t op1, mpz_t op2);
+    void mpz_add_ui (mpz_t rop, mpz_t op1, unsigned long int op2);
+    void mpz_sub (mpz_t rop, mpz_t op1, mpz_t op2);
+    void mpz_sub_ui (mpz_t rop, mpz_t op1, unsigned long int op2);
+    void mpz_ui_sub (mpz_t rop, unsigned long int op1, mpz_t op2);
+    void mpz_mul (mpz_t rop, mpz_t op1, mpz_t op2);
+    void mpz_mul_si (mpz_t rop, mpz_t op1, long int op2);
+    void mpz_mul_ui (mpz_t rop, mpz_t op1, unsigned long int op2);
+    void mpz_submul (mpz_t rop, mpz_t op1, mpz_t op2);
+    void mpz_mul_2exp (mpz_t rop, mpz_t op1, mp_bitcnt_t op2);
+    void mpz_neg (mpz_t rop, mpz_t op);
+    void mpz_abs (mpz_t rop, mpz_t op);
+
+    void mpz_cdiv_q (mpz_t q, mpz_t n, mpz_t d);
+
+    void mpz_fdiv_q (mpz_t q, mpz_t n, mpz_t d);
+    void mpz_fdiv_q_ui (mpz_t q, mpz_t n, unsigned long int d);
+    void mpz_fdiv_r (mpz_t r, mpz_t n, mpz_t d);
+    void mpz_fdiv_r_ui (mpz_t r, mpz_t n, unsigned long int d);
+    void mpz_fdiv_qr (mpz_t q, mpz_t r, mpz_t n, mpz_t d);
+    void mpz_fdiv_qr_ui (mpz_t q, mpz_t r, mpz_t n, unsigned long int d);
+    void mpz_fdiv_q_2exp (mpz_t q, mpz_t n, mp_bitcnt_t b);
+//    int mpz_divisible_ui_p (mpz_t n, unsigned long int d);
+
+    void mpz_tdiv_q (mpz_t q, const mpz_t n, const mpz_t d);
+    void mpz_tdiv_r (mpz_t r, const mpz_t n, const mpz_t d);
+    unsigned long int mpz_tdiv_ui (const mpz_t n, unsigned long int d);
+    void mpz_divexact (mpz_t q, const mpz_t n, const mpz_t d);
+
+    void mpz_powm (mpz_t rop, mpz_t base, mpz_t exp, mpz_t mod);
+    void mpz_powm_ui (mpz_t rop, mpz_t base, unsigned long int exp, mpz_t mod);
+    void mpz_pow_ui (mpz_t rop, mpz_t base, unsigned long int exp);
+    void mpz_ui_pow_ui (mpz_t rop, unsigned long int base, unsigned long int exp);
+
+    int mpz_cmp (mpz_t op1, mpz_t op2);
+    int mpz_cmp_d (const mpz_t op1, double op2);
+    int mpz_cmp_ui (mpz_t op1, unsigned long int op2);
+    int mpz_cmpabs_ui (const mpz_t op1, unsigned long int op2);
+    int mpz_sgn (mpz_t op);
+
+    void mpz_and (mpz_t rop, mpz_t op1, mpz_t op2);
+    void mpz_ior (mpz_t rop, mpz_t op1, mpz_t op2);
+    void mpz_xor (mpz_t rop, mpz_t op1, mpz_t op2);
+    int mpz_tstbit (mpz_t op, mp_bitcnt_t bit_index);
+    void mpz_com (mpz_t rop, mpz_t op);
+
+    int mpz_fits_ulong_p (mpz_t op);
+    int mpz_fits_slong_p (mpz_t op);
+    size_t mpz_sizeinbase (mpz_t op, int base);
+
+//    void mpz_bin_ui (mpz_t rop, mpz_t n, unsigned long int k);
+//    void mpz_bin_uiui (mpz_t rop, unsigned long int n, unsigned long int k);
+
+    // Number Theoretic Functions
+    int mpz_probab_prime_p (const mpz_t n, int reps);
+    void mpz_nextprime (mpz_t rop, const mpz_t op);
+    void mpz_gcd (mpz_t rop, const mpz_t op1, const mpz_t op2);
+    // unsigned long int mpz_gcd_ui (mpz_t rop, const mpz_t op1, unsigned long int op2);
+    void mpz_gcdext (mpz_t g, mpz_t s, mpz_t t, const mpz_t a, const mpz_t b);
+    void mpz_lcm (mpz_t rop, const mpz_t op1, const mpz_t op2);
+    // void mpz_lcm_ui (mpz_t rop, const mpz_t op1, unsigned long op2);
+    int mpz_invert (mpz_t rop, const mpz_t op1, const mpz_t op2);
+    int mpz_jacobi (const mpz_t a, const mpz_t b);
+    int mpz_legendre (const mpz_t a, const mpz_t p);
+    int mpz_kronecker (const mpz_t a, const mpz_t b);
+    mp_bitcnt_t mpz_remove (mpz_t rop, const mpz_t op, const mpz_t f);
+    int mpz_perfect_power_p (const mpz_t op);
+    int mpz_perfect_square_p (const mpz_t op);
+    int mpz_root (mpz_t rop, const mpz_t op, unsigned long int n);
+    // int mpz_kronecker_si (const mpz_t a, long b);
+    // int mpz_kronecker_ui (const mpz_t a, unsigned long b);
+    int mpz_si_kronecker (long a, const mpz_t b);
+    // int mpz_ui_kronecker (unsigned long a, const mpz_t b);
+    void mpz_fac_ui (mpz_t rop, unsigned long int n);
+    // void mpz_2fac_ui (mpz_t rop, unsigned long int n);
+    // void mpz_mfac_uiui (mpz_t rop, unsigned long int n, unsigned long int m);
+    void mpz_primorial_ui (mpz_t rop, unsigned long int n);
+    void mpz_bin_ui (mpz_t rop, const mpz_t n, unsigned long int k);
+    void mpz_bin_uiui (mpz_t rop, unsigned long int n, unsigned long int k);
+    void mpz_fib_ui (mpz_t fn, unsigned long int n);
+    void mpz_fib2_ui (mpz_t fn, mpz_t fnsub1, unsigned long int n);
+    void mpz_lucnum_ui (mpz_t ln, unsigned long int n);
+    void mpz_lucnum2_ui (mpz_t ln, mpz_t lnsub1, unsigned long int n);
+
+    // MPQ
+    typedef struct { ...; } __mpq_struct;
+    typedef __mpq_struct *mpq_t;
+
+    void mpq_init (mpq_t x);
+    void mpq_clear (mpq_t x);
+
+    void mpq_canonicalize (mpq_t op);
+
+    void mpq_set (mpq_t rop, const mpq_t op);
+    void mpq_set_z (mpq_t rop, const mpz_t op);
+    void mpq_set_ui (mpq_t rop, unsigned long int op1, unsigned long int op2);
+    void mpq_set_si (mpq_t rop, signed long int op1, unsigned long int op2);
+    int mpq_set_str (mpq_t rop, const char *str, int base);
+
+    void mpq_set_d (mpq_t rop, double op);
+    double mpq_get_d (mpq_t op);
+
+    mpz_t mpq_numref (const mpq_t op);
+    mpz_t mpq_denref (const mpq_t op);
+    void mpq_get_num (mpz_t numerator, const mpq_t rational);
+    void mpq_get_den (mpz_t denominator, const mpq_t rational);
+    void mpq_set_num (mpq_t rational, const mpz_t numerator);
+    void mpq_set_den (mpq_t rational, const mpz_t denominator);
+
+    char * mpq_get_str (char *str, int base, const mpq_t op);
+
+    void mpq_add (mpq_t sum, const mpq_t addend1, const mpq_t addend2);
+    void mpq_sub (mpq_t difference, const mpq_t minuend, const mpq_t subtrahend);
+    void mpq_mul (mpq_t product, const mpq_t multiplier, const mpq_t multiplicand);
+    void mpq_mul_2exp (mpq_t rop, const mpq_t op1, mp_bitcnt_t op2);
+    void mpq_div (mpq_t quotient, const mpq_t dividend, const mpq_t divisor);
+    void mpq_div_2exp (mpq_t rop, const mpq_t op1, mp_bitcnt_t op2);
+    void mpq_neg (mpq_t negated_operand, const mpq_t operand);
+    void mpq_abs (mpq_t rop, const mpq_t op);
+    void mpq_inv (mpq_t inverted_number, const mpq_t number);
+
+    int mpq_cmp (const mpq_t op1, const mpq_t op2);
+    int mpq_cmp_ui (const mpq_t op1, unsigned long int num2, unsigned long int den2);
+    int mpq_cmp_si (const mpq_t op1, long int num2, unsigned long int den2);
+    int mpq_sgn (const mpq_t op);
+    int mpq_equal (const mpq_t op1, const mpq_t op2);
+
+    // MPFR
+    const char * mpfr_get_version (void);
+    int mpfr_buildopt_tls_p (void);
+
+    typedef struct { ...; } __mpfr_struct;
+    typedef __mpfr_struct *mpfr_t;
+
+    // FIXME - actual type depends on_MPFR_PREC_FORMAT
+    typedef long int mpfr_prec_t;
+    // FIXME - actual type depends on _MPFR_EXP_FORMAT
+    typedef long int mpfr_exp_t;
+
+    typedef enum {
+      MPFR_RNDN=0,  /* round to nearest, with ties to even */
+      MPFR_RNDZ,    /* round toward zero */
+      MPFR_RNDU,    /* round toward +Inf */
+      MPFR_RNDD,    /* round toward -Inf */
+      MPFR_RNDA,    /* round away from zero */
+      MPFR_RNDF,    /* faithful rounding (not implemented yet) */
+      MPFR_RNDNA=-1 /* round to nearest, with ties away from zero (mpfr_round) */
+    } mpfr_rnd_t;
+
+    void mpfr_init (mpfr_t x);
+    void mpfr_init2 (mpfr_t x, mpfr_prec_t prec);
+    void mpfr_clear (mpfr_t x);
+    void mpfr_set_default_prec (mpfr_prec_t prec);
+    mpfr_prec_t mpfr_get_default_prec (void);
+
+    void mpfr_set_prec (mpfr_t x, mpfr_prec_t prec);
+    mpfr_prec_t mpfr_get_prec (mpfr_t x);
+    int mpfr_sprintf (char *buf, const char *template, ...);
+    int mpfr_printf (const char *template, ...);
+    int mpfr_asprintf (char **str, const char *template, ...);
+
+    int mpfr_set (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_set_ui (mpfr_t rop, unsigned long int op, mpfr_rnd_t rnd);
+    int mpfr_set_si (mpfr_t rop, long int op, mpfr_rnd_t rnd);
+    // int mpfr_set_uj (mpfr_t rop, uintmax_t op, mpfr_rnd_t rnd);
+    // int mpfr_set_sj (mpfr_t rop, intmax_t op, mpfr_rnd_t rnd);
+    // int mpfr_set_flt (mpfr_t rop, float op, mpfr_rnd_t rnd);
+    int mpfr_set_d (mpfr_t rop, double op, mpfr_rnd_t rnd);
+    // int mpfr_set_ld (mpfr_t rop, long double op, mpfr_rnd_t rnd);
+    // int mpfr_set_decimal64 (mpfr_t rop, _Decimal64 op, mpfr_rnd_t rnd);
+    int mpfr_set_z (mpfr_t rop, mpz_t op, mpfr_rnd_t rnd);
+    int mpfr_set_q (mpfr_t rop, mpq_t op, mpfr_rnd_t rnd);
+    // int mpfr_set_f (mpfr_t rop, mpf_t op, mpfr_rnd_t rnd);
+    // int mpfr_set_ui_2exp (mpfr_t rop, unsigned long int op, mpfr_exp_t e, mpfr_rnd_t rnd);
+    // int mpfr_set_si_2exp (mpfr_t rop, long int op, mpfr_exp_t e, mpfr_rnd_t rnd);
+    // int mpfr_set_uj_2exp (mpfr_t rop, uintmax_t op, intmax_t e, mpfr_rnd_t rnd);
+    // int mpfr_set_sj_2exp (mpfr_t rop, intmax_t op, intmax_t e, mpfr_rnd_t rnd);
+    int mpfr_set_z_2exp (mpfr_t rop, mpz_t op, mpfr_exp_t e, mpfr_rnd_t rnd);
+    int mpfr_set_str (mpfr_t rop, const char *s, int base, mpfr_rnd_t rnd);
+    // int mpfr_strtofr (mpfr_t rop, const char *nptr, char **endptr, int base, mpfr_rnd_t rnd);
+    void mpfr_set_nan (mpfr_t x);
+    void mpfr_set_inf (mpfr_t x, int sign);
+    void mpfr_set_zero (mpfr_t x, int sign);
+    // void mpfr_swap (mpfr_t x, mpfr_t y);
+
+    // float mpfr_get_flt (mpfr_t op, mpfr_rnd_t rnd);
+    double mpfr_get_d (mpfr_t op, mpfr_rnd_t rnd);
+    // long double mpfr_get_ld (mpfr_t op, mpfr_rnd_t rnd);
+    // _Decimal64 mpfr_get_decimal64 (mpfr_t op, mpfr_rnd_t rnd);
+    long mpfr_get_si (mpfr_t op, mpfr_rnd_t rnd);
+    unsigned long mpfr_get_ui (mpfr_t op, mpfr_rnd_t rnd);
+    // intmax_t mpfr_get_sj (mpfr_t op, mpfr_rnd_t rnd);
+    // uintmax_t mpfr_get_uj (mpfr_t op, mpfr_rnd_t rnd);
+    // double mpfr_get_d_2exp (long *exp, mpfr_t op, mpfr_rnd_t rnd);
+    // long double mpfr_get_ld_2exp (long *exp, mpfr_t op, mpfr_rnd_t rnd);
+    // int mpfr_frexp (mpfr_exp_t *exp, mpfr_t y, mpfr_t x, mpfr_rnd_t rnd);
+    mpfr_exp_t mpfr_get_z_2exp (mpz_t rop, mpfr_t op);
+    int mpfr_get_z (mpz_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    // int mpfr_get_f (mpf_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    char * mpfr_get_str (char *str, mpfr_exp_t *expptr, int b, size_t n, mpfr_t op, mpfr_rnd_t rnd);
+    void mpfr_free_str (char *str);
+    int mpfr_fits_ulong_p (mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_fits_slong_p (mpfr_t op, mpfr_rnd_t rnd);
+    // int mpfr_fits_uint_p (mpfr_t op, mpfr_rnd_t rnd);
+    // int mpfr_fits_sint_p (mpfr_t op, mpfr_rnd_t rnd);
+    // int mpfr_fits_ushort_p (mpfr_t op, mpfr_rnd_t rnd);
+    // int mpfr_fits_sshort_p (mpfr_t op, mpfr_rnd_t rnd);
+    // int mpfr_fits_uintmax_p (mpfr_t op, mpfr_rnd_t rnd);
+    // int mpfr_fits_intmax_p (mpfr_t op, mpfr_rnd_t rnd);
+
+    /* Comparison functions */
+    int mpfr_cmp (mpfr_t op1, mpfr_t op2);
+    int mpfr_cmp_ui (mpfr_t op1, unsigned long int op2);
+    int mpfr_cmp_si (mpfr_t op1, long int op2);
+    int mpfr_cmp_d (mpfr_t op1, double op2);
+    // int mpfr_cmp_ld (mpfr_t op1, long double op2);
+    int mpfr_cmp_z (mpfr_t op1, mpz_t op2);
+    int mpfr_cmp_q (mpfr_t op1, mpq_t op2);
+    // int mpfr_cmp_f (mpfr_t op1, mpf_t op2);
+    // int mpfr_cmp_ui_2exp (mpfr_t op1, unsigned long int op2, mpfr_exp_t e);
+    // int mpfr_cmp_si_2exp (mpfr_t op1, long int op2, mpfr_exp_t e);
+    // int mpfr_cmpabs (mpfr_t op1, mpfr_t op2);
+    int mpfr_nan_p (mpfr_t op);
+    int mpfr_inf_p (mpfr_t op);
+    int mpfr_number_p (mpfr_t op);
+    int mpfr_zero_p (mpfr_t op);
+    int mpfr_regular_p (mpfr_t op);
+    // int mpfr_sgn (mpfr_t op);
+    // int mpfr_greater_p (mpfr_t op1, mpfr_t op2);
+    // int mpfr_greaterequal_p (mpfr_t op1, mpfr_t op2);
+    // int mpfr_less_p (mpfr_t op1, mpfr_t op2);
+    // int mpfr_lessequal_p (mpfr_t op1, mpfr_t op2);
+    // int mpfr_equal_p (mpfr_t op1, mpfr_t op2);
+    // int mpfr_unordered_p (mpfr_t op1, mpfr_t op2);
+    // int mpfr_lessgreater_p (mpfr_t op1, mpfr_t op2);
+
+    int mpfr_signbit (mpfr_t op);
+
+    // void mpfr_set_default_rounding_mode (mpfr_rnd_t rnd);
+    // mpfr_rnd_t mpfr_get_default_rounding_mode (void);
+    int mpfr_prec_round (mpfr_t x, mpfr_prec_t prec, mpfr_rnd_t rnd);
+    // mpfr_can_round (mpfr_t b, mpfr_exp_t err, mpfr_rnd_t rnd1, mpfr_rnd_t rnd2, mpfr_prec_t prec);
+    mpfr_prec_t mpfr_min_prec (mpfr_t x);
+    // char * mpfr_print_rnd_mode (mpfr_rnd_t rnd);
+
+    #define MPFR_PREC_MIN ...
+    #define MPFR_PREC_MAX ...
+
+    /* Math functions */
+    int mpfr_add (mpfr_t rop, mpfr_t op1, mpfr_t op2, mpfr_rnd_t rnd);
+    int mpfr_add_ui (mpfr_t rop, mpfr_t op1, unsigned long int op2, mpfr_rnd_t rnd);
+    int mpfr_add_si (mpfr_t rop, mpfr_t op1, long int op2, mpfr_rnd_t rnd);
+    int mpfr_add_d (mpfr_t rop, mpfr_t op1, double op2, mpfr_rnd_t rnd);
+    int mpfr_add_z (mpfr_t rop, mpfr_t op1, mpz_t op2, mpfr_rnd_t rnd);
+    int mpfr_add_q (mpfr_t rop, mpfr_t op1, mpq_t op2, mpfr_rnd_t rnd);
+    int mpfr_sub (mpfr_t rop, mpfr_t op1, mpfr_t op2, mpfr_rnd_t rnd);
+    int mpfr_sub_ui (mpfr_t rop, mpfr_t op1, unsigned long int op2, mpfr_rnd_t rnd);
+    int mpfr_sub_si (mpfr_t rop, mpfr_t op1, long int op2, mpfr_rnd_t rnd);
+    int mpfr_sub_d (mpfr_t rop, mpfr_t op1, double op2, mpfr_rnd_t rnd);
+    int mpfr_sub_z (mpfr_t rop, mpfr_t op1, mpz_t op2, mpfr_rnd_t rnd);
+    int mpfr_sub_q (mpfr_t rop, mpfr_t op1, mpq_t op2, mpfr_rnd_t rnd);
+    int mpfr_ui_sub(mpfr_t rop, unsigned long int op1, mpfr_t op2, mpfr_rnd_t rnd);
+    int mpfr_si_sub(mpfr_t rop, long int op1, mpfr_t op2, mpfr_rnd_t rnd);
+    int mpfr_d_sub (mpfr_t rop, double op1, mpfr_t op2, mpfr_rnd_t rnd);
+    int mpfr_z_sub (mpfr_t rop, mpz_t op1, mpfr_t op2, mpfr_rnd_t rnd);
+    int mpfr_neg (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_abs (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_mul (mpfr_t rop, mpfr_t op1, mpfr_t op2, mpfr_rnd_t rnd);
+    int mpfr_mul_ui (mpfr_t rop, mpfr_t op1, unsigned long int op2, mpfr_rnd_t rnd);
+    int mpfr_mul_si (mpfr_t rop, mpfr_t op1, long int op2, mpfr_rnd_t rnd);
+    int mpfr_mul_d (mpfr_t rop, mpfr_t op1, double op2, mpfr_rnd_t rnd);
+    int mpfr_mul_z (mpfr_t rop, mpfr_t op1, mpz_t op2, mpfr_rnd_t rnd);
+    int mpfr_mul_q (mpfr_t rop, mpfr_t op1, mpq_t op2, mpfr_rnd_t rnd);
+    int mpfr_div (mpfr_t rop, mpfr_t op1, mpfr_t op2, mpfr_rnd_t rnd);
+    int mpfr_div_ui (mpfr_t rop, mpfr_t op1, unsigned long int op2, mpfr_rnd_t rnd);
+    int mpfr_div_si (mpfr_t rop, mpfr_t op1, long int op2, mpfr_rnd_t rnd);
+    int mpfr_div_d (mpfr_t rop, mpfr_t op1, double op2, mpfr_rnd_t rnd);
+    int mpfr_div_z (mpfr_t rop, mpfr_t op1, mpz_t op2, mpfr_rnd_t rnd);
+    int mpfr_div_q (mpfr_t rop, mpfr_t op1, mpq_t op2, mpfr_rnd_t rnd);
+    int mpfr_ui_div (mpfr_t rop, unsigned long int op2, mpfr_t op1, mpfr_rnd_t rnd);
+    int mpfr_si_div (mpfr_t rop, long int op2, mpfr_t op1, mpfr_rnd_t rnd);
+    int mpfr_d_div (mpfr_t rop, double op2, mpfr_t op1, mpfr_rnd_t rnd);
+    int mpfr_pow (mpfr_t rop, mpfr_t op1, mpfr_t op2, mpfr_rnd_t rnd);
+    int mpfr_pow_ui (mpfr_t rop, mpfr_t op1, unsigned long int op2, mpfr_rnd_t rnd);
+    int mpfr_pow_si (mpfr_t rop, mpfr_t op1, long int op2, mpfr_rnd_t rnd);
+    int mpfr_pow_z (mpfr_t rop, mpfr_t op1, mpz_t op2, mpfr_rnd_t rnd);
+
+    int mpfr_floor(mpfr_t rop, mpfr_t op);
+    int mpfr_ceil(mpfr_t rop, mpfr_t op);
+    int mpfr_trunc(mpfr_t rop, mpfr_t op);
+    // int mpfr_round(mpfr_t rop, mpfr_t op);
+
+    /* Special functions */
+    int mpfr_log (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_log2 (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_log10 (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_exp (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_exp2 (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_exp10 (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_cos (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_sin (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_tan (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_sin_cos (mpfr_t sop, mpfr_t cop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_sec (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_csc (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_cot (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_acos (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_asin (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_atan (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_atan2 (mpfr_t rop, mpfr_t y, mpfr_t x, mpfr_rnd_t rnd);
+    int mpfr_cosh (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_sinh (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_tanh (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_sinh_cosh (mpfr_t sop, mpfr_t cop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_sech (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_csch (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_coth (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_acosh (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_asinh (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_atanh (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_fac_ui (mpfr_t rop, unsigned long int op, mpfr_rnd_t rnd);
+    int mpfr_log1p (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_expm1 (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_eint (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_li2 (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_gamma (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_lngamma (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_lgamma (mpfr_t rop, int *signp, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_digamma (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_zeta (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_zeta_ui (mpfr_t rop, unsigned long op, mpfr_rnd_t rnd);
+    int mpfr_erf (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_erfc (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_j0 (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_j1 (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_jn (mpfr_t rop, long n, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_y0 (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_y1 (mpfr_t rop, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_yn (mpfr_t rop, long n, mpfr_t op, mpfr_rnd_t rnd);
+    int mpfr_fma (mpfr_t rop, mpfr_t op1, mpfr_t op2, mpfr_t op3, mpfr_rnd_t rnd);
+    int mpfr_fms (mpfr_t rop, mpfr_t op1, mpfr_t op2, mpfr_t op3, mpfr_rnd_t rnd);
+    int mpfr_agm (mpfr_t rop, mpfr_t op1, mpfr_t op2, mpfr_rnd_t rnd);
+    int mpfr_hypot (mpfr_t rop, mpfr_t x, mpfr_t y, mpfr_rnd_t rnd);
+    int mpfr_ai (mpfr_t rop, mpfr_t x, mpfr_rnd_t rnd);
+    int mpfr_const_log2 (mpfr_t rop, mpfr_rnd_t rnd);
+    int mpfr_const_pi (mpfr_t rop, mpfr_rnd_t rnd);
+    int mpfr_const_euler (mpfr_t rop, mpfr_rnd_t rnd);
+    int mpfr_const_catalan (mpfr_t rop, mpfr_rnd_t rnd);
+    void mpfr_free_cache (void);
+    // int mpfr_sum (mpfr_t rop, mpfr_ptr const tab[], unsigned long int n, mpfr_rnd_t rnd);
+
+    /* Exception related functions */
+    void mpfr_clear_flags (void);
+    int mpfr_underflow_p (void);
+    int mpfr_overflow_p (void);
+    int mpfr_divby0_p (void);
+    int mpfr_nanflag_p (void);
+    int mpfr_inexflag_p (void);
+    int mpfr_erangeflag_p (void);
+
+    // MPC
+    const char * mpc_get_version (void);
+
+    typedef struct { ...; } __mpc_struct;
+    typedef __mpc_struct *mpc_t;
+
+    typedef int mpc_rnd_t;
+
+    #define MPC_RNDNN ...
+    #define MPC_RNDNZ ...
+    #define MPC_RNDNU ...
+    #define MPC_RNDND ...
+    #define MPC_RNDZN ...
+    #define MPC_RNDZZ ...
+    #define MPC_RNDZU ...
+    #define MPC_RNDZD ...
+    #define MPC_RNDUN ...
+    #define MPC_RNDUZ ...
+    #define MPC_RNDUU ...
+    #define MPC_RNDUD ...
+    #define MPC_RNDDN ...
+    #define MPC_RNDDZ ...
+    #define MPC_RNDDU ...
+    #define MPC_RNDDD ...
+
+    void mpc_init2 (mpc_t z, mpfr_prec_t prec);
+    void mpc_init3 (mpc_t z, mpfr_prec_t prec_r, mpfr_prec_t prec_i);
+    void mpc_clear (mpc_t z);
+    void mpc_set_prec (mpc_t x, mpfr_prec_t prec);
+    // mpfr_prec_t mpc_get_prec (mpc_t x);
+    void mpc_get_prec2 (mpfr_prec_t* pr, mpfr_prec_t* pi, mpc_t x);
+
+    int mpc_set (mpc_t rop, mpc_t op, mpc_rnd_t rnd);
+    int mpc_set_ui (mpc_t rop, unsigned long int op, mpc_rnd_t rnd);
+    int mpc_set_si (mpc_t rop, long int op, mpc_rnd_t rnd);
+    // int mpc_set_uj (mpc_t rop, uintmax_t op, mpc_rnd_t rnd);
+    // int mpc_set_sj (mpc_t rop, intmax_t op, mpc_rnd_t rnd);
+    int mpc_set_d (mpc_t rop, double op, mpc_rnd_t rnd);
+    // int mpc_set_ld (mpc_t rop, long double op, mpc_rnd_t rnd);
+    // int mpc_set_dc (mpc_t rop, double _Complex op, mpc_rnd_t rnd);
+    // int mpc_set_ldc (mpc_t rop, long double _Complex op, mpc_rnd_t rnd);
+    int mpc_set_z (mpc_t rop, mpz_t op, mpc_rnd_t rnd);
+    int mpc_set_q (mpc_t rop, mpq_t op, mpc_rnd_t rnd);
+    // int mpc_set_f (mpc_t rop, mpf_t op, mpc_rnd_t rnd);
+    int mpc_set_fr (mpc_t rop, mpfr_t op, mpc_rnd_t rnd);
+
+    // int mpc_set_ui_ui (mpc_t rop, unsigned long int op1, unsigned long int op2, mpc_rnd_t rnd);
+    // int mpc_set_si_si (mpc_t rop, long int op1, long int op2, mpc_rnd_t rnd);
+    // int mpc_set_uj_uj (mpc_t rop, uintmax_t op1, uintmax_t op2, mpc_rnd_t rnd);
+    // int mpc_set_sj_sj (mpc_t rop, intmax_t op1, intmax_t op2, mpc_rnd_t rnd)
+    int mpc_set_d_d (mpc_t rop, double op1, double op2, mpc_rnd_t rnd);
+    // int mpc_set_ld_ld (mpc_t rop, long double op1, long double op2, mpc_rnd_t rnd);
+    // int mpc_set_z_z (mpc_t rop, mpz_t op1, mpz_t op2, mpc_rnd_t rnd);
+    // int mpc_set_q_q (mpc_t rop, mpq_t op1, mpq_t op2, mpc_rnd_t rnd);
+    // int mpc_set_f_f (mpc_t rop, mpf_t op1, mpf_t op2, mpc_rnd_t rnd);
+    // int mpc_set_fr_fr (mpc_t rop, mpfr_t op1, mpfr_t op2, mpc_rnd_t rnd);
+    // void mpc_set_nan (mpc_t rop);
+    // void mpc_swap (mpc_t op1, mpc_t op2);
+
+    // double _Complex mpc_get_dc (mpc_t op, mpc_rnd_t rnd);
+    // long double _Complex mpc_get_ldc (mpc_t op, mpc_rnd_t rnd);
+
+    // int mpc_strtoc (mpc_t rop, const char *nptr, char **endptr, int base, mpc_rnd_t rnd);
+    int mpc_set_str (mpc_t rop, const char *s, int base, mpc_rnd_t rnd);
+    char * mpc_get_str (int b, size_t n, mpc_t op, mpc_rnd_t rnd);
+    void mpc_free_str (char *str);
+    // int mpc_inp_str (mpc_t rop, FILE *stream, size_t *read, int base, mpc_rnd_t rnd);
+    // size_t mpc_out_str (FILE *stream, int base, size_t n_digits, mpc_t op, mpc_rnd_t rnd);
+
+    int mpc_real (mpfr_t rop, mpc_t op, mpfr_rnd_t rnd);
+    int mpc_imag (mpfr_t rop, mpc_t op, mpfr_rnd_t rnd);
+    mpfr_t mpc_realref (mpc_t op);
+    mpfr_t mpc_imagref (mpc_t op);
+
+    int mpc_cmp (mpc_t op1, mpc_t op2);
+    // int mpc_cmp_si_si (mpc_t op1, long int op2r , long int op2i);
+    // int mpc_cmp_si (mpc_t op1 , long int op2);
+
+    int mpc_add (mpc_t rop, mpc_t op1, mpc_t op2 , mpc_rnd_t rnd);
+    int mpc_add_ui (mpc_t rop, mpc_t op1, unsigned long int op2, mpc_rnd_t rnd);
+    int mpc_add_fr (mpc_t rop, mpc_t op1, mpfr_t op2, mpc_rnd_t rnd);
+    int mpc_sub (mpc_t rop , mpc_t op1 , mpc_t op2 , mpc_rnd_t rnd);
+    int mpc_sub_fr (mpc_t rop , mpc_t op1 , mpfr_t op2 , mpc_rnd_t rnd);
+    int mpc_fr_sub (mpc_t rop , mpfr_t op1 , mpc_t op2 , mpc_rnd_t rnd);
+    int mpc_sub_ui (mpc_t rop , mpc_t op1 , unsigned long int op2 , mpc_rnd_t rnd);
+    int mpc_ui_sub (mpc_t rop , unsigned long int op1 , mpc_t op2 , mpc_rnd_t rnd);
+    int mpc_mul (mpc_t rop, mpc_t op1, mpc_t op2, mpc_rnd_t rnd);
+    int mpc_mul_ui (mpc_t rop, mpc_t op1, unsigned long int op2, mpc_rnd_t rnd);
+    int mpc_mul_si (mpc_t rop, mpc_t op1, long int op2, mpc_rnd_t rnd);
+    int mpc_mul_fr (mpc_t rop, mpc_t op1, mpfr_t op2, mpc_rnd_t rnd);
+
+    int mpc_div (mpc_t rop, mpc_t op1, mpc_t op2, mpc_rnd_t rnd);
+    int mpc_div_ui (mpc_t rop, mpc_t op1, unsigned long int op2, mpc_rnd_t rnd);
+    int mpc_div_fr (mpc_t rop, mpc_t op1, mpfr_t op2, mpc_rnd_t rnd);
+    int mpc_ui_div (mpc_t rop, unsigned long int op1, mpc_t op2, mpc_rnd_t rnd);
+    int mpc_fr_div (mpc_t rop, mpfr_t op1, mpc_t op2, mpc_rnd_t rnd);
+
+    int mpc_pow (mpc_t rop , mpc_t op1 , mpc_t op2 , mpc_rnd_t rnd);
+    int mpc_pow_d (mpc_t rop , mpc_t op1 , double op2 , mpc_rnd_t rnd);
+    int mpc_pow_ld (mpc_t rop , mpc_t op1 , long double op2 , mpc_rnd_t rnd);
+    int mpc_pow_si (mpc_t rop , mpc_t op1 , long op2 , mpc_rnd_t rnd);
+    int mpc_pow_ui (mpc_t rop , mpc_t op1 , unsigned long op2 , mpc_rnd_t rnd);
+    int mpc_pow_z (mpc_t rop , mpc_t op1 , mpz_t op2 , mpc_rnd_t rnd);
+    int mpc_pow_fr (mpc_t rop , mpc_t op1 , mpfr_t op2 , mpc_rnd_t rnd);
+    int mpc_abs (mpfr_t rop , mpc_t op , mpfr_rnd_t rnd);
+    int mpc_neg (mpc_t rop , mpc_t op , mpc_rnd_t rnd);
+
+    int mpc_fma (mpc_t rop, mpc_t op1, mpc_t op2, mpc_t op3, mpc_rnd_t rnd);
+    int mpc_exp (mpc_t rop, mpc_t op, mpc_rnd_t rnd);
+    int mpc_log (mpc_t rop, mpc_t op, mpc_rnd_t rnd);
+    // Requires mpc >= 1.0.1
+    // int mpc_log10 (mpc_t rop, mpc_t op, mpc_rnd_t rnd);
+    int mpc_sin (mpc_t rop, mpc_t op, mpc_rnd_t rnd);
+    int mpc_cos (mpc_t rop, mpc_t op, mpc_rnd_t rnd);
+    int mpc_sin_cos (mpc_t rop_sin, mpc_t rop_cos, mpc_t op, mpc_rnd_t rnd_sin, mpc_rnd_t rnd_cos);
+    int mpc_tan (mpc_t rop, mpc_t op, mpc_rnd_t rnd);
+
+    int mpc_sinh (mpc_t rop, mpc_t op, mpc_rnd_t rnd);
+    int mpc_cosh (mpc_t rop, mpc_t op, mpc_rnd_t rnd);
+    int mpc_tanh (mpc_t rop, mpc_t op, mpc_rnd_t rnd);
+    int mpc_asin (mpc_t rop, mpc_t op, mpc_rnd_t rnd);
+    int mpc_acos (mpc_t rop, mpc_t op, mpc_rnd_t rnd);
+    int mpc_atan (mpc_t rop, mpc_t op, mpc_rnd_t rnd);
+    int mpc_asinh (mpc_t rop, mpc_t op, mpc_rnd_t rnd);
+    int mpc_acosh (mpc_t rop, mpc_t op, mpc_rnd_t rnd);
+    int mpc_atanh (mpc_t rop, mpc_t op, mpc_rnd_t rnd);
+
+    // Loops over arrays of mpz_t, see _vector_source below
+    #define GMPY_VEC_ADD ...
+    #define GMPY_VEC_SUB ...
+    #define GMPY_VEC_MUL ...
+    #define GMPY_VEC_FLOORDIV ...
+    #define GMPY_VEC_MOD ...
+    #define GMPY_VEC_POW ...
+    #define GMPY_VEC_LT ...
+    #define GMPY_VEC_LE ...
+    #define GMPY_VEC_EQ ...
+    #define GMPY_VEC_NE ...
+    #define GMPY_VEC_GT ...
+    #define GMPY_VEC_GE ...
+
+    __mpz_struct *gmpy_vec_new (size_t n);
+    void gmpy_vec_free (__mpz_struct *v, size_t n);
+    void gmpy_vec_set (__mpz_struct *r, const __mpz_struct *a, size_t n);
+    int gmpy_vec_binop (int op, __mpz_struct *r, const __mpz_struct *a, size_t astep, const __mpz_struct *b, size_t bstep, size_t n);
+    int gmpy_vec_powm (__mpz_struct *r, const __mpz_struct *a, size_t astep, const __mpz_struct *e, size_t estep, const __mpz_struct *m, size_t mstep, size_t n);
+    void gmpy_vec_cmp (int op, unsigned char *r, const __mpz_struct *a, size_t astep, const __mpz_struct *b, size_t bstep, size_t n);
+    void gmpy_vec_sum (mpz_t r, const __mpz_struct *a, size_t n);
+    void gmpy_vec_prod (mpz_t r, const __mpz_struct *a, size_t n);
+    void gmpy_vec_dot (mpz_t r, const __mpz_struct *a, const __mpz_struct *b, size_t n);
+
+    // Bulk conversions, see _convert_source below
+    void gmpy_vec_from_int64 (__mpz_struct *r, const int64_t *a, size_t n);
+    void gmpy_vec_from_uint64 (__mpz_struct *r, const uint64_t *a, size_t n);
+    void gmpy_vec_from_double (__mpz_struct *r, const double *a, size_t n);
+    void gmpy_vec_ptrs (__mpz_struct **r, __mpz_struct *a, size_t n);
+    int gmpy_mpz_get_int64_array (int64_t *r, __mpz_struct **a, size_t n);
+    void gmpy_mpz_get_d_array (double *r, __mpz_struct **a, size_t n);
+    void gmpy_mpq_get_d_array (double *r, __mpq_struct **a, size_t n);
+    void gmpy_mpfr_get_d_array (double *r, __mpfr_struct **a, size_t n, mpfr_rnd_t rnd);
+
+    // Segmented sieve, see _sieve_source below
+    size_t gmpy_sieve_segment (uint64_t *out, uint64_t lo, uint64_t hi, const uint32_t *primes, size_t nprimes, unsigned char *bits);
+
+    // Probable prime tests, see _prp_source below
+    int gmpy_is_prime_u64 (uint64_t n);
+    int gmpy_strong_prp (const mpz_t n, const mpz_t a);
+    int gmpy_strong_lucas_prp (const mpz_t n, long p, long q);
+    int gmpy_prime_many (unsigned char *r, __mpz_struct **a, size_t n, const mpz_t primorial, unsigned long bound, int reps);
+""")
+
+# Elementwise loops for gmpy_cffi.vector.mpz_vector. Operands are arrays
+# of n mpz_t; an operand with step 0 is a scalar broadcast over the
+# array. The int functions return 0 on success, 1 for a zero divisor or
+# modulus, 2 for a negative exponent and 3 for an exponent too large for
+# an unsigned long, having checked every element before writing any.
+_vector_source = """
+    #include <stdint.h>
+    #include <stdlib.h>
+
+    #define GMPY_VEC_ADD 0
+    #define GMPY_VEC_SUB 1
+    #define GMPY_VEC_MUL 2
+    #define GMPY_VEC_FLOORDIV 3
+    #define GMPY_VEC_MOD 4
+    #define GMPY_VEC_POW 5
+
+    #define GMPY_VEC_LT 0
+    #define GMPY_VEC_LE 1
+    #define GMPY_VEC_EQ 2
+    #define GMPY_VEC_NE 3
+    #define GMPY_VEC_GT 4
+    #define GMPY_VEC_GE 5
+
+    static __mpz_struct *gmpy_vec_new(size_t n)
+    {
+        size_t i;
+        __mpz_struct *v;
+
+        if (n > SIZE_MAX / sizeof(__mpz_struct))
+            return NULL;
+        v = malloc((n ? n : 1) * sizeof(__mpz_struct));
+        if (v != NULL)
+            for (i = 0; i < n; i++)
+                mpz_init(v + i);
+        return v;
+    }
+
+    static void gmpy_vec_free(__mpz_struct *v, size_t n)
+    {
+        size_t i;
+        for (i = 0; i < n; i++)
+            mpz_clear(v + i);
+        free(v);
+    }
+
+    static void gmpy_vec_set(__mpz_struct *r, const __mpz_struct *a,
+                             size_t n)
+    {
+        size_t i;
+        for (i = 0; i < n; i++)
+            mpz_set(r + i, a + i);
+    }
+
+    static int gmpy_vec_binop(int op, __mpz_struct *r,
+                              const __mpz_struct *a, size_t astep,
+                              const __mpz_struct *b, size_t bstep,
+                              size_t n)
+    {
+        size_t i;
+        const __mpz_struct *x, *y;
+
+        for (i = 0; i < n; i++) {
+            y = b + i * bstep;
+            if ((op == GMPY_VEC_FLOORDIV || op == GMPY_VEC_MOD) &&
+                    mpz_sgn(y) == 0)
+                return 1;
+            if (op == GMPY_VEC_POW && mpz_sgn(y) < 0)
+                return 2;
+            if (op == GMPY_VEC_POW && !mpz_fits_ulong_p(y))
+                return 3;
+        }
+        for (i = 0; i < n; i++) {
+            x = a + i * astep;
+            y = b + i * bstep;
+            switch (op) {
+            case GMPY_VEC_ADD: mpz_add(r + i, x, y); break;
+            case GMPY_VEC_SUB: mpz_sub(r + i, x, y); break;
+            case GMPY_VEC_MUL: mpz_mul(r + i, x, y); break;
+            case GMPY_VEC_FLOORDIV: mpz_fdiv_q(r + i, x, y); break;
+            case GMPY_VEC_MOD: mpz_fdiv_r(r + i, x, y); break;
+            case GMPY_VEC_POW: mpz_pow_ui(r + i, x, mpz_get_ui(y)); break;
+            }
+        }
+        return 0;
+    }
+
+    static int gmpy_vec_powm(__mpz_struct *r,
+                             const __mpz_struct *a, size_t astep,
+                             const __mpz_struct *e, size_t estep,
+                             const __mpz_struct *m, size_t mstep,
+                             size_t n)
+    {
+        size_t i;
+
+        for (i = 0; i < n; i++) {
+            if (mpz_sgn(m + i * mstep) == 0)
+                return 1;
+            if (mpz_sgn(e + i * estep) < 0)
+                return 2;
+        }
+        for (i = 0; i < n; i++)
+            mpz_powm(r + i, a + i * astep, e + i * estep, m + i * mstep);
+        return 0;
+    }
+
+    static void gmpy_vec_cmp(int op, unsigned char *r,
+                             const __mpz_struct *a, size_t astep,
+                             const __mpz_struct *b, size_t bstep,
+                             size_t n)
+    {
+        size_t i;
+        int c;
+
+        for (i = 0; i < n; i++) {
+            c = mpz_cmp(a + i * astep, b + i * bstep);
+            switch (op) {
+            case GMPY_VEC_LT: r[i] = c < 0; break;
+            case GMPY_VEC_LE: r[i] = c <= 0; break;
+            case GMPY_VEC_EQ: r[i] = c == 0; break;
+            case GMPY_VEC_NE: r[i] = c != 0; break;
+            case GMPY_VEC_GT: r[i] = c > 0; break;
+            case GMPY_VEC_GE: r[i] = c >= 0; break;
+            }
+        }
+    }
+
+    static void gmpy_vec_sum(mpz_ptr r, const __mpz_struct *a, size_t n)
+    {
+        size_t i;
+        mpz_set_ui(r, 0);
+        for (i = 0; i < n; i++)
+            mpz_add(r, r, a + i);
+    }
+
+    /* Balanced product tree, so that the operands of each
+       multiplication have similar sizes */
+    static void gmpy_vec_prod(mpz_ptr r, const __mpz_struct *a, size_t n)
+    {
+        mpz_t t;
+
+        if (n == 0) {
+            mpz_set_ui(r, 1);
+        } else if (n == 1) {
+            mpz_set(r, a);
+        } else if (n == 2) {
+            mpz_mul(r, a, a + 1);
+        } else {
+            mpz_init(t);
+            gmpy_vec_prod(r, a, n / 2);
+            gmpy_vec_prod(t, a + n / 2, n - n / 2);
+            mpz_mul(r, r, t);
+            mpz_clear(t);
+        }
+    }
+
+    static void gmpy_vec_dot(mpz_ptr r, const __mpz_struct *a,
+                             const __mpz_struct *b, size_t n)
+    {
+        size_t i;
+        mpz_set_ui(r, 0);
+        for (i = 0; i < n; i++)
+            mpz_addmul(r, a + i, b + i);
+    }
+"""
+
+# Bulk conversions between NumPy's int64, uint64 and float64 arrays and
+# mpz, mpq and mpfr values for gmpy_cffi.numpy_support. Values are read
+# through arrays of pointers so that wrapper objects can be converted
+# without copying. gmpy_mpz_get_int64_array returns 1 if a value does
+# not fit, before writing anything.
+_convert_source = """
+    static void gmpy_set_uint64(mpz_ptr r, uint64_t a)
+    {
+        if (a <= ULONG_MAX)
+            mpz_set_ui(r, (unsigned long)a);
+        else
+            mpz_import(r, 1, 1, sizeof(a), 0, 0, &a);
+    }
+
+    static void gmpy_vec_from_int64(__mpz_struct *r, const int64_t *a,
+                                    size_t n)
+    {
+        size_t i;
+        for (i = 0; i < n; i++) {
+            if (a[i] >= LONG_MIN && a[i] <= LONG_MAX) {
+                mpz_set_si(r + i, (long)a[i]);
+            } else {
+                gmpy_set_uint64(r + i, a[i] < 0 ? -(uint64_t)a[i]
+                                                : (uint64_t)a[i]);
+                if (a[i] < 0)
+                    mpz_neg(r + i, r + i);
+            }
+        }
+    }
+
+    static void gmpy_vec_from_uint64(__mpz_struct *r, const uint64_t *a,
+                                     size_t n)
+    {
+        size_t i;
+        for (i = 0; i < n; i++)
+            gmpy_set_uint64(r + i, a[i]);
+    }
+
+    static void gmpy_vec_from_double(__mpz_struct *r, const double *a,
+                                     size_t n)
+    {
+        size_t i;
+        for (i = 0; i < n; i++)
+            mpz_set_d(r + i, a[i]);
+    }
+
+    static void gmpy_vec_ptrs(__mpz_struct **r, __mpz_struct *a, size_t n)
+    {
+        size_t i;
+        for (i = 0; i < n; i++)
+            r[i] = a + i;
+    }
+
+    static int gmpy_mpz_get_int64_array(int64_t *r, __mpz_struct **a,
+                                        size_t n)
+    {
+        size_t i;
+        uint64_t m;
+
+        for (i = 0; i < n; i++) {
+            if (mpz_sizeinbase(a[i], 2) > 63 &&
+                    !(mpz_sgn(a[i]) < 0 && mpz_sizeinbase(a[i], 2) == 64 &&
+                      mpz_scan1(a[i], 0) == 63))
+                return 1;
+        }
+        for (i = 0; i < n; i++) {
+            m = 0;
+            mpz_export(&m, NULL, 1, sizeof(m), 0, 0, a[i]);
+            r[i] = mpz_sgn(a[i]) < 0 ? (int64_t)(~m + 1) : (int64_t)m;
+        }
+        return 0;
+    }
+
+    static void gmpy_mpz_get_d_array(double *r, __mpz_struct **a, size_t n)
+    {
+        size_t i;
+        for (i = 0; i < n; i++)
+            r[i] = mpz_get_d(a[i]);
+    }
+
+    static void gmpy_mpq_get_d_array(double *r, __mpq_struct **a, size_t n)
+    {
+        size_t i;
+        for (i = 0; i < n; i++)
+            r[i] = mpq_get_d(a[i]);
+    }
+
+    static void gmpy_mpfr_get_d_array(double *r, __mpfr_struct **a,
+                                      size_t n, mpfr_rnd_t rnd)
+    {
+        size_t i;
+        for (i = 0; i < n; i++)
+            r[i] = mpfr_get_d(a[i], rnd);
+    }
+"""
+
+# One segment of the sieve of Eratosthenes for gmpy_cffi.sieve. The odd
+# numbers lo, lo + 2, ... below hi are marked in the bit array bits,
+# which must hold (hi - lo + 1) / 2 bits, by the odd primes p with
+# p * p < hi from the sorted array primes; the unmarked numbers are
+# written to out and their count returned. lo must be odd and at least
+# 3, and hi at most 2**63.
+_sieve_source = """
+    #include <string.h>
+
+    static size_t gmpy_sieve_segment(uint64_t *out, uint64_t lo,
+                                     uint64_t hi, const uint32_t *primes,
+                                     size_t nprimes, unsigned char *bits)
+    {
+        size_t i, count = 0;
+        uint64_t n = (hi - lo + 1) / 2, p, start, j;
+
+        memset(bits, 0, (n + 7) / 8);
+        for (i = 0; i < nprimes; i++) {
+            p = primes[i];
+            if (p * p >= hi)
+                break;
+            start = p * p;
+            if (start < lo) {
+                /* The first odd multiple of p that is >= lo */
+                start = (lo + p - 1) / p * p;
+                if (start % 2 == 0)
+                    start += p;
+            }
+            for (j = (start - lo) / 2; j < n; j += p)
+                bits[j >> 3] |= (unsigned char)(1 << (j & 7));
+        }
+        for (j = 0; j < n; j++)
+            if (!(bits[j >> 3] & (1 << (j & 7))))
+                out[count++] = lo + 2 * j;
+        return count;
+    }
+"""
+
+# Probable prime tests for gmpy_cffi.ntheory. gmpy_is_prime_u64 is a
+# deterministic test for 64-bit n: Miller-Rabin with the seven bases
+# found by Jim Sinclair has no counterexample below 2**64. The mpz tests
+# require odd n > 2; gmpy_strong_prp requires gcd(n, a) == 1 and
+# gmpy_strong_lucas_prp requires gcd(n, q * (p * p - 4 * q)) == 1.
+# gmpy_prime_many sets r[i] to mpz_probab_prime_p(a[i], reps) != 0,
+# skipping the test for the a[i] >= bound that share a factor with
+# primorial, or for none if primorial is 1; it returns 1 if it runs out
+# of memory.
+_prp_source = """
+    /* Arithmetic modulo odd n in Montgomery form, x * R mod n with
+       R = 2**64, where a product is one 128-bit multiplication and a
+       reduction without division. ninv = 1/n mod R. Without 128-bit
+       integers, the form is x itself and the product uses doubling. */
+    #ifdef __SIZEOF_INT128__
+    static uint64_t gmpy_mulmod_u64(uint64_t a, uint64_t b, uint64_t n,
+                                    uint64_t ninv)
+    {
+        unsigned __int128 t = (unsigned __int128)a * b;
+        uint64_t m = (uint64_t)t * ninv;
+        uint64_t th = (uint64_t)(t >> 64);
+        uint64_t mh = (uint64_t)(((unsigned __int128)m * n) >> 64);
+
+        return th >= mh ? th - mh : th - mh + n;
+    }
+
+    static uint64_t gmpy_to_mont_u64(uint64_t a, uint64_t n)
+    {
+        return (uint64_t)(((unsigned __int128)a << 64) % n);
+    }
+    #else
+    static uint64_t gmpy_mulmod_u64(uint64_t a, uint64_t b, uint64_t n,
+                                    uint64_t ninv)
+    {
+        uint64_t r = 0;
+
+        (void)ninv;
+        while (b) {
+            if (b & 1)
+                r = r >= n - a ? r - (n - a) : r + a;
+            a = a >= n - a ? a - (n - a) : a + a;
+            b >>= 1;
+        }
+        return r;
+    }
+
+    static uint64_t gmpy_to_mont_u64(uint64_t a, uint64_t n)
+    {
+        return a % n;
+    }
+    #endif
+
+    /* Miller-Rabin test of odd n > 2 to base a, 0 < a < n */
+    static int gmpy_strong_prp_u64(uint64_t n, uint64_t a)
+    {
+        uint64_t d = n - 1, ninv = n, one, minus_one, x, y;
+        int i, s = 0;
+
+        /* Newton's iteration, from 3 correct bits to 96 */
+        for (i = 0; i < 5; i++)
+            ninv *= 2 - n * ninv;
+        one = gmpy_to_mont_u64(1, n);
+        minus_one = n - one;
+        x = gmpy_to_mont_u64(a, n);
+        y = one;
+        while (d % 2 == 0) {
+            d /= 2;
+            s++;
+        }
+        while (d) {
+            if (d & 1)
+                y = gmpy_mulmod_u64(y, x, n, ninv);
+            x = gmpy_mulmod_u64(x, x, n, ninv);
+            d >>= 1;
+        }
+        if (y == one || y == minus_one)
+            return 1;
+        while (--s > 0) {
+            y = gmpy_mulmod_u64(y, y, n, ninv);
+            if (y == minus_one)
+                return 1;
+            if (y == one)
+                return 0;
+        }
+        return 0;
+    }
+
+    static int gmpy_is_prime_u64(uint64_t n)
+    {
+        static const uint64_t small[] = {2, 3, 5, 7, 11, 13, 17, 19, 23,
+                                         29, 31, 37};
+        static const uint64_t bases[] = {2, 325, 9375, 28178, 450775,
+                                         9780504, 1795265022};
+        /* Jaeschke: no counterexample to 2, 7 and 61 below this */
+        static const uint64_t bases32[] = {2, 7, 61};
+        const uint64_t *b = bases;
+        size_t i, nbases = sizeof(bases) / sizeof(bases[0]);
+        uint64_t a;
+
+        for (i = 0; i < sizeof(small) / sizeof(small[0]); i++) {
+            if (n == small[i])
+                return 1;
+            if (n % small[i] == 0)
+                return 0;
+        }
+        if (n < 37 * 37)
+            return n > 1;
+        if (n < 4759123141ULL) {
+            b = bases32;
+            nbases = sizeof(bases32) / sizeof(bases32[0]);
+        }
+        for (i = 0; i < nbases; i++) {
+            a = b[i] % n;
+            if (a != 0 && !gmpy_strong_prp_u64(n, a))
+                return 0;
+        }
+        return 1;
+    }
+
+    static int gmpy_strong_prp(mpz_srcptr n, mpz_srcptr a)
+    {
+        mpz_t d, y, nm1;
+        mp_bitcnt_t s, r;
+        int res = 0;
+
+        mpz_inits(d, y, nm1, NULL);
+        mpz_sub_ui(nm1, n, 1);
+        s = mpz_scan1(nm1, 0);
+        mpz_tdiv_q_2exp(d, nm1, s);
+        mpz_powm(y, a, d, n);
+        if (mpz_cmp_ui(y, 1) == 0 || mpz_cmp(y, nm1) == 0) {
+            res = 1;
+        } else {
+            for (r = 1; r < s; r++) {
+                mpz_powm_ui(y, y, 2, n);
+                if (mpz_cmp(y, nm1) == 0) {
+                    res = 1;
+                    break;
+                }
+                if (mpz_cmp_ui(y, 1) == 0)
+                    break;
+            }
+        }
+        mpz_clears(d, y, nm1, NULL);
+        return res;
+    }
+
+    /* Halve x modulo the odd n, for 0 <= x < n */
+    static void gmpy_half_mod(mpz_ptr x, mpz_srcptr n)
+    {
+        if (mpz_odd_p(x))
+            mpz_add(x, x, n);
+        mpz_tdiv_q_2exp(x, x, 1);
+    }
+
+    /* With D = p * p - 4 * q and n - jacobi(D, n) = d * 2**s, d odd,
+       n is a strong Lucas probable prime if U(d) == 0 or
+       V(d * 2**r) == 0 (mod n) for some 0 <= r < s. U(k), V(k) and
+       Q**k are computed by binary expansion of k. */
+    static int gmpy_strong_lucas_prp(mpz_srcptr n, long p, long q)
+    {
+        mpz_t d, u, v, qk, t, dd;
+        mp_bitcnt_t s, r;
+        long i;
+        int res = 0;
+
+        mpz_inits(d, u, v, qk, t, dd, NULL);
+        /* dd = p * p - 4 * q, which can overflow a long */
+        mpz_set_si(dd, p);
+        mpz_mul_si(dd, dd, p);
+        mpz_set_si(t, q);
+        mpz_mul_2exp(t, t, 2);
+        mpz_sub(dd, dd, t);
+        mpz_mod(dd, dd, n);
+        if (mpz_jacobi(dd, n) < 0)
+            mpz_add_ui(d, n, 1);
+        else
+            mpz_sub_ui(d, n, 1);
+        s = mpz_scan1(d, 0);
+        mpz_tdiv_q_2exp(d, d, s);
+
+        /* k = 1 */
+        mpz_set_ui(u, 1);
+        mpz_set_si(v, p);
+        mpz_mod(v, v, n);
+        mpz_set_si(qk, q);
+        mpz_mod(qk, qk, n);
+        for (i = (long)mpz_sizeinbase(d, 2) - 2; i >= 0; i--) {
+            /* k -> 2k */
+            mpz_mul(u, u, v);
+            mpz_mod(u, u, n);
+            mpz_mul(v, v, v);
+            mpz_submul_ui(v, qk, 2);
+            mpz_mod(v, v, n);
+            mpz_mul(qk, qk, qk);
+            mpz_mod(qk, qk, n);
+            if (mpz_tstbit(d, i)) {
+                /* k -> k + 1 */
+                mpz_mul_si(t, u, p);
+                mpz_add(t, t, v);
+                mpz_mod(t, t, n);
+                gmpy_half_mod(t, n);
+                mpz_mul(u, u, dd);
+                mpz_mul_si(v, v, p);
+                mpz_add(v, v, u);
+                mpz_mod(v, v, n);
+                gmpy_half_mod(v, n);
+                mpz_swap(u, t);
+                mpz_mul_si(qk, qk, q);
+                mpz_mod(qk, qk, n);
+            }
+        }
+        if (mpz_sgn(u) == 0 || mpz_sgn(v) == 0) {
+            res = 1;
+        } else {
+            for (r = 1; r < s; r++) {
+                mpz_mul(v, v, v);
+                mpz_submul_ui(v, qk, 2);
+                mpz_mod(v, v, n);
+                if (mpz_sgn(v) == 0) {
+                    res = 1;
+                    break;
+                }
+                mpz_mul(qk, qk, qk);
+                mpz_mod(qk, qk, n);
+            }
+        }
+        mpz_clears(d, u, v, qk, t, dd, NULL);
+        return res;
+    }
+
+    /* Node k of the product tree covers a[lo..hi), its children are
+       2k + 1 and 2k + 2. The values below bound count as 1. */
+    static void gmpy_many_build(__mpz_struct *tree, size_t k,
+                                __mpz_struct **a, size_t lo, size_t hi,
+                                unsigned long bound)
+    {
+        size_t mid = lo + (hi - lo) / 2;
+
+        if (hi - lo == 1) {
+            if (mpz_cmpabs_ui(a[lo], bound) < 0)
+                mpz_set_ui(tree + k, 1);
+            else
+                mpz_abs(tree + k, a[lo]);
+            return;
+        }
+        gmpy_many_build(tree, 2 * k + 1, a, lo, mid, bound);
+        gmpy_many_build(tree, 2 * k + 2, a, mid, hi, bound);
+        mpz_mul(tree + k, tree + 2 * k + 1, tree + 2 * k + 2);
+    }
+
+    /* Reduce x down the remainder tree and test the leaves */
+    static void gmpy_many_descend(unsigned char *r, __mpz_struct *tree,
+                                  size_t k, __mpz_struct **a, size_t lo,
+                                  size_t hi, mpz_srcptr x,
+                                  unsigned long bound, int reps)
+    {
+        size_t mid = lo + (hi - lo) / 2;
+        mpz_t t;
+
+        mpz_init(t);
+        mpz_fdiv_r(t, x, tree + k);
+        if (hi - lo > 1) {
+            gmpy_many_descend(r, tree, 2 * k + 1, a, lo, mid, t, bound,
+                              reps);
+            gmpy_many_descend(r, tree, 2 * k + 2, a, mid, hi, t, bound,
+                              reps);
+        } else if (mpz_cmpabs_ui(a[lo], bound) < 0) {
+            r[lo] = mpz_probab_prime_p(a[lo], reps) != 0;
+        } else {
+            mpz_gcd(t, t, tree + k);
+            r[lo] = (mpz_cmp_ui(t, 1) == 0 &&
+                     mpz_probab_prime_p(a[lo], reps) != 0);
+        }
+        mpz_clear(t);
+    }
+
+    static int gmpy_prime_many(unsigned char *r, __mpz_struct **a,
+                               size_t n, mpz_srcptr primorial,
+                               unsigned long bound, int reps)
+    {
+        __mpz_struct *tree;
+        size_t i;
+
+        if (mpz_cmp_ui(primorial, 1) == 0) {
+            for (i = 0; i < n; i++)
+                r[i] = mpz_probab_prime_p(a[i], reps) != 0;
+            return 0;
+        }
+        if (n == 0)
+            return 0;
+        if (n > SIZE_MAX / (4 * sizeof(__mpz_struct)))
+            return 1;
+        tree = malloc(4 * n * sizeof(__mpz_struct));
+        if (tree == NULL)
+            return 1;
+        for (i = 0; i < 4 * n; i++)
+            mpz_init(tree + i);
+        gmpy_many_build(tree, 0, a, 0, n, bound);
+        gmpy_many_descend(r, tree, 0, a, 0, n, primorial, bound, reps);
+        for (i = 0; i < 4 * n; i++)
+            mpz_clear(tree + i);
+        free(tree);
+        return 0;
+    }
+"""
+
+ffibuilder.set_source("gmpy_cffi._gmp", """
+    #include <limits.h>
+    #include <gmp.h>
+    #include <mpfr.h>
+    #include <mpc.h>
+""" + (_vector_source + _convert_source + _sieve_source + _prp_source),
+    libraries=['gmp', 'mpfr', 'mpc'])
+
+
+if __name__ == "__main__":
+    ffibuilder.compile(verbose=True)
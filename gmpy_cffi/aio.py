@@ -0,0 +1,160 @@
+"""
+Awaitable versions of the expensive functions, for asyncio code.
+
+Each coroutine function takes the same arguments as its namesake in
+gmpy_cffi. If the operands are at least get_threshold() limbs in size
+(or, for fac, fib and lucas, the result will be, and for the mpfr
+functions, the working precision is) the call runs in an executor, so
+the event loop is not blocked; the C calls release the GIL, so the
+default thread pool executor runs them in parallel. Smaller calls run
+inline.
+
+The call runs in a copy of the caller's context, and the flags it
+raises are added to the caller's context afterwards. If the awaiting
+task is cancelled, a call that has not started yet is not run, and the
+result of a running one is dropped when it completes.
+
+This module requires Python 3.7 or later.
+
+    >>> async def main():
+    ...     return await aio.next_prime(mpz(2)**4000)
+"""
+import asyncio
+import functools
+
+from gmpy_cffi.interface import gmp
+from gmpy_cffi.mpz import mpz
+from gmpy_cffi.mpq import mpq
+from gmpy_cffi.mpfr import mpfr
+from gmpy_cffi.cache import _limbs
+from gmpy_cffi.context import get_context, local_context
+from gmpy_cffi import ntheory, special_functions
+
+
+_executor = None
+_threshold = 16
+
+
+def get_executor():
+    """
+    get_executor() -> executor or None
+
+    Return the executor the coroutines run in, or None for the event
+    loop's default executor.
+    """
+    return _executor
+
+
+def set_executor(executor):
+    """
+    set_executor(executor)
+
+    Set the concurrent.futures executor the coroutines run in; None
+    selects the event loop's default executor.
+    """
+    global _executor
+    _executor = executor
+
+
+def get_threshold():
+    """
+    get_threshold() -> int
+
+    Return the size in limbs from which calls run in the executor.
+    """
+    return _threshold
+
+
+def set_threshold(limbs):
+    """
+    set_threshold(limbs)
+
+    Set the size in limbs from which calls run in the executor. 0 runs
+    every call in the executor.
+    """
+    global _threshold
+    if not isinstance(limbs, int):
+        raise TypeError('an integer is required')
+    if limbs < 0:
+        raise ValueError('threshold must not be negative')
+    _threshold = limbs
+
+
+def _size(x):
+    """Return the size of the integer or rational x in limbs."""
+    if isinstance(x, mpz):
+        return _limbs(gmp.mpz_sizeinbase(x._mpz, 2))
+    if isinstance(x, int):
+        return _limbs(x.bit_length())
+    if isinstance(x, mpq):
+        return (_limbs(gmp.mpz_sizeinbase(gmp.mpq_numref(x._mpq), 2)) +
+                _limbs(gmp.mpz_sizeinbase(gmp.mpq_denref(x._mpq), 2)))
+    return 0
+
+
+def _operand_size(x, *args):
+    return _size(x)
+
+
+def _fac_size(n):
+    # log2(n!) < n * log2(n)
+    if isinstance(n, (int, mpz)) and n > 0:
+        return _limbs(int(n) * int(n).bit_length())
+    return 0
+
+
+def _fib_size(n):
+    # log2(fib(n)) < 0.7 * n
+    if isinstance(n, (int, mpz)) and n > 0:
+        return _limbs(int(n) * 7 // 10)
+    return 0
+
+
+def _precision_size(*args):
+    precs = [x.precision for x in args if isinstance(x, mpfr)]
+    return _limbs(max(precs + [get_context().precision]))
+
+
+def _const_size(precision=0):
+    if isinstance(precision, int) and precision > 0:
+        return _limbs(precision)
+    return _limbs(get_context().precision)
+
+
+def _call(ctx, func, args):
+    with local_context(ctx) as local:
+        result = func(*args)
+    return result, local._flags
+
+
+def _wrap(func, size):
+    @functools.wraps(func)
+    async def wrapper(*args):
+        if size(*args) < _threshold:
+            return func(*args)
+        ctx = get_context()
+        loop = asyncio.get_running_loop()
+        result, flags = await loop.run_in_executor(
+            _executor, _call, ctx, func, args)
+        ctx._flags |= flags
+        return result
+    return wrapper
+
+
+is_prime = _wrap(ntheory.is_prime, _operand_size)
+next_prime = _wrap(ntheory.next_prime, _operand_size)
+fac = _wrap(ntheory.fac, _fac_size)
+fib = _wrap(ntheory.fib, _fib_size)
+fib2 = _wrap(ntheory.fib2, _fib_size)
+lucas = _wrap(ntheory.lucas, _fib_size)
+lucas2 = _wrap(ntheory.lucas2, _fib_size)
+
+zeta = _wrap(special_functions.zeta, _precision_size)
+gamma = _wrap(special_functions.gamma, _precision_size)
+lngamma = _wrap(special_functions.lngamma, _precision_size)
+eint = _wrap(special_functions.eint, _precision_size)
+li2 = _wrap(special_functions.li2, _precision_size)
+const_pi = _wrap(special_functions.const_pi, _const_size)
+const_euler = _wrap(special_functions.const_euler, _const_size)
+const_catalan = _wrap(special_functions.const_catalan, _const_size)
+const_log2 = _wrap(special_functions.const_log2, _const_size)
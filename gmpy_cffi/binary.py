@@ -0,0 +1,281 @@
+"""
+Compact binary serialisation of mpz, xmpz, mpq, mpfr and mpc, in the
+format of gmpy2's to_binary() and from_binary().
+
+Every encoding starts with a type code byte (0x01 mpz, 0x02 xmpz, 0x03
+mpq, 0x04 mpfr, 0x05 mpc) followed by a flags byte. All integers are
+little-endian.
+
+- mpz, xmpz: flags 0x00 (zero), 0x01 (positive) or 0x02 (negative),
+  then the bytes of the absolute value.
+- mpq: flags 0x00 for zero, with nothing after it. Otherwise the same
+  sign flags, plus 0x04 if the numerator length is stored in 8 bytes
+  instead of 4; then the numerator length, the numerator bytes and the
+  denominator bytes.
+- mpfr: flags 0x01 (regular number), 0x02 (sign bit set), 0x04 (8-byte
+  instead of 4-byte sizes), 0x08 (NaN), 0x10 (infinity), 0x20
+  (negative exponent) and 0x40 (8-byte instead of 4-byte limbs); a byte
+  for the sign of the rounding error of the value (always 0 here) and
+  an unused byte; then the precision. A regular number x follows that
+  with the magnitude of its exponent e and its significand as the
+  limbs that hold it, the most significant bit of the last limb being
+  set, with 0.5 <= abs(x) / 2**e < 1.
+- mpc: the mpfr encodings of the real and imaginary parts, each with
+  the type code 0x05.
+"""
+import struct
+import sys
+
+from gmpy_cffi.interface import gmp, ffi
+from gmpy_cffi.mpz import mpz
+from gmpy_cffi.xmpz import xmpz
+from gmpy_cffi.mpq import mpq
+from gmpy_cffi.mpfr import mpfr
+from gmpy_cffi.mpc import mpc
+from gmpy_cffi.cache import (
+    _new_mpz, _del_mpz, _new_mpq, _del_mpq, _new_mpfr, _new_mpc)
+
+
+if sys.version > '3':
+    long = int
+    xrange = range
+
+
+_MPZ, _XMPZ, _MPQ, _MPFR, _MPC = 0x01, 0x02, 0x03, 0x04, 0x05
+
+_REGULAR, _SIGN, _LARGE, _NAN, _INF, _EXP_NEGATIVE, _LIMB8 = (
+    0x01, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40)
+_SIZES = {4: struct.Struct('<I'), 8: struct.Struct('<Q')}
+# Exponents beyond this cannot be passed to mpfr_set_z_2exp()
+_EXP_LIMIT = 1 << (8 * ffi.sizeof('mpfr_exp_t') - 2)
+
+
+def _mag_to_bytes(a):
+    """Return abs(a) as little-endian bytes."""
+    size = gmp.mpz_sizeinbase(a, 256)
+    p = ffi.new('unsigned char[]', size)
+    countp = ffi.new('size_t *')
+    gmp.mpz_export(p, countp, -1, 1, 0, 0, a)
+    return ffi.buffer(p, countp[0])[:]
+
+
+def _bytes_to_mag(s, a):
+    """Set a from the little-endian bytes s."""
+    gmp.mpz_import(a, len(s), -1, 1, 0, 0, ffi.from_buffer(s))
+
+
+def _sign_flag(a):
+    sign = gmp.mpz_sgn(a)
+    return 0x00 if sign == 0 else 0x01 if sign > 0 else 0x02
+
+
+def _mpz_to_binary(code, a):
+    return struct.pack('<BB', code, _sign_flag(a)) + _mag_to_bytes(a)
+
+
+def _mpq_to_binary(a):
+    num, den = gmp.mpq_numref(a), gmp.mpq_denref(a)
+    flags = _sign_flag(num)
+    if flags == 0x00:
+        return struct.pack('<BB', _MPQ, flags)
+    num_bytes, den_bytes = _mag_to_bytes(num), _mag_to_bytes(den)
+    if len(num_bytes) < 1 << 32:
+        header = struct.pack('<BBI', _MPQ, flags, len(num_bytes))
+    else:
+        header = struct.pack('<BBQ', _MPQ, flags | 0x04, len(num_bytes))
+    return header + num_bytes + den_bytes
+
+
+def _mpfr_to_binary(a, code):
+    prec = gmp.mpfr_get_prec(a)
+    flags = _SIGN if gmp.mpfr_signbit(a) else 0
+    if not gmp.mpfr_regular_p(a):
+        if gmp.mpfr_nan_p(a):
+            flags |= _NAN
+        elif gmp.mpfr_inf_p(a):
+            flags |= _INF
+        size = 8 if prec >> 32 else 4
+        if size == 8:
+            flags |= _LARGE
+        header = struct.pack('<BBBB', code, flags, 0, 0)
+        return header + _SIZES[size].pack(prec)
+
+    # Shift the significand to the top of the limbs that hold it
+    limb_bits = gmp.mp_bits_per_limb
+    limbs = (prec + limb_bits - 1) // limb_bits
+    m = _new_mpz()
+    e = gmp.mpfr_get_z_2exp(m, a)
+    bits = gmp.mpz_sizeinbase(m, 2)
+    gmp.mpz_mul_2exp(m, m, limbs * limb_bits - bits)
+    significand = _mag_to_bytes(m)
+    _del_mpz(m)
+    e += bits
+
+    flags |= _REGULAR
+    if e < 0:
+        flags |= _EXP_NEGATIVE
+        e = -e
+    if limb_bits == 64:
+        flags |= _LIMB8
+    size = 8 if e >> 32 or prec >> 32 or limbs >> 32 else 4
+    if size == 8:
+        flags |= _LARGE
+    pack = _SIZES[size].pack
+    return (struct.pack('<BBBB', code, flags, 0, 0) + pack(prec) + pack(e) +
+            significand)
+
+
+def to_binary(x):
+    """
+    to_binary(x) -> bytes
+
+    Return a compact binary encoding of the mpz, xmpz, mpq, mpfr or mpc
+    x. The precision of mpfr and mpc values is preserved.
+    """
+    if isinstance(x, xmpz):
+        return _mpz_to_binary(_XMPZ, x._mpz)
+    if isinstance(x, mpz):
+        return _mpz_to_binary(_MPZ, x._mpz)
+    if isinstance(x, mpq):
+        return _mpq_to_binary(x._mpq)
+    if isinstance(x, mpfr):
+        return _mpfr_to_binary(x._mpfr, _MPFR)
+    if isinstance(x, mpc):
+        return (_mpfr_to_binary(gmp.mpc_realref(x._mpc), _MPC) +
+                _mpfr_to_binary(gmp.mpc_imagref(x._mpc), _MPC))
+    raise TypeError('to_binary() argument type not supported')
+
+
+def _mpfr_from_binary(s, start, code):
+    """
+    Parse the mpfr encoding with type code at s[start:] and return
+    (flags, precision, exponent, significand, end). The precision comes
+    from untrusted input, so it is checked against the significand
+    before anything is allocated with it.
+    """
+    if len(s) < start + 4:
+        raise ValueError('invalid mpfr binary encoding')
+    if struct.unpack_from('<B', s, start)[0] != code:
+        raise ValueError('invalid mpfr binary encoding')
+    flags = struct.unpack_from('<B', s, start + 1)[0]
+    size = 8 if flags & _LARGE else 4
+    fmt = _SIZES[size]
+    pos = start + 4
+    if len(s) < pos + size:
+        raise ValueError('invalid mpfr binary encoding')
+    prec = fmt.unpack_from(s, pos)[0]
+    pos += size
+    if not gmp.MPFR_PREC_MIN <= prec <= gmp.MPFR_PREC_MAX:
+        raise ValueError('invalid mpfr precision in binary encoding')
+    if not flags & _REGULAR:
+        # Without a significand to vouch for it, a precision this large
+        # is not one that to_binary() would be asked to keep
+        if size == 8:
+            raise ValueError('invalid mpfr binary encoding')
+        return flags, prec, 0, None, pos
+
+    if len(s) < pos + size:
+        raise ValueError('invalid mpfr binary encoding')
+    e = fmt.unpack_from(s, pos)[0]
+    pos += size
+    if e >= _EXP_LIMIT:
+        raise ValueError('invalid mpfr binary encoding')
+    if flags & _EXP_NEGATIVE:
+        e = -e
+    limb_bytes = 8 if flags & _LIMB8 else 4
+    end = pos + (prec + 8 * limb_bytes - 1) // (8 * limb_bytes) * limb_bytes
+    if len(s) < end or not struct.unpack_from('<B', s, end - 1)[0] & 0x80:
+        raise ValueError('invalid mpfr binary encoding')
+    return flags, prec, e, s[pos:end], end
+
+
+def _set_mpfr_from_binary(a, flags, e, significand):
+    sign = -1 if flags & _SIGN else 1
+    if not flags & _REGULAR:
+        special = flags & (_NAN | _INF)
+        if special == _NAN:
+            gmp.mpfr_set_nan(a)
+            # The sign of a NaN is kept, though mpfr_set_nan() sets any
+            if bool(gmp.mpfr_signbit(a)) != (sign < 0):
+                gmp.mpfr_neg(a, a, gmp.MPFR_RNDN)
+        elif special:
+            gmp.mpfr_set_inf(a, sign)
+        else:
+            gmp.mpfr_set_zero(a, sign)
+    else:
+        m = _new_mpz()
+        _bytes_to_mag(significand, m)
+        if sign < 0:
+            gmp.mpz_neg(m, m)
+        # Exact: the bits of m below the precision of a are zero
+        gmp.mpfr_set_z_2exp(a, m, e - 8 * len(significand), gmp.MPFR_RNDN)
+        _del_mpz(m)
+
+
+def from_binary(s):
+    """
+    from_binary(bytes) -> mpz, xmpz, mpq, mpfr or mpc
+
+    Return the object encoded by to_binary().
+    """
+    if isinstance(s, (bytearray, memoryview)):
+        s = bytes(s)
+    elif not isinstance(s, bytes):
+        raise TypeError('from_binary() requires bytes')
+    if len(s) < 2:
+        raise ValueError('byte sequence too short for from_binary()')
+    code, flags = struct.unpack_from('<BB', s)
+
+    if code in (_MPZ, _XMPZ):
+        res = _new_mpz()
+        _bytes_to_mag(s[2:], res)
+        if flags == 0x02:
+            gmp.mpz_neg(res, res)
+        cls = xmpz if code == _XMPZ else mpz
+        return cls._from_c_mpz(res)
+
+    if code == _MPQ:
+        if flags & 0x03 == 0x00:
+            res = _new_mpq()
+            gmp.mpq_set_ui(res, 0, 1)
+            return mpq._from_c_mpq(res)
+        fmt = '<Q' if flags & 0x04 else '<I'
+        start = 2 + struct.calcsize(fmt)
+        if len(s) < start:
+            raise ValueError('invalid mpq binary encoding')
+        end = start + struct.unpack_from(fmt, s, 2)[0]
+        if end >= len(s):
+            raise ValueError('invalid mpq binary encoding')
+        res = _new_mpq()
+        num, den = gmp.mpq_numref(res), gmp.mpq_denref(res)
+        _bytes_to_mag(s[start:end], num)
+        _bytes_to_mag(s[end:], den)
+        if gmp.mpz_sgn(den) == 0:
+            _del_mpq(res)
+            raise ValueError('invalid mpq binary encoding')
+        if flags & 0x03 == 0x02:
+            gmp.mpz_neg(num, num)
+        gmp.mpq_canonicalize(res)
+        return mpq._from_c_mpq(res)
+
+    if code == _MPFR:
+        flags, prec, e, significand, end = _mpfr_from_binary(s, 0, _MPFR)
+        if end != len(s):
+            raise ValueError('invalid mpfr binary encoding')
+        res = _new_mpfr(prec)
+        _set_mpfr_from_binary(res, flags, e, significand)
+        return mpfr._from_c_mpfr(res)
+
+    if code == _MPC:
+        real = _mpfr_from_binary(s, 0, _MPC)
+        imag = _mpfr_from_binary(s, real[4], _MPC)
+        if imag[4] != len(s):
+            raise ValueError('invalid mpc binary encoding')
+        res = _new_mpc((real[1], imag[1]))
+        _set_mpfr_from_binary(gmp.mpc_realref(res), real[0], real[2],
+                              real[3])
+        _set_mpfr_from_binary(gmp.mpc_imagref(res), imag[0], imag[2],
+                              imag[3])
+        return mpc._from_c_mpc(res)
+
+    raise ValueError('unknown type code in from_binary()')
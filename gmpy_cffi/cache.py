@@ -1,7 +1,9 @@
 import sys
+import threading
 
 
 from gmpy_cffi.interface import ffi, gmp
+from gmpy_cffi.context import get_context
 
 
 if sys.version > '3':
@@ -12,6 +14,8 @@ if sys.version > '3':
 cache_size = 100
 cache_obsize = 128
 
+_limb_bits = gmp.mp_bits_per_limb
+
 
 def get_cache():
     """
@@ -43,102 +47,310 @@ def set_cache(size, obsize):
 
     cache_size = size
     cache_obsize = obsize
+    _clear_cache()
+
+
+def cache_stats():
+    """
+    cache_stats() -> dict
+
+    Return a dictionary with an entry per type ('mpz', 'mpq', 'mpfr' and
+    'mpc') giving the cache hits and misses, the number of released
+    objects whose storage exceeded the object size (evictions), the
+    current fill of the calling thread's cache plus the shared overflow,
+    and the current and peak number of live objects.
+
+    The counters are updated without locking, so under heavy threading
+    they are approximate.
+    """
+    return dict((pool.name, pool.stats()) for pool in _pools)
+
+
+def reset_cache_stats():
+    """
+    reset_cache_stats()
+
+    Reset the hit, miss and eviction counters to zero and the peak
+    number of live objects to the current number.
+    """
+    for pool in _pools:
+        pool.reset_stats()
+
+
+def warm_cache():
+    """
+    warm_cache()
+
+    Fill the calling thread's caches up to the current cache size, with
+    mpfr and mpc objects at the current context's precision. The caches
+    are otherwise filled lazily as objects are released, so this is
+    only worthwhile for long-running threads that want the
+    allocations done up front.
+    """
     _init_mpz_cache()
     _init_mpq_cache()
     _init_mpfr_cache()
+    _init_mpc_cache()
 
 
-# MPZ
 def _init_mpz_cache():
-    global mpz_cache, in_mpz_cache
-    mpz_cache = []
-    in_mpz_cache = cache_size
-    for _ in xrange(cache_size):
+    while len(_mpz_pool) < cache_size:
         mpz = ffi.new("mpz_t")
         gmp.mpz_init(mpz)
-        mpz_cache.append(mpz)
-_init_mpz_cache()
+        _mpz_pool.fill(mpz)
+
+
+def _init_mpq_cache():
+    while len(_mpq_pool) < cache_size:
+        mpq = ffi.new("mpq_t")
+        gmp.mpq_init(mpq)
+        _mpq_pool.fill(mpq)
+
+
+def _init_mpfr_cache():
+    prec = get_context().precision
+    while len(_mpfr_pool) < cache_size:
+        mpfr = ffi.new("mpfr_t")
+        gmp.mpfr_init2(mpfr, prec)
+        _mpfr_pool.fill(mpfr, prec)
+
+
+def _init_mpc_cache():
+    ctx = get_context()
+    rprec, iprec = ctx._rprec, ctx._iprec
+    while len(_mpc_pool) < cache_size:
+        mpc = ffi.new("mpc_t")
+        gmp.mpc_init3(mpc, rprec, iprec)
+        _mpc_pool.fill(mpc, (rprec, iprec))
+
+
+def free_cache():
+    """
+    free_cache()
+
+    Release every cached object and free the calling thread's MPFR
+    caches of constants such as pi, which are otherwise kept for reuse
+    at the highest precision requested so far.
+    """
+    _clear_cache()
+    gmp.mpfr_free_cache()
+
+
+def _clear_cache():
+    """Release every cached object."""
+    for pool in _pools:
+        pool.clear()
+
 
+class _Bins(dict):
+    """
+    Cached objects grouped by key: the precision for mpfr and mpc, None
+    for mpz and mpq. A thread's bins release their objects when the
+    thread goes away.
+    """
+
+    def __init__(self, clear):
+        dict.__init__(self)
+        self.clear_object = clear
+        self.count = 0
+
+    def take(self, key):
+        items = self.get(key)
+        if items:
+            self.count -= 1
+            return items.pop()
+        return None
+
+    def add(self, key, obj):
+        items = self.get(key)
+        if items is None:
+            items = self[key] = []
+        items.append(obj)
+        self.count += 1
+
+    def evict(self, key):
+        """
+        Release an object cached under a key other than key, so that
+        bins for precisions no longer in use do not hold the room.
+        Return whether an object was released.
+        """
+        for other in list(self):
+            if other == key:
+                continue
+            items = self[other]
+            if not items:
+                del self[other]
+                continue
+            self.clear_object(items.pop())
+            self.count -= 1
+            if not items:
+                del self[other]
+            return True
+        return False
+
+    def release(self):
+        for items in self.values():
+            while items:
+                self.clear_object(items.pop())
+        self.count = 0
+
+    __del__ = release
+
+
+class _Pool(object):
+    """
+    Cache of initialised C objects of one type.
+
+    Every thread has its own bins of up to cache_size objects in total,
+    so the common path takes no lock and no object can be handed to two
+    threads. Objects released while a thread's bins are full go to
+    shared overflow bins (also bounded by cache_size) which threads draw
+    from once their own bin is empty. Only the overflow is locked.
+
+    Objects are binned by key so that a request only gets an object that
+    needs no reallocation; for mpfr and mpc the key is the precision.
+    When the bins are full, an object of another key is released to
+    make room, so that the bins follow the precision in use.
+
+    The pool also counts hits, misses, evictions and live objects; the
+    caller must pair every get() with a put() or discard() and count an
+    eviction when it shrinks an object before put().
+    """
 
+    def __init__(self, name, clear):
+        self.name = name
+        self._clear = clear
+        self._local = threading.local()
+        self._overflow = _Bins(clear)
+        # Reentrant: ffi.gc destructors may release objects while the
+        # same thread holds the lock.
+        self._lock = threading.RLock()
+        self._generation = 0
+        self.hits = self.misses = self.evictions = 0
+        self.live = self.peak = 0
+
+    def _bins(self):
+        local = self._local
+        if getattr(local, 'generation', None) != self._generation:
+            # Dropping stale bins releases their objects.
+            local.bins = _Bins(self._clear)
+            local.generation = self._generation
+        return local.bins
+
+    def __len__(self):
+        return self._bins().count
+
+    def get(self, key=None):
+        """Return a cached object for key, or None if there is none."""
+        self.live += 1
+        if self.live > self.peak:
+            self.peak = self.live
+        obj = self._bins().take(key)
+        if obj is None and self._overflow.count:
+            with self._lock:
+                obj = self._overflow.take(key)
+        if obj is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return obj
+
+    def put(self, obj, key=None):
+        """Cache obj under key if there is room, otherwise release it."""
+        self.live -= 1
+        bins = self._bins()
+        if bins.count < cache_size or bins.evict(key):
+            bins.add(key, obj)
+            return
+        with self._lock:
+            overflow = self._overflow
+            if overflow.count < cache_size or overflow.evict(key):
+                overflow.add(key, obj)
+                return
+        self._clear(obj)
+
+    def discard(self, obj):
+        """Release obj without caching it (its storage is too big)."""
+        self.live -= 1
+        self.evictions += 1
+        self._clear(obj)
+
+    def fill(self, obj, key=None):
+        """Add a newly initialised obj to the calling thread's bins."""
+        self._bins().add(key, obj)
+
+    def clear(self):
+        """Release the overflow and every thread's cached objects."""
+        with self._lock:
+            self._generation += 1
+            self._overflow.release()
+        # The calling thread's bins go now, other threads' bins are
+        # dropped the next time they use the pool.
+        self._bins()
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'fill': self._bins().count + self._overflow.count,
+            'live': self.live,
+            'peak': self.peak,
+        }
+
+    def reset_stats(self):
+        self.hits = self.misses = self.evictions = 0
+        self.peak = self.live
+
+
+_mpz_pool = _Pool('mpz', gmp.mpz_clear)
+_mpq_pool = _Pool('mpq', gmp.mpq_clear)
+_mpfr_pool = _Pool('mpfr', gmp.mpfr_clear)
+_mpc_pool = _Pool('mpc', gmp.mpc_clear)
+_pools = [_mpz_pool, _mpq_pool, _mpfr_pool, _mpc_pool]
+
+
+# MPZ
 def _new_mpz():
     """Return an initialized mpz_t."""
-    global in_mpz_cache
-
-    if in_mpz_cache:
-        in_mpz_cache -= 1
-        return mpz_cache[in_mpz_cache]
-    else:
+    mpz = _mpz_pool.get()
+    if mpz is None:
         mpz = ffi.new("mpz_t")
         gmp.mpz_init(mpz)
-        return mpz
+    return mpz
 
 
 def _del_mpz(mpz):
-    global in_mpz_cache
+    if mpz._mp_alloc > cache_obsize:
+        # Free the oversized limb buffer but keep the mpz_t
+        gmp.mpz_realloc2(mpz, 0)
+        _mpz_pool.evictions += 1
+    _mpz_pool.put(mpz)
 
-    if in_mpz_cache < cache_size:
-        if ffi.sizeof(mpz[0]) <= cache_obsize:
-            mpz_cache[in_mpz_cache] = mpz
-        else:
-            mpz_cache[in_mpz_cache] = ffi.new('mpz_t')
-        in_mpz_cache += 1
-    else:
-        gmp.mpz_clear(mpz)
 
 # MPQ
-def _init_mpq_cache():
-    global mpq_cache, in_mpq_cache
-    mpq_cache = []
-    in_mpq_cache = cache_size
-    for _ in xrange(cache_size):
-        mpq = ffi.new("mpq_t")
-        gmp.mpq_init(mpq)
-        mpq_cache.append(mpq)
-_init_mpq_cache()
-
-
 def _new_mpq():
     """Return an initialized mpq_t."""
-    global in_mpq_cache
-
-    if in_mpq_cache:
-        in_mpq_cache -= 1
-        return mpq_cache[in_mpq_cache]
-    else:
+    mpq = _mpq_pool.get()
+    if mpq is None:
         mpq = ffi.new("mpq_t")
         gmp.mpq_init(mpq)
-        return mpq
+    return mpq
 
 
 def _del_mpq(mpq):
-    global in_mpq_cache
-
-    if in_mpq_cache < cache_size:
-        if ffi.sizeof(mpq[0]) <= cache_obsize:
-            mpq_cache[in_mpq_cache] = mpq
-        else:
-            mpq_cache[in_mpq_cache] = ffi.new('mpq_t')
-        in_mpq_cache += 1
-    else:
-        gmp.mpq_clear(mpq)
+    num, den = gmp.mpq_numref(mpq), gmp.mpq_denref(mpq)
+    if num._mp_alloc + den._mp_alloc > cache_obsize:
+        # Free the oversized limb buffers but keep the mpq_t
+        gmp.mpz_realloc2(num, 0)
+        gmp.mpz_realloc2(den, 0)
+        _mpq_pool.evictions += 1
+    _mpq_pool.put(mpq)
 
 
 # MPFR
-def _init_mpfr_cache():
-    global mpfr_cache, in_mpfr_cache
-    mpfr_cache = []
-    in_mpfr_cache = cache_size
-    for _ in xrange(cache_size):
-        mpfr = ffi.new("mpfr_t")
-        gmp.mpfr_init(mpfr)
-        mpfr_cache.append(mpfr)
-_init_mpfr_cache()
-
-
 def _new_mpfr(prec=0):
     """Return an initialized mpfr_t."""
-    global in_mpfr_cache
-
     if isinstance(prec, (int, long)):
         if not (prec == 0 or gmp.MPFR_PREC_MIN <= prec <= gmp.MPFR_PREC_MAX):
             raise ValueError("invalid prec %i (wanted %s <= prec <= %s)" % (
@@ -146,52 +358,34 @@ def _new_mpfr(prec=0):
     else:
         raise TypeError('an integer is required')
 
-    if in_mpfr_cache:
-        in_mpfr_cache -= 1
-        # Set default precision
-        if prec == 0:
-            gmp.mpfr_set_prec(mpfr_cache[in_mpfr_cache], gmp.mpfr_get_default_prec())
-        else:
-            gmp.mpfr_set_prec(mpfr_cache[in_mpfr_cache], prec)
-        return mpfr_cache[in_mpfr_cache]
-    else:
+    if prec == 0:
+        prec = get_context().precision
+
+    mpfr = _mpfr_pool.get(prec)
+    if mpfr is None:
         mpfr = ffi.new("mpfr_t")
-        if prec == 0:
-            gmp.mpfr_init(mpfr)
-        else:
-            gmp.mpfr_init2(mpfr, prec)
-        return mpfr
+        gmp.mpfr_init2(mpfr, prec)
+    return mpfr
 
 
-def _del_mpfr(mpfr):
-    global in_mpfr_cache
+def _limbs(prec):
+    """Return the number of limbs in a significand of prec bits."""
+    return (prec + _limb_bits - 1) // _limb_bits
 
-    if in_mpfr_cache < cache_size:
-        if ffi.sizeof(mpfr[0]) <= cache_obsize:
-            mpfr_cache[in_mpfr_cache] = mpfr
-        else:
-            mpfr_cache[in_mpfr_cache] = ffi.new('mpfr_t')
-        in_mpfr_cache += 1
+
+def _del_mpfr(mpfr):
+    # mpfr_set_prec never shrinks the significand, so an oversized mpfr_t
+    # is cleared rather than cached.
+    prec = gmp.mpfr_get_prec(mpfr)
+    if _limbs(prec) <= cache_obsize:
+        _mpfr_pool.put(mpfr, prec)
     else:
-        gmp.mpfr_clear(mpfr)
+        _mpfr_pool.discard(mpfr)
 
 
 # MPC
-def _init_mpc_cache():
-    global mpc_cache, in_mpc_cache
-    mpc_cache = []
-    in_mpc_cache = cache_size
-    for _ in xrange(cache_size):
-        mpc = ffi.new("mpc_t")
-        gmp.mpc_init2(mpc, gmp.mpfr_get_default_prec())
-        mpc_cache.append(mpc)
-_init_mpc_cache()
-
-
 def _new_mpc(prec=(0,0)):
     """Return an initialized mpc_t."""
-    global in_mpc_cache
-
     # prec is assumed to be checked already
     rprec, iprec = prec
 
@@ -201,42 +395,25 @@ def _new_mpc(prec=(0,0)):
                 "invalid prec (wanted prec == 0 or %s <= prec <= %s)" % (
                     gmp.MPFR_PREC_MIN, gmp.MPFR_PREC_MAX))
 
-    if in_mpc_cache:
-        in_mpc_cache -= 1
-        # Set default precision
-        if rprec == iprec:
-            if rprec  == 0:
-                gmp.mpc_set_prec(mpc_cache[in_mpc_cache], gmp.mpfr_get_default_prec())
-            else:
-                gmp.mpc_set_prec(mpc_cache[in_mpc_cache], rprec)
-        else:
-            if rprec == 0:
-                rprec = gmp.mpfr_get_default_prec()
-            if iprec == 0:
-                iprec = gmp.mpfr_get_default_prec()
-            gmp.mpc_clear(mpc_cache[in_mpc_cache])
-            gmp.mpc_init3(mpc_cache[in_mpc_cache], rprec, iprec)
-        return mpc_cache[in_mpc_cache]
-    else:
+    if rprec == 0:
+        rprec = get_context()._rprec
+    if iprec == 0:
+        iprec = get_context()._iprec
+
+    mpc = _mpc_pool.get((rprec, iprec))
+    if mpc is None:
         mpc = ffi.new("mpc_t")
-        if rprec == 0:
-            rprec = gmp.mpfr_get_default_prec()
-        if iprec == 0:
-            iprec = gmp.mpfr_get_default_prec()
         if rprec == iprec:
             gmp.mpc_init2(mpc, rprec)
         else:
             gmp.mpc_init3(mpc, rprec, iprec)
-        return mpc
+    return mpc
 
 
 def _del_mpc(mpc):
-    global in_mpc_cache
-
-    if in_mpc_cache < cache_size:
-        mpc_cache[in_mpc_cache] = mpc
-        # FIXME This doesn't seem to be working properly
-        if ffi.sizeof(mpc[0]) <= cache_obsize:
-            mpc_cache[in_mpc_cache] = mpc
-        else:
-            mpc_cache[in_mpc_cache] = ffi.new('mpc_t')
+    rprec = gmp.mpfr_get_prec(gmp.mpc_realref(mpc))
+    iprec = gmp.mpfr_get_prec(gmp.mpc_imagref(mpc))
+    if _limbs(rprec) + _limbs(iprec) <= cache_obsize:
+        _mpc_pool.put(mpc, (rprec, iprec))
+    else:
+        _mpc_pool.discard(mpc)
@@ -0,0 +1,344 @@
+import sys
+import threading
+from contextlib import contextmanager
+
+from gmpy_cffi.interface import gmp
+
+
+if sys.version > '3':
+    long = int
+    xrange = range
+
+
+RoundToNearest = gmp.MPFR_RNDN
+RoundToZero = gmp.MPFR_RNDZ
+RoundUp = gmp.MPFR_RNDU
+RoundDown = gmp.MPFR_RNDD
+RoundAwayZero = gmp.MPFR_RNDA
+Default = -1
+
+
+class RangeError(ArithmeticError):
+    """Result is not a real number or is outside the valid range."""
+
+
+class InexactResultError(ArithmeticError):
+    """Result had to be rounded."""
+
+
+class OverflowResultError(InexactResultError):
+    """Result overflowed to infinity."""
+
+
+class UnderflowResultError(InexactResultError):
+    """Result underflowed to zero."""
+
+
+class InvalidOperationError(ValueError):
+    """Result is NaN."""
+
+
+class DivisionByZeroError(ZeroDivisionError):
+    """Division by zero gave an infinite result."""
+
+
+_round_modes = (RoundToNearest, RoundToZero, RoundUp, RoundDown, RoundAwayZero)
+_round_names = {
+    RoundToNearest: 'RoundToNearest',
+    RoundToZero: 'RoundToZero',
+    RoundUp: 'RoundUp',
+    RoundDown: 'RoundDown',
+    RoundAwayZero: 'RoundAwayZero',
+    Default: 'Default',
+}
+# The rounding mode for x such that -x is rounded in the given mode
+_negated_round = {RoundUp: RoundDown, RoundDown: RoundUp}
+
+
+def _check_prec(value, default_ok):
+    if not isinstance(value, (int, long)):
+        raise TypeError('an integer is required')
+    if default_ok and value == Default:
+        return
+    if not gmp.MPFR_PREC_MIN <= value <= gmp.MPFR_PREC_MAX:
+        raise ValueError("invalid prec %i (wanted %s <= prec <= %s)" % (
+            value, gmp.MPFR_PREC_MIN, gmp.MPFR_PREC_MAX))
+
+
+def _check_round(value, default_ok):
+    if not isinstance(value, (int, long)):
+        raise TypeError('an integer is required')
+    if default_ok and value == Default:
+        return
+    if value not in _round_modes:
+        raise ValueError("invalid value for rounding mode")
+
+
+# (name, bit, MPFR flag test, exception), in the order traps are raised
+_flag_info = (
+    ('invalid', 1, gmp.mpfr_nanflag_p, InvalidOperationError),
+    ('divzero', 2, gmp.mpfr_divby0_p, DivisionByZeroError),
+    ('overflow', 4, gmp.mpfr_overflow_p, OverflowResultError),
+    ('underflow', 8, gmp.mpfr_underflow_p, UnderflowResultError),
+    ('erange', 16, gmp.mpfr_erangeflag_p, RangeError),
+    ('inexact', 32, gmp.mpfr_inexflag_p, InexactResultError),
+)
+
+
+def _mpfr_flags():
+    """Return the MPFR flags raised in this thread as a bit mask."""
+    bits = 0
+    for _, bit, test, _ in _flag_info:
+        if test():
+            bits |= bit
+    return bits
+
+
+def _setting(name, check, default_ok):
+    attr = '_' + name
+
+    def fget(self):
+        return getattr(self, attr)
+
+    def fset(self, value):
+        check(value, default_ok)
+        setattr(self, attr, value)
+        self._resolve()
+
+    return property(fget, fset)
+
+
+def _flag(bit):
+    def fget(self):
+        if self._is_current():
+            self._harvest()
+        return bool(self._flags & bit)
+
+    def fset(self, value):
+        if self._is_current():
+            self._harvest()
+        if value:
+            self._flags |= bit
+        else:
+            self._flags &= ~bit
+
+    return property(fget, fset)
+
+
+def _trap(bit):
+    def fget(self):
+        return bool(self._traps & bit)
+
+    def fset(self, value):
+        # Flags raised before the trap was set must not trigger it
+        if self._is_current():
+            self._harvest()
+        if value:
+            self._traps |= bit
+        else:
+            self._traps &= ~bit
+
+    return property(fget, fset)
+
+
+class context(object):
+    """
+    context(**kwargs) -> context
+
+    Return a new context for controlling MPFR and MPC arithmetic. The
+    keyword arguments set the corresponding attributes:
+
+        precision:  precision, in bits, of an mpfr result (default 53)
+        real_prec:  precision of the real part of an mpc result; Default
+                    uses 'precision'
+        imag_prec:  precision of the imaginary part of an mpc result;
+                    Default uses 'real_prec'
+        round:      rounding mode of mpfr results (default RoundToNearest)
+        real_round: rounding mode of the real part of mpc results;
+                    Default uses 'round'
+        imag_round: rounding mode of the imaginary part of mpc results;
+                    Default uses 'real_round'
+        trap_invalid, trap_divzero, trap_overflow, trap_underflow,
+        trap_erange, trap_inexact:
+                    raise InvalidOperationError, DivisionByZeroError,
+                    OverflowResultError, UnderflowResultError, RangeError
+                    or InexactResultError when an mpfr or mpc result
+                    raises the corresponding flag (default False)
+
+    The flags invalid, divzero, overflow, underflow, erange and inexact
+    are sticky: they record every exception raised by MPFR while the
+    context was current, until clear_flags() is called. Reading them is
+    cheap enough to do once per batch of operations, and arithmetic is
+    only slowed down while a trap is enabled.
+
+    A context only takes effect once it is made the current context with
+    set_context() or local_context().
+    """
+    _settings = ('precision', 'real_prec', 'imag_prec',
+                 'round', 'real_round', 'imag_round') + tuple(
+                 'trap_' + name for name, _, _, _ in _flag_info)
+
+    __slots__ = ('_precision', '_real_prec', '_imag_prec', '_round',
+                 '_real_round', '_imag_round', '_rprec', '_iprec',
+                 '_rround', '_iround', '_mpc_round', '_flags', '_traps')
+
+    def __init__(self, **kwargs):
+        self._precision = 53
+        self._real_prec = self._imag_prec = Default
+        self._round = RoundToNearest
+        self._real_round = self._imag_round = Default
+        self._flags = self._traps = 0
+        self._resolve()
+        for name, value in kwargs.items():
+            if name not in self._settings:
+                raise ValueError("invalid keyword arguments for context")
+            setattr(self, name, value)
+
+    precision = _setting('precision', _check_prec, False)
+    real_prec = _setting('real_prec', _check_prec, True)
+    imag_prec = _setting('imag_prec', _check_prec, True)
+    round = _setting('round', _check_round, False)
+    real_round = _setting('real_round', _check_round, True)
+    imag_round = _setting('imag_round', _check_round, True)
+
+    invalid = _flag(1)
+    divzero = _flag(2)
+    overflow = _flag(4)
+    underflow = _flag(8)
+    erange = _flag(16)
+    inexact = _flag(32)
+
+    trap_invalid = _trap(1)
+    trap_divzero = _trap(2)
+    trap_overflow = _trap(4)
+    trap_underflow = _trap(8)
+    trap_erange = _trap(16)
+    trap_inexact = _trap(32)
+
+    def _resolve(self):
+        # Work out the effective mpc settings once, not on every operation
+        rprec = self._real_prec
+        self._rprec = self._precision if rprec == Default else rprec
+        iprec = self._imag_prec
+        self._iprec = self._rprec if iprec == Default else iprec
+        rround = self._real_round
+        self._rround = self._round if rround == Default else rround
+        iround = self._imag_round
+        self._iround = self._rround if iround == Default else iround
+        # MPC_RND(real, imag)
+        self._mpc_round = self._rround + (self._iround << 4)
+
+    def _is_current(self):
+        return getattr(_local, 'context', None) is self
+
+    def _harvest(self):
+        """Move the thread's MPFR flags into this context's flags."""
+        self._flags |= _mpfr_flags()
+        gmp.mpfr_clear_flags()
+
+    def _check_traps(self):
+        """Raise the exception for any trapped flag raised by MPFR."""
+        raised = _mpfr_flags()
+        if raised & self._traps:
+            self._flags |= raised
+            gmp.mpfr_clear_flags()
+            for name, bit, _, exc in _flag_info:
+                if raised & self._traps & bit:
+                    raise exc("'%s' flag was raised" % name)
+
+    def clear_flags(self):
+        """
+        context.clear_flags()
+
+        Clear all the flags of the context.
+        """
+        if self._is_current():
+            gmp.mpfr_clear_flags()
+        self._flags = 0
+
+    def copy(self):
+        """
+        context.copy() -> context
+
+        Return a copy of the context's settings and traps; the flags of
+        the copy are clear.
+        """
+        return context(**dict((name, getattr(self, name))
+                              for name in self._settings))
+
+    def __repr__(self):
+        items = []
+        for name in self._settings:
+            value = getattr(self, name)
+            if name.endswith('round') or value == Default:
+                value = _round_names[value]
+            items.append('%s=%s' % (name, value))
+        flags = [name for name, _, _, _ in _flag_info if getattr(self, name)]
+        items.append('flags=[%s]' % ', '.join(flags))
+        return 'context(%s)' % ', '.join(items)
+
+
+_local = threading.local()
+
+
+def get_context():
+    """
+    get_context() -> context
+
+    Return a reference to the current context of the calling thread. Each
+    thread starts with a default context.
+    """
+    try:
+        return _local.context
+    except AttributeError:
+        ctx = _local.context = context()
+        return ctx
+
+
+def set_context(ctx):
+    """
+    set_context(context)
+
+    Make context the current context of the calling thread. Changes made
+    to context afterwards apply to that thread's arithmetic.
+    """
+    if not isinstance(ctx, context):
+        raise TypeError("set_context() requires a context argument")
+    get_context()._harvest()
+    _local.context = ctx
+
+
+@contextmanager
+def local_context(*args, **kwargs):
+    """
+    local_context([context[, **kwargs]]) -> context manager
+
+    Use a copy of context (or of the current context if none is given),
+    updated with the keyword arguments, as the current context for the
+    duration of a 'with' statement, then restore the previous context.
+    The flags raised inside the block are left on the new context.
+
+        >>> with local_context(precision=100) as ctx:
+        ...     x = mpfr(1) / 3
+    """
+    if len(args) > 1:
+        raise TypeError("local_context() takes at most 1 positional argument")
+    if args:
+        if not isinstance(args[0], context):
+            raise TypeError("local_context() requires a context argument")
+        ctx = args[0].copy()
+    else:
+        ctx = get_context().copy()
+    for name, value in kwargs.items():
+        if name not in context._settings:
+            raise ValueError("invalid keyword arguments for local_context()")
+        setattr(ctx, name, value)
+
+    saved = get_context()
+    saved._harvest()
+    _local.context = ctx
+    try:
+        yield ctx
+    finally:
+        ctx._harvest()
+        _local.context = saved
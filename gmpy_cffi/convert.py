@@ -1,8 +1,11 @@
 import sys
 import array
+from binascii import hexlify
+from fractions import Fraction
 from math import log10
 
 from gmpy_cffi.interface import gmp, ffi
+from gmpy_cffi.context import get_context
 
 
 MAX_UI = 2 * sys.maxsize + 1
@@ -26,7 +29,7 @@ def _pyint_to_mpz(n, a):
     elif sys.maxsize < n <= MAX_UI:
         gmp.mpz_set_ui(a, n)
     else:
-        gmp.mpz_set_str(a, hex(n).rstrip('L').encode('UTF-8'), 0)
+        _pylong_to_mpz(n, a)
 
 
 def _pylong_to_mpz(n, a):
@@ -36,7 +39,16 @@ def _pylong_to_mpz(n, a):
     :type n: long
     :type a: mpz_t
     """
-    gmp.mpz_set_str(a, hex(n).rstrip('L').encode('UTF-8'), 0)
+    if PY3:
+        # Raw big-endian bytes, linear in the size of n
+        m = abs(n)
+        count = (m.bit_length() + 7) // 8
+        buf = m.to_bytes(count, 'big')
+        gmp.mpz_import(a, count, 1, 1, 1, 0, ffi.from_buffer(buf))
+        if n < 0:
+            gmp.mpz_neg(a, a)
+    else:
+        gmp.mpz_set_str(a, hex(n).rstrip('L').encode('UTF-8'), 0)
 
 
 def _mpz_to_pylong(a):
@@ -47,14 +59,17 @@ def _mpz_to_pylong(a):
     :rtype: long
     """
 
-    size = ffi.sizeof('uint64_t')
-    numb = 8 * size
-    count = (gmp.mpz_sizeinbase(a, 2) + numb - 1) // numb
-    p = ffi.new('uint64_t[]', count)
-    gmp.mpz_export(p, ffi.NULL, 1, size, 0, 0, a)
-    res = 0
-    for n in p:
-        res = (res << numb) + n
+    size = gmp.mpz_sizeinbase(a, 256)
+    p = ffi.new('unsigned char[]', size)
+    countp = ffi.new('size_t *')
+    gmp.mpz_export(p, countp, 1, 1, 1, 0, a)
+    buf = ffi.buffer(p, countp[0])
+    if PY3:
+        res = int.from_bytes(buf, 'big')
+    elif countp[0]:
+        res = long(hexlify(buf[:]), 16)
+    else:
+        res = 0
 
     return res * gmp.mpz_sgn(a)
 
@@ -114,15 +129,15 @@ def _str_to_mpq(s, base, a):
 
 def _pyint_to_mpfr(n, a):
     if -sys.maxsize - 1 <= n <= sys.maxsize:
-        gmp.mpfr_set_si(a, n, gmp.MPFR_RNDN)
+        gmp.mpfr_set_si(a, n, get_context().round)
     elif sys.maxsize < n <= MAX_UI:
-        gmp.mpfr_set_ui(a, n, gmp.MPFR_RNDN)
+        gmp.mpfr_set_ui(a, n, get_context().round)
     else:
         assert isinstance(n, long)
         tmp_mpz = ffi.new('mpz_t')
         gmp.mpz_init(tmp_mpz)
         _pylong_to_mpz(n, tmp_mpz)
-        gmp.mpfr_set_z(a, tmp_mpz, gmp.MPFR_RNDN)
+        gmp.mpfr_set_z(a, tmp_mpz, get_context().round)
         gmp.mpz_clear(tmp_mpz)
 
 
@@ -143,7 +158,8 @@ def _mpfr_to_str(a):
 def _str_to_mpfr(s, base, a):
     if isinstance(base, (int, long)):
         if base == 0 or 2 <= base <= 62:
-            if gmp.mpfr_set_str(a, s.encode('UTF-8'), base, gmp.MPFR_RNDN) == -1:
+            if gmp.mpfr_set_str(a, s.encode('UTF-8'), base,
+                                get_context().round) == -1:
                 raise ValueError(
                     "Can't create mpfr from %s with base %s" % (s, base))
         else:
@@ -175,8 +191,128 @@ def _str_to_mpc(s, base, a):
     s = '(' + s + ')'
 
     if 2 <= base <= 36:
-        if gmp.mpc_set_str(a, s.encode('UTF-8'), base, gmp.MPC_RNDNN) == -1:
+        if gmp.mpc_set_str(a, s.encode('UTF-8'), base,
+                           get_context()._mpc_round) == -1:
             raise ValueError("invalid string in mpc()")
     else:
         raise ValueError(
             "base for mpc() must be in the interval 2 ... 36.")
+
+
+# Hashing, compatible with the hashes of Python's numeric types. On
+# Python 3 these are computed modulo the prime P = sys.hash_info.modulus
+# directly from the GMP/MPFR values, see "Hashing of numeric types" in
+# the Python documentation.
+if PY3:
+    _HASH_MODULUS = sys.hash_info.modulus
+    _HASH_BITS = _HASH_MODULUS.bit_length()
+    _HASH_INF = sys.hash_info.inf
+    _HASH_IMAG = sys.hash_info.imag
+    _HASH_WIDTH = sys.hash_info.width
+    # P does not fit in a C unsigned long on LLP64 platforms (Windows)
+    if _HASH_MODULUS >> (8 * ffi.sizeof('unsigned long')):
+        _hash_modulus = ffi.new('mpz_t')
+        gmp.mpz_init(_hash_modulus)
+        _pylong_to_mpz(_HASH_MODULUS, _hash_modulus)
+    else:
+        _hash_modulus = None
+else:
+    _HASH_IMAG = 1000003
+    _HASH_WIDTH = sys.maxsize.bit_length() + 1
+
+
+def _hash_mod(a):
+    """
+    Return abs(a) % P.
+
+    :type a: mpz_t
+    """
+    if _hash_modulus is None:
+        return gmp.mpz_tdiv_ui(a, _HASH_MODULUS)
+    r = ffi.new('mpz_t')
+    gmp.mpz_init(r)
+    gmp.mpz_tdiv_r(r, a, _hash_modulus)
+    h = abs(_mpz_to_pylong(r))
+    gmp.mpz_clear(r)
+    return h
+
+
+def _mpz_hash(a):
+    """
+    Return hash(int(a)).
+
+    :type a: mpz_t
+    """
+    if not PY3:
+        return hash(_mpz_to_pylong(a))
+    h = _hash_mod(a)
+    if gmp.mpz_sgn(a) < 0:
+        h = -h
+    return -2 if h == -1 else h
+
+
+def _mpq_hash(a):
+    """
+    Return hash(Fraction(a)).
+
+    :type a: mpq_t
+    """
+    num, den = gmp.mpq_numref(a), gmp.mpq_denref(a)
+    if not PY3:
+        return hash(Fraction(_mpz_to_pylong(num), _mpz_to_pylong(den)))
+    # den is invertible mod P unless P divides it
+    dinv = pow(_hash_mod(den), _HASH_MODULUS - 2, _HASH_MODULUS)
+    if not dinv:
+        h = _HASH_INF
+    else:
+        h = _hash_mod(num) * dinv % _HASH_MODULUS
+    if gmp.mpz_sgn(num) < 0:
+        h = -h
+    return -2 if h == -1 else h
+
+
+def _mpfr_hash(a):
+    """
+    Return hash(float(a)) if a is exactly representable as a float,
+    otherwise the hash of the exact rational value of a. a must not be
+    NaN.
+
+    :type a: mpfr_t
+    """
+    if not PY3:
+        return hash(gmp.mpfr_get_d(a, gmp.MPFR_RNDN))
+    if gmp.mpfr_inf_p(a):
+        return -_HASH_INF if gmp.mpfr_signbit(a) else _HASH_INF
+    if gmp.mpfr_zero_p(a):
+        return 0
+    # a == m * 2**e and 2**_HASH_BITS == 1 (mod P)
+    m = ffi.new('mpz_t')
+    gmp.mpz_init(m)
+    e = gmp.mpfr_get_z_2exp(m, a)
+    h = _hash_mod(m)
+    h = (h << (e % _HASH_BITS)) % _HASH_MODULUS
+    if gmp.mpz_sgn(m) < 0:
+        h = -h
+    gmp.mpz_clear(m)
+    return -2 if h == -1 else h
+
+
+def _nan_hash(obj):
+    """
+    Return the hash of a NaN held by obj, matching float('nan').
+    """
+    if sys.version_info >= (3, 10):
+        # NaNs are never equal, so they hash by identity
+        return object.__hash__(obj)
+    return 0
+
+
+def _complex_hash(real_hash, imag_hash):
+    """
+    Return the hash of a complex number from the hashes of its parts.
+    """
+    # Unsigned machine word arithmetic, as CPython does
+    h = (real_hash + _HASH_IMAG * imag_hash) % (1 << _HASH_WIDTH)
+    if h >= 1 << (_HASH_WIDTH - 1):
+        h -= 1 << _HASH_WIDTH
+    return -2 if h == -1 else h
@@ -0,0 +1,424 @@
+"""
+Integer factorisation.
+
+factorint() divides out small primes by trial division, then splits the
+remaining composites with Pollard's p-1 method, Brent's variant of
+Pollard's rho method and finally the elliptic curve method (ECM, stage 1
+with Montgomery curves), raising the ECM bounds until a factor is
+found. Factors are tested with is_prime(), so they are probable primes.
+"""
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from gmpy_cffi.interface import gmp
+from gmpy_cffi.mpz import mpz
+from gmpy_cffi.cache import _new_mpz, _del_mpz
+from gmpy_cffi.ntheory import _check_mpz, is_prime, gcd
+from gmpy_cffi.sieve import primerange
+
+
+if sys.version > '3':
+    long = int
+    xrange = range
+
+
+class FactorTimeoutError(ArithmeticError):
+    """
+    Raised when factorint() or factor() runs out of time. factors holds
+    the prime factors found so far, as returned by factorint(), and
+    cofactor the part of n left unfactored.
+    """
+
+    def __init__(self, factors, cofactor):
+        ArithmeticError.__init__(
+            self, 'factorisation timed out with cofactor %s' % cofactor)
+        self.factors = factors
+        self.cofactor = cofactor
+
+
+class _Timeout(Exception):
+    pass
+
+
+_TRIAL_LIMIT = 1 << 14
+_PM1_BOUND = 10000
+_RHO_ITERATIONS = 1 << 16
+# (B1, number of curves) for each ECM stage; the last stage repeats
+_ECM_STAGES = [(2000, 25), (11000, 90), (50000, 300), (250000, 700),
+               (1000000, 1800)]
+
+_cache = OrderedDict()
+_cache_size = 1000
+_cache_lock = threading.Lock()
+
+_primes = []
+_primes_limit = 1
+
+
+def _primes_upto(limit):
+    """Return the list of primes <= limit (and possibly some more)."""
+    global _primes, _primes_limit
+    if limit > _primes_limit:
+        limit = max(limit, 2 * _primes_limit)
+        _primes = list(primerange(2, limit + 1))
+        _primes_limit = limit
+    return _primes
+
+
+def _bits(n):
+    return gmp.mpz_sizeinbase(n._mpz, 2)
+
+
+def _check_deadline(deadline):
+    if deadline is not None and time.time() > deadline:
+        raise _Timeout
+
+
+def _trial_division(n, factors):
+    """
+    Divide the small prime factors out of n, recording them in factors.
+    Return the cofactor.
+    """
+    for p in _primes_upto(_TRIAL_LIMIT):
+        if p > _TRIAL_LIMIT or p * p > n:
+            break
+        if gmp.mpz_tdiv_ui(n._mpz, p) == 0:
+            res = _new_mpz()
+            factors[mpz(p)] = gmp.mpz_remove(res, n._mpz, mpz(p)._mpz)
+            n = mpz._from_c_mpz(res)
+    if 1 < n < _TRIAL_LIMIT ** 2:
+        # n has no factor <= sqrt(n), so it is prime
+        factors[n] = 1
+        n = mpz(1)
+    return n
+
+
+def _perfect_power(n):
+    """Return (r, k) with n == r**k and k > 1 maximal, or (n, 1)."""
+    if not gmp.mpz_perfect_power_p(n._mpz):
+        return n, 1
+    bits = _bits(n)
+    res = _new_mpz()
+    for k in _primes_upto(bits):
+        if k > bits:
+            break
+        if gmp.mpz_root(res, n._mpz, k):
+            r, j = _perfect_power(mpz._from_c_mpz(res))
+            return r, j * k
+    _del_mpz(res)
+    return n, 1
+
+
+def _pm1(n, bound, deadline):
+    """Pollard's p-1 method, stage 1 only."""
+    a = mpz(2)
+    for i, p in enumerate(_primes_upto(bound)):
+        if p > bound:
+            break
+        q = p
+        while q * p <= bound:
+            q *= p
+        a = pow(a, q, n)
+        if i % 256 == 0:
+            _check_deadline(deadline)
+    g = gcd(a - 1, n)
+    if 1 < g < n:
+        return g
+    return None
+
+
+def _rho(n, c, iterations, deadline):
+    """
+    Brent's variant of Pollard's rho method with x -> x**2 + c, taking
+    the gcd of products of 128 differences at a time.
+    """
+    mul, add_ui, sub, mod = (gmp.mpz_mul, gmp.mpz_add_ui, gmp.mpz_sub,
+                             gmp.mpz_fdiv_r)
+    n = n._mpz
+    tmp = x, y, ys, q, t, g = [_new_mpz() for i in xrange(6)]
+    try:
+        gmp.mpz_set_ui(y, 2)
+        gmp.mpz_set_ui(q, 1)
+        gmp.mpz_set_ui(g, 1)
+        r, m = 1, 128
+        while gmp.mpz_cmp_ui(g, 1) == 0:
+            gmp.mpz_set(x, y)
+            for i in xrange(r):
+                mul(y, y, y)
+                add_ui(y, y, c)
+                mod(y, y, n)
+            k = 0
+            while k < r and gmp.mpz_cmp_ui(g, 1) == 0:
+                gmp.mpz_set(ys, y)
+                for i in xrange(min(m, r - k)):
+                    mul(y, y, y)
+                    add_ui(y, y, c)
+                    mod(y, y, n)
+                    sub(t, x, y)
+                    mul(q, q, t)
+                    mod(q, q, n)
+                gmp.mpz_gcd(g, q, n)
+                k += m
+            r *= 2
+            if r > iterations:
+                return None
+            _check_deadline(deadline)
+        if gmp.mpz_cmp(g, n) == 0:
+            # The product overshot: redo the last batch one step at a time
+            while gmp.mpz_cmp_ui(g, 1) == 0 or gmp.mpz_cmp(g, n) == 0:
+                mul(ys, ys, ys)
+                add_ui(ys, ys, c)
+                mod(ys, ys, n)
+                sub(t, x, ys)
+                gmp.mpz_gcd(g, t, n)
+                if gmp.mpz_cmp(g, n) == 0:
+                    return None
+        res = _new_mpz()
+        gmp.mpz_set(res, g)
+        return mpz._from_c_mpz(res)
+    finally:
+        for a in tmp:
+            _del_mpz(a)
+
+
+# Montgomery curve arithmetic on projective x-coordinates (X : Z), on
+# mpz_t values. The results may share storage with the inputs; t1, t2
+# and t3 are scratch.
+
+def _xdbl(x2, z2, x, z, n, a24, t1, t2):
+    """(x2 : z2) = 2 * (x : z)"""
+    mul, add, sub, mod = gmp.mpz_mul, gmp.mpz_add, gmp.mpz_sub, gmp.mpz_fdiv_r
+    add(t1, x, z)
+    mul(t1, t1, t1)
+    sub(t2, x, z)
+    mul(t2, t2, t2)
+    mul(x2, t1, t2)
+    mod(x2, x2, n)
+    sub(t1, t1, t2)
+    mul(z2, a24, t1)
+    add(z2, z2, t2)
+    mul(z2, z2, t1)
+    mod(z2, z2, n)
+
+
+def _xadd(x3, z3, x1, z1, x2, z2, xd, zd, n, t1, t2, t3):
+    """(x3 : z3) = (x1 : z1) + (x2 : z2), given their difference (xd : zd)"""
+    mul, add, sub, mod = gmp.mpz_mul, gmp.mpz_add, gmp.mpz_sub, gmp.mpz_fdiv_r
+    sub(t1, x1, z1)
+    add(t2, x2, z2)
+    mul(t1, t1, t2)
+    add(t2, x1, z1)
+    sub(t3, x2, z2)
+    mul(t2, t2, t3)
+    add(t3, t1, t2)
+    mul(t3, t3, t3)
+    mul(t3, t3, zd)
+    sub(t1, t1, t2)
+    mul(t1, t1, t1)
+    mul(z3, t1, xd)
+    mod(z3, z3, n)
+    mod(x3, t3, n)
+
+
+def _ladder(x, z, k, n, a24, tmp):
+    """Set (x : z) to k * (x : z). tmp holds 7 scratch mpz_t."""
+    x0, z0, x1, z1, t1, t2, t3 = tmp
+    gmp.mpz_set(x0, x)
+    gmp.mpz_set(z0, z)
+    _xdbl(x1, z1, x, z, n, a24, t1, t2)
+    for bit in bin(k)[3:]:
+        if bit == '1':
+            _xadd(x0, z0, x1, z1, x0, z0, x, z, n, t1, t2, t3)
+            _xdbl(x1, z1, x1, z1, n, a24, t1, t2)
+        else:
+            _xadd(x1, z1, x0, z0, x1, z1, x, z, n, t1, t2, t3)
+            _xdbl(x0, z0, x0, z0, n, a24, t1, t2)
+    gmp.mpz_set(x, x0)
+    gmp.mpz_set(z, z0)
+
+
+def _ecm(n, bound, sigma, deadline):
+    """
+    Stage 1 of the elliptic curve method on the Montgomery curve given
+    by Suyama's parametrisation with sigma.
+    """
+    u = (sigma * sigma - 5) % n
+    v = 4 * sigma % n
+    x, z = pow(u, 3, n), pow(v, 3, n)
+    # a24 = (A + 2) / 4 = (v - u)**3 * (3u + v) / (16 u**3 v)
+    den = 16 * x * v % n
+    g = gcd(den, n)
+    if g > 1:
+        return g if g < n else None
+    inverse = _new_mpz()
+    gmp.mpz_invert(inverse, den._mpz, n._mpz)
+    a24 = pow(v - u, 3, n) * (3 * u + v) * mpz._from_c_mpz(inverse) % n
+
+    tmp = [_new_mpz() for i in xrange(9)]
+    px, pz = tmp[7:]
+    gmp.mpz_set(px, x._mpz)
+    gmp.mpz_set(pz, z._mpz)
+    n, a24 = n._mpz, a24._mpz
+    try:
+        k = 1
+        for p in _primes_upto(bound):
+            if p > bound:
+                break
+            q = p
+            while q * p <= bound:
+                q *= p
+            k *= q
+            if k.bit_length() > 4096:
+                _ladder(px, pz, k, n, a24, tmp[:7])
+                k = 1
+                _check_deadline(deadline)
+        _ladder(px, pz, k, n, a24, tmp[:7])
+        gmp.mpz_gcd(px, pz, n)
+        if gmp.mpz_cmp_ui(px, 1) > 0 and gmp.mpz_cmp(px, n) < 0:
+            res = _new_mpz()
+            gmp.mpz_set(res, px)
+            return mpz._from_c_mpz(res)
+        return None
+    finally:
+        for a in tmp:
+            _del_mpz(a)
+
+
+def _split(n, deadline):
+    """
+    Return a nontrivial factor of n, which must be composite, not a
+    perfect power and free of small factors.
+    """
+    d = _pm1(n, _PM1_BOUND, deadline)
+    if d is not None:
+        return d
+    for c in (1, 3, 5):
+        d = _rho(n, c, _RHO_ITERATIONS, deadline)
+        if d is not None:
+            return d
+    sigma = 6
+    stage = 0
+    while True:
+        bound, curves = _ECM_STAGES[stage]
+        for i in xrange(curves):
+            d = _ecm(n, bound, sigma, deadline)
+            sigma += 1
+            if d is not None:
+                return d
+        stage = min(stage + 1, len(_ECM_STAGES) - 1)
+
+
+def _cache_get(n):
+    with _cache_lock:
+        factors = _cache.pop(n, None)
+        if factors is not None:
+            # Move to the end as the most recently used
+            _cache[n] = factors
+    return factors
+
+
+def _cache_put(n, factors):
+    with _cache_lock:
+        _cache[n] = factors
+        while len(_cache) > _cache_size:
+            _cache.popitem(last=False)
+
+
+def _add(factors, p, k):
+    factors[p] = factors.get(p, 0) + k
+
+
+def factorint(n, timeout=None):
+    """
+    factorint(n[, timeout=None]) -> dict
+
+    Return the prime factorisation of the positive integer n as a dict
+    mapping each prime factor (an mpz, in increasing order) to its
+    multiplicity. If timeout is given and the factorisation takes longer
+    than that many seconds, FactorTimeoutError is raised with the factors
+    found so far. Results are cached, see clear_factor_cache().
+
+        >>> factorint(2**64 + 1)
+        {mpz(274177): 1, mpz(67280421310721): 1}
+    """
+    n = _check_mpz('factorint', 'n', n)
+    if type(n) is not mpz:
+        # An xmpz is mutable, so it cannot be a cache key
+        n = mpz(n)
+    if n < 1:
+        raise ValueError('factorint() requires a positive integer')
+    if timeout is not None:
+        if not isinstance(timeout, (int, long, float)):
+            raise TypeError('timeout must be a number')
+        if timeout < 0:
+            raise ValueError('timeout must not be negative')
+        deadline = time.time() + timeout
+    else:
+        deadline = None
+
+    cached = _cache_get(n)
+    if cached is not None:
+        return dict(cached)
+
+    factors = {}
+    pending = [(_trial_division(n, factors), 1)]
+    while pending:
+        c, k = pending.pop()
+        if c == 1:
+            continue
+        cached = _cache_get(c)
+        if cached is not None:
+            for p, j in cached.items():
+                _add(factors, p, j * k)
+        elif is_prime(c):
+            _add(factors, c, k)
+        else:
+            r, j = _perfect_power(c)
+            if j > 1:
+                pending.append((r, j * k))
+                continue
+            try:
+                d = _split(c, deadline)
+            except _Timeout:
+                cofactor = c ** k
+                for c, k in pending:
+                    cofactor *= c ** k
+                raise FactorTimeoutError(dict(_sorted(factors)), cofactor)
+            pending.append((d, k))
+            pending.append((c // d, k))
+
+    result = _sorted(factors)
+    _cache_put(n, result)
+    return dict(result)
+
+
+def _sorted(factors):
+    return OrderedDict(sorted(factors.items()))
+
+
+def factor(n, timeout=None):
+    """
+    factor(n[, timeout=None]) -> list
+
+    Return the prime factors of the positive integer n in increasing
+    order, repeated according to their multiplicity. See factorint().
+
+        >>> factor(360)
+        [mpz(2), mpz(2), mpz(2), mpz(3), mpz(3), mpz(5)]
+    """
+    res = []
+    for p, k in factorint(n, timeout).items():
+        res.extend([p] * k)
+    return res
+
+
+def clear_factor_cache():
+    """
+    clear_factor_cache()
+
+    Forget the cached results of factorint() and factor().
+    """
+    with _cache_lock:
+        _cache.clear()
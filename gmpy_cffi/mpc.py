@@ -1,7 +1,11 @@
 import sys
 
+import gmpy_cffi
 from gmpy_cffi.interface import ffi, gmp
-from gmpy_cffi.convert import _str_to_mpc, _mpc_to_str, _pyint_to_mpfr, _pyint_to_mpz, MAX_UI
+from gmpy_cffi.context import get_context, _negated_round
+from gmpy_cffi.convert import (
+    _str_to_mpc, _mpc_to_str, _pyint_to_mpfr, _pyint_to_mpz, _mpfr_hash,
+    _complex_hash, _nan_hash, MAX_UI)
 from gmpy_cffi.mpz import mpz
 from gmpy_cffi.mpq import mpq
 from gmpy_cffi.mpfr import mpfr
@@ -25,7 +29,10 @@ def _check_prec(prec):
 class mpc(object):
     """
     """
+    __slots__ = ('_mpc', '_hash')
+
     def __init__(self, *args):
+        self._hash = None
         nargs = len(args)
         # if nargs == 1 and isinstance(args[0], self.__class__):
         #     self._mpc = args[0]._mpc
@@ -33,7 +40,7 @@ class mpc(object):
 
         if nargs == 0:
             self._mpc = ffi.gc(_new_mpc(), _del_mpc)
-            gmp.mpc_set_ui(self._mpc, 0, gmp.MPC_RNDNN)
+            gmp.mpc_set_ui(self._mpc, 0, get_context()._mpc_round)
         elif isinstance(args[0], str):   # unicode?
             # First argument is a string
             if nargs == 1:
@@ -61,10 +68,11 @@ class mpc(object):
             self._mpc = ffi.gc(_new_mpc(prec), _del_mpc)
 
             if isinstance(args[0], mpc):
-                gmp.mpc_set(self._mpc, args[0]._mpc, gmp.MPC_RNDNN)
+                gmp.mpc_set(self._mpc, args[0]._mpc, get_context()._mpc_round)
             elif isinstance(args[0], complex):
                 gmp.mpc_set_d_d(
-                    self._mpc, args[0].real, args[0].imag, gmp.MPC_RNDNN)
+                    self._mpc, args[0].real, args[0].imag,
+                    get_context()._mpc_round)
         elif isinstance(args[0], (mpfr, mpq, mpz, float, int, long)):
             # First argument is real
 
@@ -80,40 +88,49 @@ class mpc(object):
             imagref = gmp.mpc_imagref(self._mpc)
 
             if isinstance(args[0], mpfr):
-                gmp.mpfr_set(realref, args[0]._mpfr, gmp.MPFR_RNDN)
+                gmp.mpfr_set(realref, args[0]._mpfr, get_context()._rround)
             elif isinstance(args[0], mpz):
-                gmp.mpfr_set_z(realref, args[0]._mpz, gmp.MPFR_RNDN)
+                gmp.mpfr_set_z(realref, args[0]._mpz, get_context()._rround)
             elif isinstance(args[0], mpq):
-                gmp.mpfr_set_q(realref, args[0]._mpq, gmp.MPFR_RNDN)
+                gmp.mpfr_set_q(realref, args[0]._mpq, get_context()._rround)
             elif isinstance(args[0], float):
-                gmp.mpfr_set_d(realref, args[0], gmp.MPFR_RNDN)
+                gmp.mpfr_set_d(realref, args[0], get_context()._rround)
             elif isinstance(args[0], (int, long)):
                _pyint_to_mpfr(args[0], realref)
 
             if nargs >= 2:
                 # Check if second argument is real
                 if isinstance(args[1], mpfr):
-                    gmp.mpfr_set(imagref, args[1]._mpfr, gmp.MPFR_RNDN)
+                    gmp.mpfr_set(imagref, args[1]._mpfr, get_context()._iround)
                 elif isinstance(args[1], mpz):
-                    gmp.mpfr_set_z(imagref, args[1]._mpz, gmp.MPFR_RNDN)
+                    gmp.mpfr_set_z(imagref, args[1]._mpz,
+                                   get_context()._iround)
                 elif isinstance(args[1], mpq):
-                    gmp.mpfr_set_q(imagref, args[1]._mpq, gmp.MPFR_RNDN)
+                    gmp.mpfr_set_q(imagref, args[1]._mpq,
+                                   get_context()._iround)
                 elif isinstance(args[1], float):
-                    gmp.mpfr_set_d(imagref, args[1], gmp.MPFR_RNDN)
+                    gmp.mpfr_set_d(imagref, args[1], get_context()._iround)
                 elif isinstance(args[1], (int, long)):
                     _pyint_to_mpfr(args[1], imagref)
                 else:
                     raise TypeError(
                         "invalid type for imaginary component in mpc()")
             else:
-                gmp.mpfr_set_ui(imagref, 0, gmp.MPFR_RNDN)
+                gmp.mpfr_set_ui(imagref, 0, get_context()._iround)
         else:
             raise TypeError("mpc() requires numeric or string argument")
+        ctx = get_context()
+        if ctx._traps:
+            ctx._check_traps()
 
     @classmethod
     def _from_c_mpc(cls, mpc):
         inst = object.__new__(cls)
         inst._mpc = ffi.gc(mpc, _del_mpc)
+        inst._hash = None
+        ctx = get_context()
+        if ctx._traps:
+            ctx._check_traps()
         return inst
 
     @property
@@ -125,14 +142,14 @@ class mpc(object):
     @property
     def real(self):
         _tmp_mpfr = _new_mpfr()
-        gmp.mpc_real(_tmp_mpfr, self._mpc, gmp.MPC_RNDNN)
+        gmp.mpc_real(_tmp_mpfr, self._mpc, get_context().round)
         result = mpfr._from_c_mpfr(_tmp_mpfr)
         return result
 
     @property
     def imag(self):
         _tmp_mpfr = _new_mpfr()
-        gmp.mpc_imag(_tmp_mpfr, self._mpc, gmp.MPC_RNDNN)
+        gmp.mpc_imag(_tmp_mpfr, self._mpc, get_context().round)
         result = mpfr._from_c_mpfr(_tmp_mpfr)
         return result
 
@@ -141,13 +158,22 @@ class mpc(object):
 
     def __repr__(self):
         prec = self.precision
-        if prec[0] == prec[1] == gmp.mpfr_get_default_prec():
+        ctx = get_context()
+        if prec[0] == ctx._rprec and prec[1] == ctx._iprec:
             # return "mpc('" + self.__str__() + "')"
             return "mpc('{0}')".format(self)
         else:
             return "mpc('{0}',({1[0]},{1[1]}))".format(self, prec)
 
     def __eq__(self, other):
+        result = self.__eq(other)
+        # Comparisons with NaN raise the erange flag
+        ctx = get_context()
+        if ctx._traps:
+            ctx._check_traps()
+        return result
+
+    def __eq(self, other):
         # Complex Comparison
         if isinstance(other, mpc):
             return gmp.mpc_cmp(self._mpc, other._mpc) == 0
@@ -196,8 +222,29 @@ class mpc(object):
     def __ge__(self, other):
         raise TypeError('no ordering relation is defined for complex numbers')
 
+    def __reduce__(self):
+        return gmpy_cffi.from_binary, (gmpy_cffi.to_binary(self),)
+
+    def __copy__(self):
+        # Immutable
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     def __hash__(self):
-        return hash(complex(self))
+        """
+        Agrees with complex and the real types for equal values
+        """
+        if self._hash is None:
+            realref = gmp.mpc_realref(self._mpc)
+            imagref = gmp.mpc_imagref(self._mpc)
+            if gmp.mpfr_nan_p(realref) or gmp.mpfr_nan_p(imagref):
+                self._hash = _nan_hash(self)
+            else:
+                self._hash = _complex_hash(
+                    _mpfr_hash(realref), _mpfr_hash(imagref))
+        return self._hash
 
     def __float__(self):
         raise TypeError("can't covert 'mpc' to 'float'")
@@ -209,343 +256,371 @@ class mpc(object):
         raise TypeError("can't covert 'mpc' to 'long'")
 
     def __complex__(self):
-        return complex(
-            gmp.mpfr_get_d(gmp.mpc_realref(self._mpc), gmp.MPFR_RNDN),
-            gmp.mpfr_get_d(gmp.mpc_imagref(self._mpc), gmp.MPFR_RNDN))
+        res = complex(
+            gmp.mpfr_get_d(gmp.mpc_realref(self._mpc), get_context()._rround),
+            gmp.mpfr_get_d(gmp.mpc_imagref(self._mpc), get_context()._iround))
+        # Conversions record their flags but do not trap, and must not
+        # leave them to trap the next operation
+        ctx = get_context()
+        if ctx._traps:
+            ctx._harvest()
+        return res
 
     def __add__(self, other):
-        res = _new_mpc()    # TODO use context precision
+        res = _new_mpc()
         if isinstance(other, mpc):
-            gmp.mpc_add(res, self._mpc, other._mpc, gmp.MPC_RNDNN)
+            gmp.mpc_add(res, self._mpc, other._mpc, get_context()._mpc_round)
         elif isinstance(other, mpfr):
-            gmp.mpc_add_fr(res, self._mpc, other._mpfr, gmp.MPC_RNDNN)
+            gmp.mpc_add_fr(res, self._mpc, other._mpfr,
+                           get_context()._mpc_round)
         elif isinstance(other, mpq):
             gmp.mpfr_add_q(gmp.mpc_realref(res), gmp.mpc_realref(self._mpc),
-                           other._mpq, gmp.MPFR_RNDN)
+                           other._mpq, get_context()._rround)
             gmp.mpfr_set(gmp.mpc_imagref(res), gmp.mpc_imagref(self._mpc),
-                         gmp.MPFR_RNDN)
+                         get_context()._iround)
         elif isinstance(other, mpz):
             gmp.mpfr_add_z(gmp.mpc_realref(res), gmp.mpc_realref(self._mpc),
-                           other._mpz, gmp.MPFR_RNDN)
+                           other._mpz, get_context()._rround)
             gmp.mpfr_set(gmp.mpc_imagref(res), gmp.mpc_imagref(self._mpc),
-                         gmp.MPFR_RNDN)
+                         get_context()._iround)
         elif isinstance(other, complex):
             gmp.mpfr_add_d(gmp.mpc_realref(res), gmp.mpc_realref(self._mpc),
-                           other.real, gmp.MPFR_RNDN)
+                           other.real, get_context()._rround)
             gmp.mpfr_add_d(gmp.mpc_imagref(res), gmp.mpc_imagref(self._mpc),
-                           other.imag, gmp.MPFR_RNDN)
+                           other.imag, get_context()._iround)
         elif isinstance(other, float):
             gmp.mpfr_add_d(gmp.mpc_realref(res), gmp.mpc_realref(self._mpc),
-                           other, gmp.MPFR_RNDN)
+                           other, get_context()._rround)
             gmp.mpfr_set(gmp.mpc_imagref(res), gmp.mpc_imagref(self._mpc),
-                         gmp.MPFR_RNDN)
+                         get_context()._iround)
         elif isinstance(other, (int, long)):
             if 0 <= other <= MAX_UI:
-                gmp.mpc_add_ui(res, self._mpc, other, gmp.MPC_RNDNN)
+                gmp.mpc_add_ui(res, self._mpc, other, get_context()._mpc_round)
             elif -sys.maxsize-1 <= other <= sys.maxsize:
                 gmp.mpfr_add_si(gmp.mpc_realref(res),
                                 gmp.mpc_realref(self._mpc), other,
-                                gmp.MPFR_RNDN)
+                                get_context()._rround)
                 gmp.mpfr_set(gmp.mpc_imagref(res), gmp.mpc_imagref(self._mpc),
-                             gmp.MPFR_RNDN)
+                             get_context()._iround)
             else:
                 tmp_mpz = _new_mpz()
                 _pyint_to_mpz(other, tmp_mpz)
                 gmp.mpfr_add_z(gmp.mpc_realref(res),
                                gmp.mpc_realref(self._mpc), tmp_mpz,
-                               gmp.MPFR_RNDN)
+                               get_context()._rround)
                 gmp.mpfr_set(gmp.mpc_imagref(res), gmp.mpc_imagref(self._mpc),
-                         gmp.MPFR_RNDN)
+                         get_context()._iround)
                 _del_mpz(tmp_mpz)
         else:
+            _del_mpc(res)
             return NotImplemented
         return mpc._from_c_mpc(res)
 
     __radd__ = __add__
 
     def __sub__(self, other):
-        res = _new_mpc()    # TODO use context precision
+        res = _new_mpc()
         if isinstance(other, mpc):
-            gmp.mpc_sub(res, self._mpc, other._mpc, gmp.MPC_RNDNN)
+            gmp.mpc_sub(res, self._mpc, other._mpc, get_context()._mpc_round)
         elif isinstance(other, mpfr):
-            gmp.mpc_sub_fr(res, self._mpc, other._mpfr, gmp.MPC_RNDNN)
+            gmp.mpc_sub_fr(res, self._mpc, other._mpfr,
+                           get_context()._mpc_round)
         elif isinstance(other, mpq):
             gmp.mpfr_sub_q(gmp.mpc_realref(res), gmp.mpc_realref(self._mpc),
-                           other._mpq, gmp.MPFR_RNDN)
+                           other._mpq, get_context()._rround)
             gmp.mpfr_set(gmp.mpc_imagref(res), gmp.mpc_imagref(self._mpc),
-                         gmp.MPFR_RNDN)
+                         get_context()._iround)
         elif isinstance(other, mpz):
             gmp.mpfr_sub_z(gmp.mpc_realref(res), gmp.mpc_realref(self._mpc),
-                           other._mpz, gmp.MPFR_RNDN)
+                           other._mpz, get_context()._rround)
             gmp.mpfr_set(gmp.mpc_imagref(res), gmp.mpc_imagref(self._mpc),
-                         gmp.MPFR_RNDN)
+                         get_context()._iround)
         elif isinstance(other, complex):
             gmp.mpfr_sub_d(gmp.mpc_realref(res), gmp.mpc_realref(self._mpc),
-                           other.real, gmp.MPFR_RNDN)
+                           other.real, get_context()._rround)
             gmp.mpfr_sub_d(gmp.mpc_imagref(res), gmp.mpc_imagref(self._mpc),
-                           other.imag, gmp.MPFR_RNDN)
+                           other.imag, get_context()._iround)
         elif isinstance(other, float):
             gmp.mpfr_sub_d(gmp.mpc_realref(res), gmp.mpc_realref(self._mpc),
-                           other, gmp.MPFR_RNDN)
+                           other, get_context()._rround)
             gmp.mpfr_set(gmp.mpc_imagref(res), gmp.mpc_imagref(self._mpc),
-                         gmp.MPFR_RNDN)
+                         get_context()._iround)
         elif isinstance(other, (int, long)):
             if 0 <= other <= MAX_UI:
-                gmp.mpc_sub_ui(res, self._mpc, other, gmp.MPC_RNDNN)
+                gmp.mpc_sub_ui(res, self._mpc, other, get_context()._mpc_round)
             elif -sys.maxsize-1 <= other <= sys.maxsize:
                 gmp.mpfr_sub_si(gmp.mpc_realref(res),
                                 gmp.mpc_realref(self._mpc), other,
-                                gmp.MPFR_RNDN)
+                                get_context()._rround)
                 gmp.mpfr_set(gmp.mpc_imagref(res), gmp.mpc_imagref(self._mpc),
-                             gmp.MPFR_RNDN)
+                             get_context()._iround)
             else:
                 tmp_mpz = _new_mpz()
                 _pyint_to_mpz(other, tmp_mpz)
                 gmp.mpfr_sub_z(gmp.mpc_realref(res),
                                gmp.mpc_realref(self._mpc), tmp_mpz,
-                               gmp.MPFR_RNDN)
+                               get_context()._rround)
                 gmp.mpfr_set(gmp.mpc_imagref(res), gmp.mpc_imagref(self._mpc),
-                         gmp.MPFR_RNDN)
+                         get_context()._iround)
                 _del_mpz(tmp_mpz)
         else:
+            _del_mpc(res)
             return NotImplemented
         return mpc._from_c_mpc(res)
 
     def __rsub__(self, other):
-        res = _new_mpc()    # TODO use context precision
+        res = _new_mpc()
         if isinstance(other, mpfr):
-            gmp.mpc_fr_sub(res, other._mpfr, self._mpc, gmp.MPC_RNDNN)
+            gmp.mpc_fr_sub(res, other._mpfr, self._mpc,
+                           get_context()._mpc_round)
         elif isinstance(other, mpq):
+            # There is no mpfr_q_sub, so round self - q the other way
+            rnd = get_context()._rround
             gmp.mpfr_sub_q(gmp.mpc_realref(res), gmp.mpc_realref(self._mpc),
-                           other._mpq, gmp.MPFR_RNDN)
-            gmp.mpfr_neg(gmp.mpc_realref(res), gmp.mpc_realref(res),
-                         gmp.MPFR_RNDN)
-            gmp.mpfr_set(gmp.mpc_imagref(res), gmp.mpc_imagref(self._mpc),
-                         gmp.MPFR_RNDN)
+                           other._mpq, _negated_round.get(rnd, rnd))
+            gmp.mpfr_neg(gmp.mpc_realref(res), gmp.mpc_realref(res), rnd)
+            gmp.mpfr_neg(gmp.mpc_imagref(res), gmp.mpc_imagref(self._mpc),
+                         get_context()._iround)
         elif isinstance(other, mpz):
             gmp.mpfr_z_sub(gmp.mpc_realref(res), other._mpz,
-                           gmp.mpc_realref(self._mpc), gmp.MPFR_RNDN)
+                           gmp.mpc_realref(self._mpc), get_context()._rround)
             gmp.mpfr_neg(gmp.mpc_imagref(res), gmp.mpc_imagref(self._mpc),
-                         gmp.MPFR_RNDN)
+                         get_context()._iround)
         elif isinstance(other, complex):
             gmp.mpfr_d_sub(gmp.mpc_realref(res), other.real,
-                           gmp.mpc_realref(self._mpc), gmp.MPFR_RNDN)
+                           gmp.mpc_realref(self._mpc), get_context()._rround)
             gmp.mpfr_d_sub(gmp.mpc_imagref(res), other.imag,
-                           gmp.mpc_imagref(self._mpc), gmp.MPFR_RNDN)
+                           gmp.mpc_imagref(self._mpc), get_context()._iround)
         elif isinstance(other, float):
             gmp.mpfr_d_sub(gmp.mpc_realref(res), other,
-                           gmp.mpc_realref(self._mpc), gmp.MPFR_RNDN)
+                           gmp.mpc_realref(self._mpc), get_context()._rround)
             gmp.mpfr_neg(gmp.mpc_imagref(res), gmp.mpc_imagref(self._mpc),
-                         gmp.MPFR_RNDN)
+                         get_context()._iround)
         elif isinstance(other, (int, long)):
             if 0 <= other <= MAX_UI:
-                gmp.mpc_ui_sub(res, other, self._mpc, gmp.MPC_RNDNN)
+                gmp.mpc_ui_sub(res, other, self._mpc, get_context()._mpc_round)
             elif -sys.maxsize-1 <= other <= sys.maxsize:
                 gmp.mpfr_si_sub(gmp.mpc_realref(res),
                                 other, gmp.mpc_realref(self._mpc),
-                                gmp.MPFR_RNDN)
+                                get_context()._rround)
                 gmp.mpfr_neg(gmp.mpc_imagref(res), gmp.mpc_imagref(self._mpc),
-                             gmp.MPFR_RNDN)
+                             get_context()._iround)
             else:
                 tmp_mpz = _new_mpz()
                 _pyint_to_mpz(other, tmp_mpz)
                 gmp.mpfr_z_sub(gmp.mpc_realref(res),
                                tmp_mpz, gmp.mpc_realref(self._mpc),
-                               gmp.MPFR_RNDN)
+                               get_context()._rround)
                 gmp.mpfr_neg(gmp.mpc_imagref(res), gmp.mpc_imagref(self._mpc),
-                         gmp.MPFR_RNDN)
+                         get_context()._iround)
                 _del_mpz(tmp_mpz)
         else:
+            _del_mpc(res)
             return NotImplemented
         return mpc._from_c_mpc(res)
 
     def __mul__(self, other):
-        res = _new_mpc()    # TODO use context precision
+        res = _new_mpc()
         if isinstance(other, mpc):
-            gmp.mpc_mul(res, self._mpc, other._mpc, gmp.MPC_RNDNN)
+            gmp.mpc_mul(res, self._mpc, other._mpc, get_context()._mpc_round)
         elif isinstance(other, mpfr):
-            gmp.mpc_mul_fr(res, self._mpc, other._mpfr, gmp.MPC_RNDNN)
+            gmp.mpc_mul_fr(res, self._mpc, other._mpfr,
+                           get_context()._mpc_round)
         elif isinstance(other, mpq):
             gmp.mpfr_mul_q(gmp.mpc_realref(res), gmp.mpc_realref(self._mpc),
-                           other._mpq, gmp.MPFR_RNDN)
+                           other._mpq, get_context()._rround)
             gmp.mpfr_mul_q(gmp.mpc_imagref(res), gmp.mpc_imagref(self._mpc),
-                           other._mpq, gmp.MPFR_RNDN)
+                           other._mpq, get_context()._iround)
         elif isinstance(other, mpz):
             gmp.mpfr_mul_z(gmp.mpc_realref(res), gmp.mpc_realref(self._mpc),
-                           other._mpz, gmp.MPFR_RNDN)
+                           other._mpz, get_context()._rround)
             gmp.mpfr_mul_z(gmp.mpc_imagref(res), gmp.mpc_imagref(self._mpc),
-                           other._mpz, gmp.MPFR_RNDN)
+                           other._mpz, get_context()._iround)
         elif isinstance(other, complex):
-            gmp.mpc_set_d_d(res, other.real, other.imag, gmp.MPC_RNDNN)
-            gmp.mpc_mul(res, self._mpc, res, gmp.MPC_RNDNN)
+            gmp.mpc_set_d_d(res, other.real, other.imag,
+                            get_context()._mpc_round)
+            gmp.mpc_mul(res, self._mpc, res, get_context()._mpc_round)
         elif isinstance(other, float):
             gmp.mpfr_mul_d(gmp.mpc_realref(res), gmp.mpc_realref(self._mpc),
-                           other, gmp.MPFR_RNDN)
+                           other, get_context()._rround)
             gmp.mpfr_mul_d(gmp.mpc_imagref(res), gmp.mpc_imagref(self._mpc),
-                           other, gmp.MPFR_RNDN)
+                           other, get_context()._iround)
         elif isinstance(other, (int, long)):
             if -sys.maxsize-1 <= other <= sys.maxsize:
-                gmp.mpc_mul_si(res, self._mpc, other, gmp.MPC_RNDNN)
+                gmp.mpc_mul_si(res, self._mpc, other, get_context()._mpc_round)
             elif 0 <= other <= MAX_UI:
-                gmp.mpc_mul_ui(res, self._mpc, other, gmp.MPC_RNDNN)
+                gmp.mpc_mul_ui(res, self._mpc, other, get_context()._mpc_round)
             else:
                 tmp_mpz = _new_mpz()
                 _pyint_to_mpz(other, tmp_mpz)
                 gmp.mpfr_mul_z(gmp.mpc_realref(res),
                                gmp.mpc_realref(self._mpc), tmp_mpz,
-                               gmp.MPFR_RNDN)
+                               get_context()._rround)
                 gmp.mpfr_mul_z(gmp.mpc_imagref(res),
                                gmp.mpc_imagref(self._mpc), tmp_mpz,
-                               gmp.MPFR_RNDN)
+                               get_context()._iround)
                 _del_mpz(tmp_mpz)
         else:
+            _del_mpc(res)
             return NotImplemented
         return mpc._from_c_mpc(res)
 
     __rmul__ = __mul__
 
     def __truediv__(self, other):
-        res = _new_mpc()    # TODO use context precision
+        res = _new_mpc()
         if isinstance(other, mpc):
-            gmp.mpc_div(res, self._mpc, other._mpc, gmp.MPC_RNDNN)
+            gmp.mpc_div(res, self._mpc, other._mpc, get_context()._mpc_round)
         elif isinstance(other, mpfr):
-            gmp.mpc_div_fr(res, self._mpc, other._mpfr, gmp.MPC_RNDNN)
+            gmp.mpc_div_fr(res, self._mpc, other._mpfr,
+                           get_context()._mpc_round)
         elif isinstance(other, mpq):
-            gmp.mpc_set_q(res, other._mpq, gmp.MPC_RNDNN)
-            gmp.mpc_div(res, self._mpc, res, gmp.MPC_RNDNN)
+            gmp.mpc_set_q(res, other._mpq, get_context()._mpc_round)
+            gmp.mpc_div(res, self._mpc, res, get_context()._mpc_round)
         elif isinstance(other, mpz):
             gmp.mpfr_div_z(gmp.mpc_realref(res), gmp.mpc_realref(self._mpc),
-                           other._mpz, gmp.MPFR_RNDN)
+                           other._mpz, get_context()._rround)
             gmp.mpfr_div_z(gmp.mpc_imagref(res), gmp.mpc_imagref(self._mpc),
-                           other._mpz, gmp.MPFR_RNDN)
+                           other._mpz, get_context()._iround)
         elif isinstance(other, complex):
-            gmp.mpc_set_d_d(res, other.real, other.imag, gmp.MPC_RNDNN)
-            gmp.mpc_div(res, self._mpc, res, gmp.MPC_RNDNN)
+            gmp.mpc_set_d_d(res, other.real, other.imag,
+                            get_context()._mpc_round)
+            gmp.mpc_div(res, self._mpc, res, get_context()._mpc_round)
         elif isinstance(other, float):
             gmp.mpfr_div_d(gmp.mpc_realref(res), gmp.mpc_realref(self._mpc),
-                           other, gmp.MPFR_RNDN)
+                           other, get_context()._rround)
             gmp.mpfr_div_d(gmp.mpc_imagref(res), gmp.mpc_imagref(self._mpc),
-                           other, gmp.MPFR_RNDN)
+                           other, get_context()._iround)
         elif isinstance(other, (int, long)):
             if 0 <= other <= MAX_UI:
-                gmp.mpc_div_ui(res, self._mpc, other, gmp.MPC_RNDNN)
+                gmp.mpc_div_ui(res, self._mpc, other, get_context()._mpc_round)
             elif -sys.maxsize-1 <= other <= sys.maxsize:
                 gmp.mpfr_div_si(gmp.mpc_realref(res),
                                 gmp.mpc_realref(self._mpc), other,
-                                gmp.MPFR_RNDN)
+                                get_context()._rround)
                 gmp.mpfr_div_si(gmp.mpc_imagref(res),
                                 gmp.mpc_imagref(self._mpc), other,
-                                gmp.MPFR_RNDN)
+                                get_context()._iround)
             else:
                 tmp_mpz = _new_mpz()
                 _pyint_to_mpz(other, tmp_mpz)
                 gmp.mpfr_div_z(gmp.mpc_realref(res),
                                gmp.mpc_realref(self._mpc), tmp_mpz,
-                               gmp.MPFR_RNDN)
+                               get_context()._rround)
                 gmp.mpfr_div_z(gmp.mpc_imagref(res),
                                gmp.mpc_imagref(self._mpc), tmp_mpz,
-                               gmp.MPFR_RNDN)
+                               get_context()._iround)
                 _del_mpz(tmp_mpz)
         else:
+            _del_mpc(res)
             return NotImplemented
         return mpc._from_c_mpc(res)
 
     __div__ = __truediv__
 
     def __rtruediv__(self, other):
-        res = _new_mpc()    # TODO use context precision
+        res = _new_mpc()
         if isinstance(other, mpfr):
-            gmp.mpc_fr_div(res, other._mpfr, self._mpc, gmp.MPC_RNDNN)
+            gmp.mpc_fr_div(res, other._mpfr, self._mpc,
+                           get_context()._mpc_round)
         elif isinstance(other, mpq):
-            gmp.mpc_set_q(res, other._mpq, gmp.MPC_RNDNN)
-            gmp.mpc_div(res, res, self._mpc, gmp.MPC_RNDNN)
+            gmp.mpc_set_q(res, other._mpq, get_context()._mpc_round)
+            gmp.mpc_div(res, res, self._mpc, get_context()._mpc_round)
         elif isinstance(other, mpz):
-            gmp.mpc_set_z(res, other._mpz, gmp.MPC_RNDNN)
-            gmp.mpc_div(res, res, self._mpc, gmp.MPC_RNDNN)
+            gmp.mpc_set_z(res, other._mpz, get_context()._mpc_round)
+            gmp.mpc_div(res, res, self._mpc, get_context()._mpc_round)
         elif isinstance(other, complex):
-            gmp.mpc_set_d_d(res, other.real, other.imag, gmp.MPC_RNDNN)
-            gmp.mpc_div(res, res, self._mpc, gmp.MPC_RNDNN)
+            gmp.mpc_set_d_d(res, other.real, other.imag,
+                            get_context()._mpc_round)
+            gmp.mpc_div(res, res, self._mpc, get_context()._mpc_round)
         elif isinstance(other, float):
-            gmp.mpc_set_d(res, other.real, gmp.MPC_RNDNN)
-            gmp.mpc_div(res, res, self._mpc, gmp.MPC_RNDNN)
+            gmp.mpc_set_d(res, other.real, get_context()._mpc_round)
+            gmp.mpc_div(res, res, self._mpc, get_context()._mpc_round)
         elif isinstance(other, (int, long)):
             if 0 <= other <= MAX_UI:
-                gmp.mpc_ui_div(res, other, self._mpc, gmp.MPC_RNDNN)
+                gmp.mpc_ui_div(res, other, self._mpc, get_context()._mpc_round)
             elif -sys.maxsize-1 <= other <= sys.maxsize:
-                gmp.mpc_set_si(res, other, gmp.MPC_RNDNN)
-                gmp.mpc_div(res, res, self._mpc, gmp.MPC_RNDNN)
+                gmp.mpc_set_si(res, other, get_context()._mpc_round)
+                gmp.mpc_div(res, res, self._mpc, get_context()._mpc_round)
             else:
                 tmp_mpz = _new_mpz()
                 _pyint_to_mpz(other, tmp_mpz)
-                gmp.mpc_set_z(res, tmp_mpz, gmp.MPC_RNDNN)
-                gmp.mpc_div(res, res, self._mpc, gmp.MPC_RNDNN)
+                gmp.mpc_set_z(res, tmp_mpz, get_context()._mpc_round)
+                gmp.mpc_div(res, res, self._mpc, get_context()._mpc_round)
                 _del_mpz(tmp_mpz)
         else:
+            _del_mpc(res)
             return NotImplemented
         return mpc._from_c_mpc(res)
 
     __rdiv__ = __rtruediv__
 
     def __pow__(self, other):
-        res = _new_mpc()    # TODO use context precision
+        res = _new_mpc()
         if isinstance(other, mpc):
-            gmp.mpc_pow(res, self._mpc, other._mpc, gmp.MPC_RNDNN)
+            gmp.mpc_pow(res, self._mpc, other._mpc, get_context()._mpc_round)
         elif isinstance(other, mpfr):
-            gmp.mpc_pow_fr(res, self._mpc, other._mpfr, gmp.MPC_RNDNN)
+            gmp.mpc_pow_fr(res, self._mpc, other._mpfr,
+                           get_context()._mpc_round)
         elif isinstance(other, mpq):
-            gmp.mpc_set_q(res, other._mpq, gmp.MPFR_RNDN)
-            gmp.mpc_pow(res, self._mpc, res, gmp.MPC_RNDNN)
+            gmp.mpc_set_q(res, other._mpq, get_context().round)
+            gmp.mpc_pow(res, self._mpc, res, get_context()._mpc_round)
         elif isinstance(other, mpz):
             gmp.mpc_pow_z(res, self._mpc, other._mpz,
-                          gmp.MPFR_RNDN)
+                          get_context().round)
         elif isinstance(other, complex):
-            gmp.mpc_set_d_d(res, other.real, other.imag, gmp.MPC_RNDNN)
-            gmp.mpc_pow(res, self._mpc, res, gmp.MPC_RNDNN)
+            gmp.mpc_set_d_d(res, other.real, other.imag,
+                            get_context()._mpc_round)
+            gmp.mpc_pow(res, self._mpc, res, get_context()._mpc_round)
         elif isinstance(other, float):
-            gmp.mpc_pow_d(res, self._mpc, other, gmp.MPFR_RNDN)
+            gmp.mpc_pow_d(res, self._mpc, other, get_context().round)
         elif isinstance(other, (int, long)):
             if 0 <= other <= MAX_UI:
-                gmp.mpc_pow_ui(res, self._mpc, other, gmp.MPC_RNDNN)
+                gmp.mpc_pow_ui(res, self._mpc, other, get_context()._mpc_round)
             elif -sys.maxsize-1 <= other <= sys.maxsize:
-                gmp.mpc_pow_si(res, self._mpc, other, gmp.MPC_RNDNN)
+                gmp.mpc_pow_si(res, self._mpc, other, get_context()._mpc_round)
             else:
                 tmp_mpz = _new_mpz()
                 _pyint_to_mpz(other, tmp_mpz)
-                gmp.mpc_pow_z(res, self._mpc, tmp_mpz, gmp.MPC_RNDNN)
+                gmp.mpc_pow_z(res, self._mpc, tmp_mpz,
+                              get_context()._mpc_round)
                 _del_mpz(tmp_mpz)
         else:
+            _del_mpc(res)
             return NotImplemented
         return mpc._from_c_mpc(res)
 
     def __rpow__(self, other):
-        res = _new_mpc()    # TODO use context precision
+        res = _new_mpc()
         if isinstance(other, mpfr):
-            gmp.mpc_set_fr(res, other._mpfr, gmp.MPFR_RNDN)
-            gmp.mpc_pow(res, res, self._mpc, gmp.MPFR_RNDN)
+            gmp.mpc_set_fr(res, other._mpfr, get_context().round)
+            gmp.mpc_pow(res, res, self._mpc, get_context().round)
         elif isinstance(other, mpq):
-            gmp.mpc_set_q(res, other._mpq, gmp.MPFR_RNDN)
-            gmp.mpc_pow(res, res, self._mpc, gmp.MPFR_RNDN)
+            gmp.mpc_set_q(res, other._mpq, get_context().round)
+            gmp.mpc_pow(res, res, self._mpc, get_context().round)
         elif isinstance(other, mpz):
-            gmp.mpc_set_z(res, other._mpz, gmp.MPC_RNDNN)
-            gmp.mpc_pow(res, res, self._mpc, gmp.MPFR_RNDN)
+            gmp.mpc_set_z(res, other._mpz, get_context()._mpc_round)
+            gmp.mpc_pow(res, res, self._mpc, get_context().round)
         elif isinstance(other, complex):
-            gmp.mpc_set_d_d(res, other.real, other.imag, gmp.MPC_RNDNN)
-            gmp.mpc_pow(res, res, self._mpc, gmp.MPC_RNDNN)
+            gmp.mpc_set_d_d(res, other.real, other.imag,
+                            get_context()._mpc_round)
+            gmp.mpc_pow(res, res, self._mpc, get_context()._mpc_round)
         elif isinstance(other, float):
-            gmp.mpc_set_d(res, other, gmp.MPFR_RNDN)
-            gmp.mpc_pow(res, res, self._mpc, gmp.MPC_RNDNN)
+            gmp.mpc_set_d(res, other, get_context().round)
+            gmp.mpc_pow(res, res, self._mpc, get_context()._mpc_round)
         elif isinstance(other, (int, long)):
             if 0 <= other <= MAX_UI:
-                gmp.mpc_set_ui(res, other, gmp.MPC_RNDNN)
+                gmp.mpc_set_ui(res, other, get_context()._mpc_round)
             elif -sys.maxsize-1 <= other <= sys.maxsize:
-                gmp.mpc_set_si(res, other, gmp.MPC_RNDNN)
+                gmp.mpc_set_si(res, other, get_context()._mpc_round)
             else:
                 tmp_mpz = _new_mpz()
                 _pyint_to_mpz(other, tmp_mpz)
-                gmp.mpc_set_z(res, tmp_mpz, gmp.MPC_RNDNN)
+                gmp.mpc_set_z(res, tmp_mpz, get_context()._mpc_round)
                 _del_mpz(tmp_mpz)
-            gmp.mpc_pow(res, res, self._mpc, gmp.MPC_RNDNN)
+            gmp.mpc_pow(res, res, self._mpc, get_context()._mpc_round)
         else:
+            _del_mpc(res)
             return NotImplemented
         return mpc._from_c_mpc(res)
 
@@ -554,10 +629,10 @@ class mpc(object):
 
     def __neg__(self):
         res = _new_mpc()
-        gmp.mpc_neg(res, self._mpc, gmp.MPC_RNDNN)
+        gmp.mpc_neg(res, self._mpc, get_context()._mpc_round)
         return mpc._from_c_mpc(res)
 
     def __abs__(self):
         res = _new_mpfr()
-        gmp.mpc_abs(res, self._mpc, gmp.MPC_RNDNN)
+        gmp.mpc_abs(res, self._mpc, get_context().round)
         return mpfr._from_c_mpfr(res)
@@ -1,10 +1,14 @@
 import sys
 import math
 
+import gmpy_cffi
 from gmpy_cffi.mpz import mpz
 from gmpy_cffi.mpq import mpq
 from gmpy_cffi.interface import gmp, ffi
-from gmpy_cffi.convert import _mpfr_to_str, _str_to_mpfr, _pyint_to_mpfr, _pylong_to_mpz, MAX_UI, _mpz_to_pylong
+from gmpy_cffi.context import get_context, _negated_round
+from gmpy_cffi.convert import (
+    _mpfr_to_str, _str_to_mpfr, _pyint_to_mpfr, _pylong_to_mpz, MAX_UI,
+    _mpz_to_pylong, _mpfr_hash, _nan_hash)
 from gmpy_cffi.cache import _new_mpfr, _del_mpfr, _new_mpz, _del_mpz
 
 
@@ -46,7 +50,6 @@ def isnan(x):
 
 
 class mpfr(object):
-    _mpfr_str = _repr_str = None
     """
     mpfr() -> mpfr(0.0)
 
@@ -70,7 +73,10 @@ class mpfr(object):
          digits of the string are used to identify the base: 0b implies
          base=2, 0x implies base=16, otherwise base=10 is assumed.
     """
+    __slots__ = ('_mpfr', '_mpfr_str', '_hash')
+
     def __init__(self, *args):
+        self._mpfr_str = self._hash = None
         nargs = len(args)
         if nargs == 1 and isinstance(args[0], self.__class__):
             self._mpfr = args[0]._mpfr
@@ -95,15 +101,18 @@ class mpfr(object):
             if isinstance(args[0], str):
                 _str_to_mpfr(args[0], 10, a)
             elif isinstance(args[0], float):
-                gmp.mpfr_set_d(a, args[0], gmp.MPFR_RNDN)
+                gmp.mpfr_set_d(a, args[0], get_context().round)
             elif isinstance(args[0], (int, long)):
                 _pyint_to_mpfr(args[0], a)
             elif isinstance(args[0], mpz):
-                gmp.mpfr_set_z(a, args[0]._mpz, gmp.MPFR_RNDN)
+                gmp.mpfr_set_z(a, args[0]._mpz, get_context().round)
             elif isinstance(args[0], mpq):
-                gmp.mpfr_set_q(a, args[0]._mpq, gmp.MPFR_RNDN)
+                gmp.mpfr_set_q(a, args[0]._mpq, get_context().round)
             else:
                 raise TypeError('cannot construct mpfr from %s.' % args[0])
+        ctx = get_context()
+        if ctx._traps:
+            ctx._check_traps()
 
     def __str__(self):
         if self._mpfr_str is None:
@@ -111,12 +120,13 @@ class mpfr(object):
         return self._mpfr_str
 
     def __repr__(self):
-        if self._repr_str is None:
-            if self.precision == gmp.mpfr_get_default_prec():
-                self._repr_str = "mpfr('%s')" % self
-            else:
-                self._repr_str = "mpfr('%s',%s)" % (self, self.precision)
-        return self._repr_str
+        # Not memoised: the precision is only shown when it differs from
+        # the current context's
+        prec = self.precision
+        if prec == get_context().precision:
+            return "mpfr('%s')" % self
+        else:
+            return "mpfr('%s',%s)" % (self, prec)
 
     @property
     def precision(self):
@@ -126,29 +136,38 @@ class mpfr(object):
     def _from_c_mpfr(cls, mpfr):
         inst = object.__new__(cls)
         inst._mpfr = ffi.gc(mpfr, _del_mpfr)
+        inst._mpfr_str = inst._hash = None
+        ctx = get_context()
+        if ctx._traps:
+            ctx._check_traps()
         return inst
 
     def __cmp(self, other):
         if isinstance(other, mpfr):
-            return gmp.mpfr_cmp(self._mpfr, other._mpfr)
+            result = gmp.mpfr_cmp(self._mpfr, other._mpfr)
         elif isinstance(other, float):
-            return gmp.mpfr_cmp_d(self._mpfr, other)
-        if isinstance(other, (int, long)):
+            result = gmp.mpfr_cmp_d(self._mpfr, other)
+        elif isinstance(other, (int, long)):
             if -sys.maxsize - 1 <= other < sys.maxsize:
-                return gmp.mpfr_cmp_ui(self._mpfr, other)
+                result = gmp.mpfr_cmp_ui(self._mpfr, other)
             elif 0 <= other <= MAX_UI:
-                return gmp.mpfr_cmp_ui(self._mpfr, other)
+                result = gmp.mpfr_cmp_ui(self._mpfr, other)
             else:
                 tmp_mpz = _new_mpz()
                 _pylong_to_mpz(other, tmp_mpz)
                 result = gmp.mpfr_cmp_z(self._mpfr, tmp_mpz)
                 _del_mpz(tmp_mpz)
-                return result
         elif isinstance(other, mpz):
-            return gmp.mpfr_cmp_z(self._mpfr, other._mpz)
+            result = gmp.mpfr_cmp_z(self._mpfr, other._mpz)
         elif isinstance(other, mpq):
-            return gmp.mpfr_cmp_q(self._mpfr, other._mpq)
-        return None
+            result = gmp.mpfr_cmp_q(self._mpfr, other._mpq)
+        else:
+            return None
+        # Comparisons with NaN raise the erange flag
+        ctx = get_context()
+        if ctx._traps:
+            ctx._check_traps()
+        return result
 
     def __lt__(self, other):
         c = self.__cmp(other)
@@ -177,31 +196,49 @@ class mpfr(object):
     def __le__(self, other):
         return not self > other
 
+    def __reduce__(self):
+        return gmpy_cffi.from_binary, (gmpy_cffi.to_binary(self),)
+
+    def __copy__(self):
+        # Immutable
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     def __hash__(self):
-        # XXX Optimize (see gmpy / how floats are hashed within python)
-        return hash(float(self))
+        """
+        Agrees with float, int and fractions.Fraction for equal values
+        """
+        if self._hash is None:
+            if gmp.mpfr_nan_p(self._mpfr):
+                self._hash = _nan_hash(self)
+            else:
+                self._hash = _mpfr_hash(self._mpfr)
+        return self._hash
 
     def __add__(self, other):
         res = _new_mpfr()
         if isinstance(other, mpfr):
-            gmp.mpfr_add(res, self._mpfr, other._mpfr, gmp.MPFR_RNDN)
+            gmp.mpfr_add(res, self._mpfr, other._mpfr, get_context().round)
         elif isinstance(other, mpq):
-            gmp.mpfr_add_q(res, self._mpfr, other._mpq, gmp.MPFR_RNDN)
+            gmp.mpfr_add_q(res, self._mpfr, other._mpq, get_context().round)
         elif isinstance(other, mpz):
-            gmp.mpfr_add_z(res, self._mpfr, other._mpz, gmp.MPFR_RNDN)
+            gmp.mpfr_add_z(res, self._mpfr, other._mpz, get_context().round)
         elif isinstance(other, float):
-            gmp.mpfr_add_d(res, self._mpfr, other, gmp.MPFR_RNDN)
+            gmp.mpfr_add_d(res, self._mpfr, other, get_context().round)
         elif isinstance(other, (int, long)):
             if -sys.maxsize - 1 <= other <= sys.maxsize:
-                gmp.mpfr_add_si(res, self._mpfr, other, gmp.MPFR_RNDN)
+                gmp.mpfr_add_si(res, self._mpfr, other, get_context().round)
             elif 0 <= other <= MAX_UI:
-                gmp.mpfr_add_ui(res, self._mpfr, other, gmp.MPFR_RNDN)
+                gmp.mpfr_add_ui(res, self._mpfr, other, get_context().round)
             else:
                 tmp_mpz = _new_mpz()
                 _pylong_to_mpz(other, tmp_mpz)
-                gmp.mpfr_add_z(res, self._mpfr, tmp_mpz, gmp.MPFR_RNDN)
+                gmp.mpfr_add_z(res, self._mpfr, tmp_mpz, get_context().round)
                 _del_mpz(tmp_mpz)
         else:
+            _del_mpfr(res)
             return NotImplemented
         return mpfr._from_c_mpfr(res)
 
@@ -210,72 +247,77 @@ class mpfr(object):
     def __sub__(self, other):
         res = _new_mpfr()
         if isinstance(other, mpfr):
-            gmp.mpfr_sub(res, self._mpfr, other._mpfr, gmp.MPFR_RNDN)
+            gmp.mpfr_sub(res, self._mpfr, other._mpfr, get_context().round)
         elif isinstance(other, mpq):
-            gmp.mpfr_sub_q(res, self._mpfr, other._mpq, gmp.MPFR_RNDN)
+            gmp.mpfr_sub_q(res, self._mpfr, other._mpq, get_context().round)
         elif isinstance(other, mpz):
-            gmp.mpfr_sub_z(res, self._mpfr, other._mpz, gmp.MPFR_RNDN)
+            gmp.mpfr_sub_z(res, self._mpfr, other._mpz, get_context().round)
         elif isinstance(other, float):
-            gmp.mpfr_sub_d(res, self._mpfr, other, gmp.MPFR_RNDN)
+            gmp.mpfr_sub_d(res, self._mpfr, other, get_context().round)
         elif isinstance(other, (int, long)):
             if -sys.maxsize - 1 <= other <= sys.maxsize:
-                gmp.mpfr_sub_si(res, self._mpfr, other, gmp.MPFR_RNDN)
+                gmp.mpfr_sub_si(res, self._mpfr, other, get_context().round)
             elif 0 <= other <= MAX_UI:
-                gmp.mpfr_sub_ui(res, self._mpfr, other, gmp.MPFR_RNDN)
+                gmp.mpfr_sub_ui(res, self._mpfr, other, get_context().round)
             else:
                 tmp_mpz = _new_mpz()
                 _pylong_to_mpz(other, tmp_mpz)
-                gmp.mpfr_sub_z(res, self._mpfr, tmp_mpz, gmp.MPFR_RNDN)
+                gmp.mpfr_sub_z(res, self._mpfr, tmp_mpz, get_context().round)
                 _del_mpz(tmp_mpz)
         else:
+            _del_mpfr(res)
             return NotImplemented
         return mpfr._from_c_mpfr(res)
 
     def __rsub__(self, other):
         res = _new_mpfr()
         if isinstance(other, mpq):
-            # There is no mpfr_q_sub
-            gmp.mpfr_sub_q(res, self._mpfr, other._mpq, gmp.MPFR_RNDN)
-            gmp.mpfr_neg(res, res, gmp.MPFR_RNDN)
+            # There is no mpfr_q_sub, so round self - q the other way
+            rnd = get_context().round
+            gmp.mpfr_sub_q(res, self._mpfr, other._mpq,
+                           _negated_round.get(rnd, rnd))
+            gmp.mpfr_neg(res, res, rnd)
         elif isinstance(other, mpz):
-            gmp.mpfr_z_sub(res, other._mpz, self._mpfr, gmp.MPFR_RNDN)
+            gmp.mpfr_z_sub(res, other._mpz, self._mpfr, get_context().round)
         elif isinstance(other, float):
-            gmp.mpfr_d_sub(res, other, self._mpfr, gmp.MPFR_RNDN)
+            gmp.mpfr_d_sub(res, other, self._mpfr, get_context().round)
         elif isinstance(other, (int, long)):
             if -sys.maxsize - 1 <= other <= sys.maxsize:
-                gmp.mpfr_si_sub(res, other, self._mpfr, gmp.MPFR_RNDN)
+                gmp.mpfr_si_sub(res, other, self._mpfr, get_context().round)
             elif 0 <= other <= MAX_UI:
-                gmp.mpfr_ui_sub(res, other, self._mpfr, gmp.MPFR_RNDN)
+                gmp.mpfr_ui_sub(res, other, self._mpfr, get_context().round)
             else:
                 tmp_mpz = _new_mpz()
                 _pylong_to_mpz(other, tmp_mpz)
-                gmp.mpfr_z_sub(res, tmp_mpz, self._mpfr, gmp.MPFR_RNDN)
+                gmp.mpfr_z_sub(res, tmp_mpz, self._mpfr, get_context().round)
                 _del_mpz(tmp_mpz)
         else:
+            _del_mpfr(res)
             return NotImplemented
         return mpfr._from_c_mpfr(res)
 
     def __mul__(self, other):
         res = _new_mpfr()
         if isinstance(other, mpfr):
-            gmp.mpfr_mul(res, self._mpfr, other._mpfr, gmp.MPFR_RNDN)
+            gmp.mpfr_mul(res, self._mpfr, other._mpfr, get_context().round)
         elif isinstance(other, mpq):
-            gmp.mpfr_mul_q(res, self._mpfr, other._mpq, gmp.MPFR_RNDN)
+            gmp.mpfr_mul_q(res, self._mpfr, other._mpq, get_context().round)
         elif isinstance(other, mpz):
-            gmp.mpfr_mul_z(res, self._mpfr, other._mpz, gmp.MPFR_RNDN)
+            gmp.mpfr_mul_z(res, self._mpfr, other._mpz, get_context().round)
         elif isinstance(other, float):
-            gmp.mpfr_mul_d(res, self._mpfr, other, gmp.MPFR_RNDN)
+            gmp.mpfr_mul_d(res, self._mpfr, other, get_context().round)
         elif isinstance(other, (int, long)):
             if -sys.maxsize - 1 <= other <= sys.maxsize:
-                gmp.mpfr_mul_si(res, self._mpfr, other, gmp.MPFR_RNDN)
+                gmp.mpfr_mul_si(res, self._mpfr, other, get_context().round)
             elif 0 <= other <= MAX_UI:
-                gmp.mpfr_mul_ui(res, self._mpfr, other, gmp.MPFR_RNDN)
+                gmp.mpfr_mul_ui(res, self._mpfr, other, get_context().round)
             else:
                 tmp_mpz = _new_mpz()
                 _pylong_to_mpz(other, tmp_mpz)
-                gmp.mpfr_mul_z(res, self._mpfr, tmp_mpz, gmp.MPFR_RNDN)
+                gmp.mpfr_mul_z(res, self._mpfr, tmp_mpz, get_context().round)
                 _del_mpz(tmp_mpz)
         else:
+            _del_mpfr(res)
             return NotImplemented
         return mpfr._from_c_mpfr(res)
 
@@ -284,24 +326,25 @@ class mpfr(object):
     def __truediv__(self, other):
         res = _new_mpfr()
         if isinstance(other, mpfr):
-            gmp.mpfr_div(res, self._mpfr, other._mpfr, gmp.MPFR_RNDN)
+            gmp.mpfr_div(res, self._mpfr, other._mpfr, get_context().round)
         elif isinstance(other, mpq):
-            gmp.mpfr_div_q(res, self._mpfr, other._mpq, gmp.MPFR_RNDN)
+            gmp.mpfr_div_q(res, self._mpfr, other._mpq, get_context().round)
         elif isinstance(other, mpz):
-            gmp.mpfr_div_z(res, self._mpfr, other._mpz, gmp.MPFR_RNDN)
+            gmp.mpfr_div_z(res, self._mpfr, other._mpz, get_context().round)
         elif isinstance(other, float):
-            gmp.mpfr_div_d(res, self._mpfr, other, gmp.MPFR_RNDN)
+            gmp.mpfr_div_d(res, self._mpfr, other, get_context().round)
         elif isinstance(other, (int, long)):
             if -sys.maxsize - 1 <= other <= sys.maxsize:
-                gmp.mpfr_div_si(res, self._mpfr, other, gmp.MPFR_RNDN)
+                gmp.mpfr_div_si(res, self._mpfr, other, get_context().round)
             elif 0 <= other <= MAX_UI:
-                gmp.mpfr_div_ui(res, self._mpfr, other, gmp.MPFR_RNDN)
+                gmp.mpfr_div_ui(res, self._mpfr, other, get_context().round)
             else:
                 tmp_mpz = _new_mpz()
                 _pylong_to_mpz(other, tmp_mpz)
-                gmp.mpfr_div_z(res, self._mpfr, tmp_mpz, gmp.MPFR_RNDN)
+                gmp.mpfr_div_z(res, self._mpfr, tmp_mpz, get_context().round)
                 _del_mpz(tmp_mpz)
         else:
+            _del_mpfr(res)
             return NotImplemented
         return mpfr._from_c_mpfr(res)
 
@@ -311,55 +354,57 @@ class mpfr(object):
         res = _new_mpfr()
         if isinstance(other, mpq):
             # There is no mpfr_q_div
-            gmp.mpfr_set_q(res, other._mpq, gmp.MPFR_RNDN)
-            gmp.mpfr_div(res, res, self._mpfr, gmp.MPFR_RNDN)
+            gmp.mpfr_set_q(res, other._mpq, get_context().round)
+            gmp.mpfr_div(res, res, self._mpfr, get_context().round)
             pass
         elif isinstance(other, mpz):
             # There is no mpfr_z_div
-            gmp.mpfr_set_z(res, other._mpz, gmp.MPFR_RNDN)
-            gmp.mpfr_div(res, res, self._mpfr, gmp.MPFR_RNDN)
+            gmp.mpfr_set_z(res, other._mpz, get_context().round)
+            gmp.mpfr_div(res, res, self._mpfr, get_context().round)
         elif isinstance(other, float):
-            gmp.mpfr_d_div(res, other, self._mpfr, gmp.MPFR_RNDN)
+            gmp.mpfr_d_div(res, other, self._mpfr, get_context().round)
         elif isinstance(other, (int, long)):
             if -sys.maxsize - 1 <= other <= sys.maxsize:
-                gmp.mpfr_si_div(res, other, self._mpfr, gmp.MPFR_RNDN)
+                gmp.mpfr_si_div(res, other, self._mpfr, get_context().round)
             elif 0 <= other <= MAX_UI:
-                gmp.mpfr_ui_div(res, other, self._mpfr, gmp.MPFR_RNDN)
+                gmp.mpfr_ui_div(res, other, self._mpfr, get_context().round)
             else:
                 tmp_mpz = _new_mpz()
                 _pylong_to_mpz(other, tmp_mpz)
-                gmp.mpfr_set_z(res, tmp_mpz, gmp.MPFR_RNDN)
-                gmp.mpfr_div(res, res, self._mpfr, gmp.MPFR_RNDN)
+                gmp.mpfr_set_z(res, tmp_mpz, get_context().round)
+                gmp.mpfr_div(res, res, self._mpfr, get_context().round)
                 _del_mpz(tmp_mpz)
         else:
+            _del_mpfr(res)
             return NotImplemented
         return mpfr._from_c_mpfr(res)
 
     def __pow__(self, other):
         res = _new_mpfr()
         if isinstance(other, mpfr):
-            gmp.mpfr_pow(res, self._mpfr, other._mpfr, gmp.MPFR_RNDN)
+            gmp.mpfr_pow(res, self._mpfr, other._mpfr, get_context().round)
         elif isinstance(other, mpq):
             # There is no mpfr_pow_q
-            gmp.mpfr_set_q(res, other._mpq, gmp.MPFR_RNDN)
-            gmp.mpfr_pow(res, self._mpfr, res, gmp.MPFR_RNDN)
+            gmp.mpfr_set_q(res, other._mpq, get_context().round)
+            gmp.mpfr_pow(res, self._mpfr, res, get_context().round)
         elif isinstance(other, mpz):
-            gmp.mpfr_pow_z(res, self._mpfr, other._mpz, gmp.MPFR_RNDN)
+            gmp.mpfr_pow_z(res, self._mpfr, other._mpz, get_context().round)
         elif isinstance(other, float):
             # There is no mpfr_pow_d
-            gmp.mpfr_set_d(res, other, gmp.MPFR_RNDN)
-            gmp.mpfr_pow(res, self._mpfr, res, gmp.MPFR_RNDN)
+            gmp.mpfr_set_d(res, other, get_context().round)
+            gmp.mpfr_pow(res, self._mpfr, res, get_context().round)
         elif isinstance(other, (int, long)):
             if -sys.maxsize - 1 <= other <= sys.maxsize:
-                gmp.mpfr_pow_si(res, self._mpfr, other, gmp.MPFR_RNDN)
+                gmp.mpfr_pow_si(res, self._mpfr, other, get_context().round)
             elif 0 <= other <= MAX_UI:
-                gmp.mpfr_pow_ui(res, self._mpfr, other, gmp.MPFR_RNDN)
+                gmp.mpfr_pow_ui(res, self._mpfr, other, get_context().round)
             else:
                 tmp_mpz = _new_mpz()
                 _pylong_to_mpz(other, tmp_mpz)
-                gmp.mpfr_pow_z(res, self._mpfr, tmp_mpz, gmp.MPFR_RNDN)
+                gmp.mpfr_pow_z(res, self._mpfr, tmp_mpz, get_context().round)
                 _del_mpz(tmp_mpz)
         else:
+            _del_mpfr(res)
             return NotImplemented
         return mpfr._from_c_mpfr(res)
 
@@ -367,21 +412,22 @@ class mpfr(object):
         res = _new_mpfr()
         if isinstance(other, mpq):
             # There is no mpfr_pow_q
-            gmp.mpfr_set_q(res, other._mpq, gmp.MPFR_RNDN)
-            gmp.mpfr_pow(res, res, self._mpfr, gmp.MPFR_RNDN)
+            gmp.mpfr_set_q(res, other._mpq, get_context().round)
+            gmp.mpfr_pow(res, res, self._mpfr, get_context().round)
         elif isinstance(other, mpz):
             # There is no mpfr_pow_z
-            gmp.mpfr_set_z(res, other._mpz, gmp.MPFR_RNDN)
-            gmp.mpfr_pow(res, res, self._mpfr, gmp.MPFR_RNDN)
+            gmp.mpfr_set_z(res, other._mpz, get_context().round)
+            gmp.mpfr_pow(res, res, self._mpfr, get_context().round)
         elif isinstance(other, float):
             # There is no mpfr_pow_d
-            gmp.mpfr_set_d(res, other, gmp.MPFR_RNDN)
-            gmp.mpfr_pow(res, res, self._mpfr, gmp.MPFR_RNDN)
+            gmp.mpfr_set_d(res, other, get_context().round)
+            gmp.mpfr_pow(res, res, self._mpfr, get_context().round)
         elif isinstance(other, (int, long)):
             # There is no mpfr_si_pow
             _pyint_to_mpfr(other, res)
-            gmp.mpfr_pow(res, res, self._mpfr, gmp.MPFR_RNDN)
+            gmp.mpfr_pow(res, res, self._mpfr, get_context().round)
         else:
+            _del_mpfr(res)
             return NotImplemented
         return mpfr._from_c_mpfr(res)
 
@@ -390,36 +436,48 @@ class mpfr(object):
 
     def __neg__(self):
         res = _new_mpfr()
-        gmp.mpfr_neg(res, self._mpfr, gmp.MPFR_RNDN)
+        gmp.mpfr_neg(res, self._mpfr, get_context().round)
         return mpfr._from_c_mpfr(res)
 
     def __abs__(self):
         res = _new_mpfr()
-        gmp.mpfr_abs(res, self._mpfr, gmp.MPFR_RNDN)
+        gmp.mpfr_abs(res, self._mpfr, get_context().round)
         return mpfr._from_c_mpfr(res)
 
     def __trunc__(self):
         tmp_mpfr = _new_mpfr()
         gmp.mpfr_trunc(tmp_mpfr, self._mpfr)
-        res = gmp.mpfr_get_d(tmp_mpfr, gmp.MPFR_RNDN)
+        res = gmp.mpfr_get_d(tmp_mpfr, get_context().round)
         _del_mpfr(tmp_mpfr)
+        # Conversions record their flags but do not trap, and must not
+        # leave them to trap the next operation
+        ctx = get_context()
+        if ctx._traps:
+            ctx._harvest()
         return res
 
     def __float__(self):
-        return gmp.mpfr_get_d(self._mpfr, gmp.MPFR_RNDN)
+        res = gmp.mpfr_get_d(self._mpfr, get_context().round)
+        ctx = get_context()
+        if ctx._traps:
+            ctx._harvest()
+        return res
 
     def __int__(self):
         if not gmp.mpfr_number_p(self._mpfr):
             raise ValueError("Cannot convert '%s' to int" % self)
-        elif gmp.mpfr_fits_slong_p(self._mpfr, gmp.MPFR_RNDN):
-            return gmp.mpfr_get_si(self._mpfr, gmp.MPFR_RNDN)
-        elif gmp.mpfr_fits_ulong_p(self._mpfr, gmp.MPFR_RNDN):
-            return gmp.mpfr_get_ui(self._mpfr, gmp.MPFR_RNDN)
+        elif gmp.mpfr_fits_slong_p(self._mpfr, get_context().round):
+            res = gmp.mpfr_get_si(self._mpfr, get_context().round)
+        elif gmp.mpfr_fits_ulong_p(self._mpfr, get_context().round):
+            res = gmp.mpfr_get_ui(self._mpfr, get_context().round)
         else:
             tmp_mpz = _new_mpz()
-            gmp.mpfr_get_z(tmp_mpz, self._mpfr, gmp.MPFR_RNDN)
+            gmp.mpfr_get_z(tmp_mpz, self._mpfr, get_context().round)
             res = _mpz_to_pylong(tmp_mpz)
             _del_mpz(tmp_mpz)
-            return res
+        ctx = get_context()
+        if ctx._traps:
+            ctx._harvest()
+        return res
 
     __long__ = __int__
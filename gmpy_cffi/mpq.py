@@ -3,7 +3,8 @@ import logging
 
 import gmpy_cffi
 from gmpy_cffi.interface import gmp, ffi
-from gmpy_cffi.convert import _mpq_to_str, _str_to_mpq, _pyint_to_mpz, _pyint_to_mpq, MAX_UI
+from gmpy_cffi.convert import (
+    _mpq_to_str, _str_to_mpq, _pyint_to_mpz, _pyint_to_mpq, _mpq_hash, MAX_UI)
 from gmpy_cffi.mpz import mpz
 from gmpy_cffi.cache import _new_mpq, _del_mpq, _new_mpz, _del_mpz
 
@@ -14,7 +15,7 @@ if sys.version > '3':
 
 
 class mpq(object):
-    _mpq_str = _numerator = _denominator = None
+    __slots__ = ('_mpq', '_mpq_str', '_numerator', '_denominator', '_hash')
 
     def __init__(self, *args):
         """
@@ -40,6 +41,9 @@ class mpq(object):
 
         #TODO kwargs (base)
 
+        self._mpq_str = self._numerator = self._denominator = None
+        self._hash = None
+
         nargs = len(args)
         if nargs == 1 and isinstance(args[0], self.__class__):
             self._mpq = args[0]._mpq
@@ -139,6 +143,8 @@ class mpq(object):
     def _from_c_mpq(cls, mpq):
         inst = object.__new__(cls)
         inst._mpq = ffi.gc(mpq, _del_mpq)
+        inst._mpq_str = inst._numerator = inst._denominator = None
+        inst._hash = None
         return inst
 
     def __str__(self):
@@ -205,8 +211,8 @@ class mpq(object):
             return NotImplemented
 
     def __mul__(self, other):
-        res = _new_mpq()
         if isinstance(other, mpq):
+            res = _new_mpq()
             gmp.mpq_mul(res, self._mpq, other._mpq)
             return mpq._from_c_mpq(res)
         elif isinstance(other, (int, long)):
@@ -293,19 +299,23 @@ class mpq(object):
         div = (other // self).__floor__()
         return (div, other - div * self)
 
+    def __reduce__(self):
+        return gmpy_cffi.from_binary, (gmpy_cffi.to_binary(self),)
+
+    def __copy__(self):
+        # Immutable
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     def __hash__(self):
         """
         Agrees with fractions.Fractions
         """
-        # XXX since this method is expensive, consider caching the result
-        if self == int(self):
-            return int(self)
-        if self == float(self):
-            return hash(float(self))
-        else:
-            num = long(mpz._from_c_mpz(gmp.mpq_numref(self._mpq)))
-            den = long(mpz._from_c_mpz(gmp.mpq_denref(self._mpq))) 
-            return hash((num, den))
+        if self._hash is None:
+            self._hash = _mpq_hash(self._mpq)
+        return self._hash
 
     def __cmp(self, other):
         if isinstance(other, mpq):
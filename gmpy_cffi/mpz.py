@@ -1,8 +1,11 @@
 import logging
 import sys
 
+import gmpy_cffi
 from gmpy_cffi.interface import gmp, ffi
-from gmpy_cffi.convert import _pyint_to_mpz, _pylong_to_mpz, _mpz_to_pylong, _mpz_to_str, MAX_UI
+from gmpy_cffi.convert import (
+    _pyint_to_mpz, _pylong_to_mpz, _mpz_to_pylong, _mpz_to_str, _mpz_hash,
+    MAX_UI)
 from gmpy_cffi.cache import _new_mpz, _del_mpz
 
 
@@ -12,7 +15,7 @@ if sys.version > '3':
 
 
 class mpz(object):
-    _mpz_str = None
+    __slots__ = ('_mpz', '_mpz_str', '_hash')
 
     def __init__(self, n=0, base=None):
         """
@@ -34,10 +37,12 @@ class mpz(object):
             the string is assumed to be decimal. Values for base can range
             between 2 and 62.
         """
-
-        if isinstance(n, self.__class__):
+        if type(n) is mpz:
+            # mpz is immutable so the C value can be shared
             self._mpz = n._mpz
+            self._mpz_str, self._hash = n._mpz_str, n._hash
             return
+        self._mpz_str = self._hash = None
         a = self._mpz = ffi.gc(_new_mpz(), _del_mpz)
         if isinstance(n, str):
             if base is None:
@@ -53,6 +58,8 @@ class mpz(object):
             gmp.mpz_set_d(a, n)
         elif isinstance(n, (int, long)):
             _pyint_to_mpz(n, a)
+        elif isinstance(n, mpz):
+            gmp.mpz_set(a, n._mpz)
         else:
             raise TypeError
 
@@ -60,6 +67,7 @@ class mpz(object):
     def _from_c_mpz(cls, mpz):
         inst = object.__new__(cls)
         inst._mpz = ffi.gc(mpz, _del_mpz)
+        inst._mpz_str = inst._hash = None
         return inst
 
     def __str__(self):
@@ -273,12 +281,23 @@ class mpz(object):
             return NotImplemented
         return mpz(other) >> self
 
+    def __reduce__(self):
+        return gmpy_cffi.from_binary, (gmpy_cffi.to_binary(self),)
+
+    def __copy__(self):
+        # Immutable
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     def __hash__(self):
-        # WTF When this returns -1, CPython silently changes it to -2
-        i = int(self)
-        if -sys.maxsize - 1 <= i <= sys.maxsize:
-            return i
-        return (i + sys.maxsize + 1) % (2 * sys.maxsize + 2) - sys.maxsize - 1
+        """
+        Agrees with int
+        """
+        if self._hash is None:
+            self._hash = _mpz_hash(self._mpz)
+        return self._hash
 
     def __cmp(self, other):
         if isinstance(other, mpz):
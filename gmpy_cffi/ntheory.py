@@ -1,7 +1,8 @@
 import sys
 
-from gmpy_cffi.interface import gmp
+from gmpy_cffi.interface import gmp, ffi
 from gmpy_cffi.mpz import mpz, _new_mpz
+from gmpy_cffi.cache import _del_mpz
 
 
 PY3 = sys.version.startswith('3')
@@ -59,6 +60,178 @@ def next_prime(x):
     return mpz._from_c_mpz(res)
 
 
+# The odd primes below 1000, divided out before the BPSW test
+_SMALL_PRIMORIAL = 1
+for _p in xrange(3, 1000, 2):
+    if all(_p % _d for _d in xrange(3, int(_p ** 0.5) + 1, 2)):
+        _SMALL_PRIMORIAL *= _p
+_SMALL_PRIMORIAL = mpz(_SMALL_PRIMORIAL)
+_ONE = mpz(1)
+_TWO = mpz(2)
+_U64_LIMIT = 1 << 64
+
+
+def _trivial_prp(n):
+    """Return the result of a prp test for n < 3 or even n, else None."""
+    if n < 3 or not gmp.mpz_tstbit(n._mpz, 0):
+        return n == 2
+    return None
+
+
+def is_strong_prp(n, a):
+    """
+    is_strong_prp(n, a) -> bool
+
+    Return True if n is a strong probable prime to the base a, that is,
+    it passes the Miller-Rabin test with base a. a must be at least 2
+    and coprime to n.
+    """
+    n = _check_mpz('is_strong_prp', 'n', n)
+    a = _check_mpz('is_strong_prp', 'a', a)
+    if a < 2:
+        raise ValueError('is_strong_prp() requires a >= 2')
+    trivial = _trivial_prp(n)
+    if trivial is not None:
+        return trivial
+    if gcd(n, a) != 1:
+        raise ValueError('is_strong_prp() requires gcd(n, a) == 1')
+    return gmp.gmpy_strong_prp(n._mpz, a._mpz) != 0
+
+
+def is_strong_lucas_prp(n, p, q):
+    """
+    is_strong_lucas_prp(n, p, q) -> bool
+
+    Return True if n is a strong Lucas probable prime with parameters
+    (p, q). D = p*p - 4*q must not be 0, and n must be coprime to q*D.
+    """
+    n = _check_mpz('is_strong_lucas_prp', 'n', n)
+    p = _check_int('is_strong_lucas_prp', 'p', p)
+    q = _check_int('is_strong_lucas_prp', 'q', q)
+    d = p * p - 4 * q
+    if d == 0:
+        raise ValueError('is_strong_lucas_prp() requires p*p - 4*q != 0')
+    trivial = _trivial_prp(n)
+    if trivial is not None:
+        return trivial
+    if gcd(n, q * d) != 1:
+        raise ValueError('is_strong_lucas_prp() requires gcd(n, q*D) == 1')
+    return gmp.gmpy_strong_lucas_prp(n._mpz, p, q) != 0
+
+
+def _selfridge_prp(n):
+    """The strong Lucas test with Selfridge's parameters, for odd n > 2."""
+    if gmp.mpz_perfect_square_p(n._mpz):
+        return False
+    # The first D in 5, -7, 9, -11, ... with jacobi(D, n) == -1
+    d = 5
+    while True:
+        j = gmp.mpz_si_kronecker(d, n._mpz)
+        if j == -1:
+            break
+        if j == 0 and abs(d) != n:
+            return False
+        d = -d - 2 if d > 0 else -d + 2
+    q = (1 - d) // 4
+    g = gcd(n, q)
+    if g != 1:
+        return g == n
+    return gmp.gmpy_strong_lucas_prp(n._mpz, 1, q) != 0
+
+
+def is_strong_selfridge_prp(n):
+    """
+    is_strong_selfridge_prp(n) -> bool
+
+    Return True if n is a strong Lucas probable prime with Selfridge's
+    parameters: p = 1 and q = (1 - D)/4 for the first D in 5, -7, 9,
+    -11, ... with jacobi(D, n) == -1.
+    """
+    n = _check_mpz('is_strong_selfridge_prp', 'n', n)
+    trivial = _trivial_prp(n)
+    if trivial is not None:
+        return trivial
+    return _selfridge_prp(n)
+
+
+def is_bpsw_prp(n):
+    """
+    is_bpsw_prp(n) -> bool
+
+    Return True if n passes the Baillie-Pomerance-Selfridge-Wagstaff
+    test: a strong probable prime test to base 2 and a strong Lucas
+    test with Selfridge's parameters. No composite passing it is
+    known. Below 2**64 the result is exact, from a Miller-Rabin test
+    with a set of bases known to have no counterexample, run on C
+    integers.
+    """
+    if isinstance(n, (int, long)) and 0 <= n < _U64_LIMIT:
+        return gmp.gmpy_is_prime_u64(n) != 0
+    n = _check_mpz('is_bpsw_prp', 'n', n)
+    if n < 2:
+        return False
+    if gmp.mpz_sizeinbase(n._mpz, 2) <= 64:
+        return gmp.gmpy_is_prime_u64(int(n)) != 0
+    if not gmp.mpz_tstbit(n._mpz, 0) or gcd(n, _SMALL_PRIMORIAL) != 1:
+        return False
+    return (gmp.gmpy_strong_prp(n._mpz, _TWO._mpz) != 0 and
+            _selfridge_prp(n))
+
+
+# is_prime_many() leaves the small primes to mpz_probab_prime_p below
+# this mean size in bits; above it, the primes below a bound growing
+# with the size up to _MANY_MAX_BOUND are divided out first
+_MANY_MIN_BITS = 1024
+_MANY_MAX_BOUND = 1 << 20
+_many_primorials = {}
+
+
+def _many_bound(bits):
+    bound = 1 << 12
+    while bound < _MANY_MAX_BOUND and bound * 64 < bits * bits:
+        bound *= 2
+    return bound
+
+
+def is_prime_many(iterable, n=25, mask=False):
+    """
+    is_prime_many(iterable[, n=25, mask=False]) -> list or mpz
+
+    Return [is_prime(x, n) for x in iterable], testing the values in
+    one C call. For values of 1024 bits or more, the product of the
+    primes up to a bound chosen from their size is first reduced modulo
+    every value with one remainder tree, and the values sharing a
+    factor with it are discarded: this trial division costs much less
+    than is_prime's for large values. If mask is True, return instead
+    an mpz with bit i set if the i-th value is prime.
+    """
+    values = [_check_mpz('is_prime_many', 'x', x) for x in iterable]
+    n = _check_int('is_prime_many', 'n', n)
+    if n <= 0:
+        raise ValueError("is_prime_many repetition count must be positive")
+    bits = sum(gmp.mpz_sizeinbase(x._mpz, 2) for x in values)
+    if bits < _MANY_MIN_BITS * max(len(values), 1):
+        bound, primorial = 0, _ONE
+    else:
+        bound = _many_bound(bits // len(values))
+        primorial = _many_primorials.get(bound)
+        if primorial is None:
+            primorial = _new_mpz()
+            gmp.mpz_primorial_ui(primorial, bound)
+            primorial = _many_primorials[bound] = mpz._from_c_mpz(primorial)
+
+    res = ffi.new('unsigned char[]', len(values))
+    ptrs = ffi.new('__mpz_struct *[]', [x._mpz for x in values])
+    if gmp.gmpy_prime_many(res, ptrs, len(values), primorial._mpz, bound,
+                           n):
+        raise MemoryError
+    res = [bool(r) for r in bytearray(ffi.buffer(res))]
+    if mask:
+        bits = ''.join('1' if r else '0' for r in reversed(res))
+        return mpz(bits or '0', 2)
+    return res
+
+
 def gcd(a, b):
     """
     gcd(a, b) -> mpz
@@ -242,3 +415,114 @@ def lucas2(n):
     res, res1 = _new_mpz(), _new_mpz()
     gmp.mpz_lucnum2_ui(res, res1, n)
     return (mpz._from_c_mpz(res), mpz._from_c_mpz(res1))
+
+
+def _check_moduli(function_name, moduli):
+    moduli = [_check_mpz(function_name, 'modulus', m) for m in moduli]
+    if any(gmp.mpz_sgn(m._mpz) <= 0 for m in moduli):
+        raise ValueError('%s() requires positive moduli' % function_name)
+    return moduli
+
+
+def _product_tree(leaves, owned):
+    """
+    Return the levels of the product tree of the mpz_t leaves, from the
+    leaves up to the root. The last node of a level with an odd length
+    is carried up unchanged. New nodes are appended to owned.
+    """
+    tree = [leaves]
+    level = leaves
+    while len(level) > 1:
+        up = []
+        for i in xrange(0, len(level) - 1, 2):
+            p = _new_mpz()
+            owned.append(p)
+            gmp.mpz_mul(p, level[i], level[i + 1])
+            up.append(p)
+        if len(level) % 2:
+            up.append(level[-1])
+        tree.append(up)
+        level = up
+    return tree
+
+
+def _remainder_tree(tree, root, square):
+    """
+    Reduce the mpz_t root down the product tree: each node is replaced
+    by its parent's value mod the node (or the node squared if square is
+    True). Return the values at the leaves; root and the values are
+    released with _del_mpz as they are used.
+    """
+    values = [root]
+    tmp = _new_mpz()
+    for level in reversed(tree[:-1]):
+        down = []
+        for i, node in enumerate(level):
+            r = _new_mpz()
+            if square:
+                gmp.mpz_mul(tmp, node, node)
+                gmp.mpz_fdiv_r(r, values[i // 2], tmp)
+            else:
+                gmp.mpz_fdiv_r(r, values[i // 2], node)
+            down.append(r)
+        for value in values:
+            _del_mpz(value)
+        values = down
+    _del_mpz(tmp)
+    return values
+
+
+def batch_mod(x, moduli):
+    """
+    batch_mod(x, moduli) -> list
+
+    Return the list of x mod m for each positive integer m in moduli,
+    computed with a product tree and a remainder tree. For many large
+    moduli this is much faster than reducing x by each in turn.
+    """
+    x = _check_mpz('batch_mod', 'x', x)
+    moduli = _check_moduli('batch_mod', moduli)
+    if not moduli:
+        return []
+    owned = []
+    try:
+        tree = _product_tree([m._mpz for m in moduli], owned)
+        root = _new_mpz()
+        gmp.mpz_fdiv_r(root, x._mpz, tree[-1][0])
+        return [mpz._from_c_mpz(r)
+                for r in _remainder_tree(tree, root, False)]
+    finally:
+        for p in owned:
+            _del_mpz(p)
+
+
+def batch_gcd(moduli):
+    """
+    batch_gcd(moduli) -> list
+
+    Return for each positive integer in moduli its gcd with the product
+    of all the others, using Bernstein's product and remainder trees.
+    A result other than 1 means the modulus shares a factor with another
+    one, as happens for RSA moduli generated with a weak random number
+    generator. This takes quasi-linear time rather than the quadratic
+    time of comparing every pair.
+    """
+    moduli = _check_moduli('batch_gcd', moduli)
+    if not moduli:
+        return []
+    owned = []
+    try:
+        tree = _product_tree([m._mpz for m in moduli], owned)
+        root = _new_mpz()
+        gmp.mpz_set(root, tree[-1][0])
+        rems = _remainder_tree(tree, root, True)
+    finally:
+        for p in owned:
+            _del_mpz(p)
+    # rem == product mod m**2, so rem / m == (product / m) mod m
+    res = []
+    for m, rem in zip(moduli, rems):
+        gmp.mpz_divexact(rem, rem, m._mpz)
+        gmp.mpz_gcd(rem, rem, m._mpz)
+        res.append(mpz._from_c_mpz(rem))
+    return res
@@ -0,0 +1,201 @@
+"""
+Conversions between NumPy arrays and gmpy_cffi values.
+
+NumPy is optional and is only imported when one of these functions is
+first called, which raises ImportError without it. The conversions run in C loops over the
+whole array, so they cost one Python call rather than one per element.
+
+mpz_vector also implements the NumPy ufunc protocol for the arithmetic
+and comparison ufuncs and for add.reduce and multiply.reduce, so
+numpy.add(v, a) works for an mpz_vector v and an integer array a.
+"""
+import operator
+import sys
+
+from gmpy_cffi.interface import gmp, ffi
+from gmpy_cffi.mpz import mpz
+from gmpy_cffi.mpq import mpq
+from gmpy_cffi.mpfr import mpfr
+from gmpy_cffi.vector import mpz_vector, _new_vec
+from gmpy_cffi.context import get_context
+
+# Imported by _require_numpy()
+numpy = None
+
+
+if sys.version > '3':
+    long = int
+    xrange = range
+
+
+def _require_numpy(function_name):
+    global numpy
+    if numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError('%s() requires numpy' % function_name)
+
+
+def mpz_array_from_numpy(a):
+    """
+    mpz_array_from_numpy(a) -> mpz_vector
+
+    Return an mpz_vector with the values of the 1-dimensional NumPy array
+    a, which may hold signed or unsigned integers, booleans, finite
+    floats (truncated to integers) or Python integers, mpz and xmpz
+    objects.
+    """
+    _require_numpy('mpz_array_from_numpy')
+    a = numpy.asarray(a)
+    if a.ndim != 1:
+        raise ValueError('mpz_array_from_numpy() requires a 1-dimensional '
+                         'array')
+    n = len(a)
+    kind = a.dtype.kind
+    if kind == 'O':
+        return mpz_vector(a.tolist())
+    if kind in 'bi':
+        a = numpy.ascontiguousarray(a, dtype=numpy.int64)
+        convert, ctype = gmp.gmpy_vec_from_int64, 'int64_t *'
+    elif kind == 'u':
+        a = numpy.ascontiguousarray(a, dtype=numpy.uint64)
+        convert, ctype = gmp.gmpy_vec_from_uint64, 'uint64_t *'
+    elif kind == 'f':
+        a = numpy.ascontiguousarray(a, dtype=numpy.float64)
+        if not numpy.isfinite(a).all():
+            raise ValueError('mpz_array_from_numpy() requires finite values')
+        convert, ctype = gmp.gmpy_vec_from_double, 'double *'
+    else:
+        raise TypeError("mpz_array_from_numpy() can't convert dtype %s" %
+                        a.dtype)
+    res = _new_vec(n)
+    convert(res, ffi.cast(ctype, a.ctypes.data), n)
+    return mpz_vector._from_c_vec(res, n)
+
+
+def _pointers(values):
+    """
+    Return (ctype, pointers) if values are all mpz, all mpq or all mpfr,
+    with pointers an array of pointers to their C values, or else None.
+    """
+    if isinstance(values, mpz_vector):
+        ptrs = ffi.new('__mpz_struct *[]', len(values))
+        gmp.gmpy_vec_ptrs(ptrs, values._v, len(values))
+        return mpz, ptrs
+    for cls, attr, ctype in ((mpz, '_mpz', '__mpz_struct *[]'),
+                             (mpq, '_mpq', '__mpq_struct *[]'),
+                             (mpfr, '_mpfr', '__mpfr_struct *[]')):
+        if all(isinstance(x, cls) for x in values):
+            return cls, ffi.new(ctype, [getattr(x, attr) for x in values])
+    return None
+
+
+def to_numpy(x, dtype=None):
+    """
+    to_numpy(x[, dtype=float64]) -> numpy.ndarray
+
+    Return a NumPy array with the values of the mpz_vector, NumPy array
+    or sequence x. dtype may be float64, int64 or object. Values of a
+    single type (mpz, mpq or mpfr) are converted in C, like float() and
+    int() would; mpfr values round to float64 in the context's rounding
+    mode. int64 requires integer values and raises OverflowError if one
+    does not fit.
+    """
+    _require_numpy('to_numpy')
+    dtype = numpy.dtype(numpy.float64 if dtype is None else dtype)
+    if dtype.kind == 'O':
+        if isinstance(x, mpz_vector):
+            x = x.tolist()
+        res = numpy.empty(len(x), dtype=object)
+        res[:] = x
+        return res
+    if dtype not in (numpy.dtype(numpy.float64), numpy.dtype(numpy.int64)):
+        raise TypeError("to_numpy() can't convert to dtype %s" % dtype)
+
+    shape = None
+    if isinstance(x, numpy.ndarray):
+        shape, x = x.shape, x.ravel().tolist()
+    elif not isinstance(x, mpz_vector):
+        x = list(x)
+    n = len(x)
+    res = numpy.empty(n, dtype=dtype)
+    converted = _pointers(x)
+    if converted is None:
+        convert = float if dtype.kind == 'f' else int
+        res[:] = [convert(value) for value in x]
+    elif dtype.kind == 'f':
+        cls, ptrs = converted
+        out = ffi.cast('double *', res.ctypes.data)
+        if cls is mpz:
+            gmp.gmpy_mpz_get_d_array(out, ptrs, n)
+        elif cls is mpq:
+            gmp.gmpy_mpq_get_d_array(out, ptrs, n)
+        else:
+            gmp.gmpy_mpfr_get_d_array(out, ptrs, n, get_context().round)
+    else:
+        cls, ptrs = converted
+        if cls is not mpz:
+            raise TypeError('to_numpy() requires integers for dtype int64')
+        out = ffi.cast('int64_t *', res.ctypes.data)
+        if gmp.gmpy_mpz_get_int64_array(out, ptrs, n):
+            raise OverflowError('value too large to convert to int64')
+    if shape is not None:
+        res = res.reshape(shape)
+    return res
+
+
+_binary_ufuncs = {
+    'add': operator.add,
+    'subtract': operator.sub,
+    'multiply': operator.mul,
+    'floor_divide': operator.floordiv,
+    'remainder': operator.mod,
+    'power': operator.pow,
+    'less': operator.lt,
+    'less_equal': operator.le,
+    'equal': operator.eq,
+    'not_equal': operator.ne,
+    'greater': operator.gt,
+    'greater_equal': operator.ge,
+}
+
+_reductions = {
+    'add': mpz_vector.sum,
+    'multiply': mpz_vector.prod,
+}
+
+
+def _ufunc_operand(x):
+    if isinstance(x, numpy.ndarray):
+        if x.ndim == 0:
+            return x.item()
+        return mpz_array_from_numpy(x)
+    if isinstance(x, numpy.integer):
+        return int(x)
+    return x
+
+
+def _array_ufunc(ufunc, method, inputs, kwargs):
+    """Implement mpz_vector.__array_ufunc__."""
+    _require_numpy('__array_ufunc__')
+    name = ufunc.__name__
+    if method == 'reduce':
+        if (name not in _reductions or len(inputs) != 1 or
+                any(kwargs.get(key) not in (None, 0)
+                    for key in ('axis', 'out', 'dtype')) or
+                set(kwargs) - set(['axis', 'out', 'dtype'])):
+            return NotImplemented
+        return _reductions[name](inputs[0])
+    if method != '__call__' or name not in _binary_ufuncs or kwargs:
+        return NotImplemented
+    args = [_ufunc_operand(x) for x in inputs]
+    if not any(isinstance(x, mpz_vector) for x in args):
+        return NotImplemented
+    try:
+        res = _binary_ufuncs[name](*args)
+    except TypeError:
+        return NotImplemented
+    if isinstance(res, list):
+        return numpy.array(res, dtype=bool)
+    return res
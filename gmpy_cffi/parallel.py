@@ -0,0 +1,83 @@
+"""
+Process-pool parallel map for big-number workloads.
+
+Arguments and results are pickled, which for mpz, xmpz, mpq, mpfr and
+mpc uses the compact binary format of gmpy_cffi.binary. The function
+must be picklable: a module-level function such as those in
+gmpy_cffi.ntheory and gmpy_cffi.special_functions, not a lambda.
+"""
+import sys
+
+from gmpy_cffi.context import context, get_context, set_context
+
+
+if sys.version > '3':
+    long = int
+    xrange = range
+    izip = zip
+else:
+    from itertools import izip
+
+
+_worker_func = None
+
+
+def _init_worker(func, settings):
+    global _worker_func
+    _worker_func = func
+    set_context(context(**settings))
+
+
+def _call(args):
+    return _worker_func(*args)
+
+
+def pmap(func, *iterables, **kwargs):
+    """
+    pmap(func, *iterables, workers=None, chunksize=1) -> iterator
+
+    Return an iterator over func(*args) for the argument tuples taken
+    from iterables in parallel, like map(), with the calls spread over
+    a pool of 'workers' processes (default: one per CPU). Results are
+    yielded in order as they become available. Arguments are sent to
+    the workers in batches of 'chunksize'; raise it when the individual
+    calls are cheap.
+
+    The workers use a copy of the calling thread's current context, so
+    precision and rounding settings carry over.
+
+        >>> list(pmap(is_prime, [mpz(2)**127 - 1, mpz(2)**128 + 1]))
+        [True, False]
+    """
+    workers = kwargs.pop('workers', None)
+    chunksize = kwargs.pop('chunksize', 1)
+    if kwargs:
+        raise TypeError("pmap() got an unexpected keyword argument '%s'" %
+                        next(iter(kwargs)))
+    if not iterables:
+        raise TypeError('pmap() requires at least one iterable')
+    if workers is not None and not isinstance(workers, (int, long)):
+        raise TypeError('workers must be an integer')
+    if workers is not None and workers < 1:
+        raise ValueError('workers must be at least 1')
+    if not isinstance(chunksize, (int, long)):
+        raise TypeError('chunksize must be an integer')
+    if chunksize < 1:
+        raise ValueError('chunksize must be at least 1')
+
+    ctx = get_context()
+    settings = dict((name, getattr(ctx, name)) for name in context._settings)
+    return _pmap(func, izip(*iterables), workers, chunksize, settings)
+
+
+def _pmap(func, args, workers, chunksize, settings):
+    # Imported here so that importing gmpy_cffi does not pay for it
+    import multiprocessing
+    pool = multiprocessing.Pool(workers, _init_worker, (func, settings))
+    try:
+        for result in pool.imap(_call, args, chunksize):
+            yield result
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
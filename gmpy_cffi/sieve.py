@@ -0,0 +1,144 @@
+"""
+Enumeration of primes with a segmented sieve of Eratosthenes.
+
+primerange() and primes() sieve one segment of _SEGMENT numbers at a
+time, so they stream in constant memory however wide the range is. The
+odd numbers of a segment are a 16 KiB bit array, which stays in the
+processor cache while every base prime up to the square root of its end
+is crossed off in C (gmpy_sieve_segment in _gmp_build.py).
+
+The base primes are kept up to _BASE_LIMIT, which makes the sieve exact
+below _BASE_LIMIT ** 2 = 2**50; the numbers left above that are checked
+with is_bpsw_prp(), which is exact below 2**64, so the primes above
+that are probable primes. Above 2**63, which the C loop does not
+handle, the segments are sieved with bytearray slices.
+"""
+import sys
+from itertools import compress
+
+from gmpy_cffi.interface import gmp, ffi
+from gmpy_cffi.mpz import mpz
+from gmpy_cffi.ntheory import _check_mpz, is_bpsw_prp
+
+
+if sys.version > '3':
+    long = int
+    xrange = range
+
+
+_SEGMENT = 1 << 18
+_BASE_LIMIT = 1 << 25
+_C_LIMIT = 1 << 63
+_MPZ_LIMIT = 1 << 64
+# The smallest limit the base primes are extended to, and the bound
+# of the base primes used above _C_LIMIT, where survivors are tested
+_MIN_BASE = 1 << 16
+
+# (limit, list of the odd primes <= limit, the same as a uint32_t[])
+_base = (1, [], ffi.new('uint32_t[]', 0))
+
+
+def _simple_sieve(limit):
+    """Return the list of odd primes <= limit."""
+    sieve = bytearray([1]) * (limit + 1)
+    for i in xrange(3, int(limit ** 0.5) + 1, 2):
+        if sieve[i]:
+            sieve[i * i::2 * i] = bytearray(len(xrange(i * i, limit + 1,
+                                                       2 * i)))
+    return [i for i in xrange(3, limit + 1, 2) if sieve[i]]
+
+
+def _base_primes(limit):
+    """
+    Return (list, array) with the odd primes up to at least
+    min(limit, _BASE_LIMIT), and possibly some more.
+    """
+    global _base
+    base = _base
+    if limit > base[0] and base[0] < _BASE_LIMIT:
+        limit = min(max(limit, 2 * base[0], _MIN_BASE), _BASE_LIMIT)
+        primes = _simple_sieve(limit)
+        base = _base = (limit, primes, ffi.new('uint32_t[]', primes))
+    return base[1], base[2]
+
+
+def _isqrt(n):
+    """Return an upper bound for the square root of n (n < 2**64)."""
+    return int(n ** 0.5) + 1
+
+
+def _segment_c(lo, hi, out, bits):
+    """
+    Return the list of primes in [lo, hi) for odd lo >= 3 and
+    hi <= _C_LIMIT, with out and bits the scratch buffers.
+    """
+    primes, array = _base_primes(_isqrt(hi))
+    count = gmp.gmpy_sieve_segment(out, lo, hi, array, len(primes), bits)
+    res = ffi.unpack(out, count)
+    if hi > _BASE_LIMIT ** 2:
+        res = [p for p in res if is_bpsw_prp(p)]
+    return res
+
+
+def _segment_py(lo, hi):
+    """Return the list of primes in [lo, hi) for odd lo > _MIN_BASE."""
+    n = (hi - lo + 1) // 2
+    flags = bytearray([1]) * n
+    primes = _base_primes(_MIN_BASE)[0]
+    for p in primes:
+        if p > _MIN_BASE:
+            break
+        start = -(-lo // p) * p
+        if start % 2 == 0:
+            start += p
+        j = (start - lo) // 2
+        flags[j::p] = bytearray(len(xrange(j, n, p)))
+    res = []
+    for j in compress(xrange(n), flags):
+        p = lo + 2 * j
+        if is_bpsw_prp(p):
+            res.append(p if p < _MPZ_LIMIT else mpz(p))
+    return res
+
+
+def _sieve(a, b):
+    if a <= 2 and (b is None or b > 2):
+        yield 2
+    lo = max(a, 3) | 1
+    out = ffi.new('uint64_t[]', _SEGMENT // 2)
+    bits = ffi.new('unsigned char[]', _SEGMENT // 16)
+    while b is None or lo < b:
+        hi = lo + _SEGMENT
+        if b is not None and hi > b:
+            hi = b
+        if hi <= _C_LIMIT:
+            segment = _segment_c(lo, hi, out, bits)
+        else:
+            segment = _segment_py(lo, hi)
+        for p in segment:
+            yield p
+        lo = hi | 1
+
+
+def primerange(a, b):
+    """
+    primerange(a, b) -> iterator
+
+    Return an iterator over the primes p with a <= p < b, in increasing
+    order. Primes below 2**64 are int, larger ones mpz. The range is
+    sieved in segments of fixed size, so it may be arbitrarily wide.
+    Above 2**64 the primes are probable primes, as for is_bpsw_prp().
+    """
+    a = int(_check_mpz('primerange', 'a', a))
+    b = int(_check_mpz('primerange', 'b', b))
+    return _sieve(a, b)
+
+
+def primes(start=2):
+    """
+    primes([start=2]) -> iterator
+
+    Return an endless iterator over the primes p >= start, in
+    increasing order, as for primerange().
+    """
+    return _sieve(int(_check_mpz('primes', 'start', start)), None)
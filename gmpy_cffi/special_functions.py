@@ -1,6 +1,7 @@
 import sys
 
 from gmpy_cffi.interface import gmp, ffi
+from gmpy_cffi.context import get_context
 from gmpy_cffi.mpz import mpz
 from gmpy_cffi.mpq import mpq
 from gmpy_cffi.mpfr import mpfr, _new_mpfr
@@ -23,7 +24,7 @@ def _init_check_mpfr(x):
     elif isinstance(x, float):
         res = _new_mpfr()
         mpfr_x = res        # avoid initialising another c mpfr
-        gmp.mpfr_set_d(mpfr_x, x, gmp.MPFR_RNDN)
+        gmp.mpfr_set_d(mpfr_x, x, get_context().round)
     elif isinstance(x, (int, long)):
         res = _new_mpfr()
         mpfr_x = res        # avoid initialising another c mpfr
@@ -31,11 +32,11 @@ def _init_check_mpfr(x):
     elif isinstance(x, mpz):
         res = _new_mpfr()
         mpfr_x = res        # avoid initialising another c mpfr
-        gmp.mpfr_set_z(mpfr_x, x._mpz, gmp.MPFR_RNDN)
+        gmp.mpfr_set_z(mpfr_x, x._mpz, get_context().round)
     elif isinstance(x, mpq):
         res = _new_mpfr()
         mpfr_x = res        # avoid initialising another c mpfr
-        gmp.mpfr_set_q(mpfr_x, x._mpq, gmp.MPFR_RNDN)
+        gmp.mpfr_set_q(mpfr_x, x._mpq, get_context().round)
     else:
         raise TypeError
     return res, mpfr_x
@@ -51,27 +52,28 @@ def _init_check_mpc(x):
     elif isinstance(x, complex):
         res = _new_mpc()
         mpc_x = res        # avoid initialising another c mpc
-        gmp.mpc_set_d_d(mpc_x, x.real, x.imag, gmp.MPC_RNDNN)
+        gmp.mpc_set_d_d(mpc_x, x.real, x.imag, get_context()._mpc_round)
     elif isinstance(x, mpfr):
         res = _new_mpc()
         mpc_x = res        # avoid initialising another c mpc
-        gmp.mpc_set_fr(mpc_x, x, gmp.MPC_RNDNN)
+        gmp.mpc_set_fr(mpc_x, x._mpfr, get_context()._mpc_round)
     elif isinstance(x, float):
         res = _new_mpc()
-        gmp.mpc_set_d(mpc_x, x, gmp.MPC_RNDNN)
+        mpc_x = res        # avoid initialising another c mpc
+        gmp.mpc_set_d(mpc_x, x, get_context()._mpc_round)
     elif isinstance(x, (int, long)):
         res = _new_mpc()
         mpc_x = res        # avoid initialising another c mpc
         _pyint_to_mpfr(x, gmp.mpc_realref(mpc_x))
-        gmp.mpfr_set_ui(gmp.mpc_imagref(mpc_x), 0, gmp.MPC_RNDNN)
+        gmp.mpfr_set_ui(gmp.mpc_imagref(mpc_x), 0, get_context()._iround)
     elif isinstance(x, mpz):
         res = _new_mpc()
         mpc_x = res        # avoid initialising another c mpc
-        gmp.mpc_set_z(mpc_x, x._mpz, gmp.MPC_RNDNN)
+        gmp.mpc_set_z(mpc_x, x._mpz, get_context()._mpc_round)
     elif isinstance(x, mpq):
         res = _new_mpc()
         mpc_x = res        # avoid initialising another c mpc
-        gmp.mpc_set_q(mpc_x, x._mpq, gmp.MPC_RNDNN)
+        gmp.mpc_set_q(mpc_x, x._mpq, get_context()._mpc_round)
     else:
         raise TypeError
     return res, mpc_x
@@ -85,11 +87,11 @@ def log(x):
     """
     try:
         res, x = _init_check_mpfr(x)
-        gmp.mpfr_log(res, x, gmp.MPFR_RNDN)
+        gmp.mpfr_log(res, x, get_context().round)
         return mpfr._from_c_mpfr(res)
     except TypeError:
         res, x = _init_check_mpc(x)
-        gmp.mpc_log(res, x, gmp.MPC_RNDNN)
+        gmp.mpc_log(res, x, get_context()._mpc_round)
         return mpc._from_c_mpc(res)
 
 
@@ -100,7 +102,7 @@ def log2(x):
     Return the base-2 logarithm of x.
     """
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_log2(res, x, gmp.MPFR_RNDN)
+    gmp.mpfr_log2(res, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -111,11 +113,11 @@ def log10(x):
     Return the base-10 logarithm of x.
     """
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_log10(res, x, gmp.MPFR_RNDN)
+    gmp.mpfr_log10(res, x, get_context().round)
     return mpfr._from_c_mpfr(res)
     # except TypeError:
     #     res, x = _init_check_mpc(x)
-    #     gmp.mpc_log10(res, x, gmp.MPC_RNDNN)
+    #     gmp.mpc_log10(res, x, get_context()._mpc_round)
     #     return mpc._from_c_mpc(res)
 
 
@@ -127,11 +129,11 @@ def exp(x):
     """
     try:
         res, x = _init_check_mpfr(x)
-        gmp.mpfr_exp(res, x, gmp.MPFR_RNDN)
+        gmp.mpfr_exp(res, x, get_context().round)
         return mpfr._from_c_mpfr(res)
     except TypeError:
         res, x = _init_check_mpc(x)
-        gmp.mpc_exp(res, x, gmp.MPC_RNDNN)
+        gmp.mpc_exp(res, x, get_context()._mpc_round)
         return mpc._from_c_mpc(res)
 
 
@@ -142,7 +144,7 @@ def exp2(x):
     Return 2**x.
     """
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_exp2(res, x, gmp.MPFR_RNDN)
+    gmp.mpfr_exp2(res, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -153,7 +155,7 @@ def exp10(x):
     Return 10**x.
     """
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_exp10(res, x, gmp.MPFR_RNDN)
+    gmp.mpfr_exp10(res, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -165,11 +167,11 @@ def cos(x):
     """
     try:
         res, x = _init_check_mpfr(x)
-        gmp.mpfr_cos(res, x, gmp.MPFR_RNDN)
+        gmp.mpfr_cos(res, x, get_context().round)
         return mpfr._from_c_mpfr(res)
     except TypeError:
         res, x = _init_check_mpc(x)
-        gmp.mpc_cos(res, x, gmp.MPC_RNDNN)
+        gmp.mpc_cos(res, x, get_context()._mpc_round)
         return mpc._from_c_mpc(res)
 
 
@@ -181,11 +183,11 @@ def sin(x):
     """
     try:
         res, x = _init_check_mpfr(x)
-        gmp.mpfr_sin(res, x, gmp.MPFR_RNDN)
+        gmp.mpfr_sin(res, x, get_context().round)
         return mpfr._from_c_mpfr(res)
     except TypeError:
         res, x = _init_check_mpc(x)
-        gmp.mpc_sin(res, x, gmp.MPC_RNDNN)
+        gmp.mpc_sin(res, x, get_context()._mpc_round)
         return mpc._from_c_mpc(res)
 
 
@@ -197,11 +199,11 @@ def tan(x):
     """
     try:
         res, x = _init_check_mpfr(x)
-        gmp.mpfr_tan(res, x, gmp.MPFR_RNDN)
+        gmp.mpfr_tan(res, x, get_context().round)
         return mpfr._from_c_mpfr(res)
     except TypeError:
         res, x = _init_check_mpc(x)
-        gmp.mpc_tan(res, x, gmp.MPC_RNDNN)
+        gmp.mpc_tan(res, x, get_context()._mpc_round)
         return mpc._from_c_mpc(res)
 
 
@@ -219,6 +221,7 @@ def sin_cos(x):
         res1 = _new_mpfr()
         res2 = _new_mpfr()
         mpfr_x = res1
+        gmp.mpfr_set_d(mpfr_x, x, get_context().round)
     elif isinstance(x, (int, long)):
         res1 = _new_mpfr()
         res2 = _new_mpfr()
@@ -228,12 +231,12 @@ def sin_cos(x):
         res1 = _new_mpfr()
         res2 = _new_mpfr()
         mpfr_x = res1
-        gmp.mpfr_set_z(mpfr_x, x._mpz, gmp.MPFR_RNDN)
+        gmp.mpfr_set_z(mpfr_x, x._mpz, get_context().round)
     elif isinstance(x, mpq):
         res1 = _new_mpfr()
         res2 = _new_mpfr()
         mpfr_x = res1
-        gmp.mpfr_set_q(mpfr_x, x._mpq, gmp.MPFR_RNDN)
+        gmp.mpfr_set_q(mpfr_x, x._mpq, get_context().round)
     else:
         if isinstance(x, mpc):
             res1 = _new_mpc()
@@ -243,12 +246,13 @@ def sin_cos(x):
             res1 = _new_mpc()
             res2 = _new_mpc()
             mpc_x = res1
-            gmp.mpc_set_d_d(mpc_x, x.real, x.imag, gmp.MPC_RNDNN)
+            gmp.mpc_set_d_d(mpc_x, x.real, x.imag, get_context()._mpc_round)
         else:
             raise TypeError
-        gmp.mpc_sin_cos(res1, res2, mpc_x, gmp.MPC_RNDNN, gmp.MPC_RNDNN)
+        gmp.mpc_sin_cos(res1, res2, mpc_x, get_context()._mpc_round,
+                        get_context()._mpc_round)
         return (mpc._from_c_mpc(res1), mpc._from_c_mpc(res2))
-    gmp.mpfr_sin_cos(res1, res2, mpfr_x, gmp.MPFR_RNDN)
+    gmp.mpfr_sin_cos(res1, res2, mpfr_x, get_context().round)
     return (mpfr._from_c_mpfr(res1), mpfr._from_c_mpfr(res2))
 
 
@@ -259,7 +263,7 @@ def sec(x):
     Return the secant of x; x in radians.
     """
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_sec(res, x, gmp.MPFR_RNDN)
+    gmp.mpfr_sec(res, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -270,7 +274,7 @@ def csc(x):
     Return the cosecant of x; x in radians.
     """
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_csc(res, x, gmp.MPFR_RNDN)
+    gmp.mpfr_csc(res, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -281,7 +285,7 @@ def cot(x):
     Return the cotangent of x; x in radians.
     """
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_cot(res, x, gmp.MPFR_RNDN)
+    gmp.mpfr_cot(res, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -293,11 +297,11 @@ def acos(x):
     """
     try:
         res, x = _init_check_mpfr(x)
-        gmp.mpfr_acos(res, x, gmp.MPFR_RNDN)
+        gmp.mpfr_acos(res, x, get_context().round)
         return mpfr._from_c_mpfr(res)
     except TypeError:
         res, x = _init_check_mpc(x)
-        gmp.mpc_acos(res, x, gmp.MPC_RNDNN)
+        gmp.mpc_acos(res, x, get_context()._mpc_round)
         return mpc._from_c_mpc(res)
 
 
@@ -309,11 +313,11 @@ def asin(x):
     """
     try:
         res, x = _init_check_mpfr(x)
-        gmp.mpfr_asin(res, x, gmp.MPFR_RNDN)
+        gmp.mpfr_asin(res, x, get_context().round)
         return mpfr._from_c_mpfr(res)
     except TypeError:
         res, x = _init_check_mpc(x)
-        gmp.mpc_asin(res, x, gmp.MPC_RNDNN)
+        gmp.mpc_asin(res, x, get_context()._mpc_round)
         return mpc._from_c_mpc(res)
 
 
@@ -325,11 +329,11 @@ def atan(x):
     """
     try:
         res, x = _init_check_mpfr(x)
-        gmp.mpfr_atan(res, x, gmp.MPFR_RNDN)
+        gmp.mpfr_atan(res, x, get_context().round)
         return mpfr._from_c_mpfr(res)
     except TypeError:
         res, x = _init_check_mpc(x)
-        gmp.mpc_atan(res, x, gmp.MPC_RNDNN)
+        gmp.mpc_atan(res, x, get_context()._mpc_round)
         return mpc._from_c_mpc(res)
 
 
@@ -344,16 +348,16 @@ def atan2(y, x):
         mpfr_x = x._mpfr
     elif isinstance(x, float):
         mpfr_x = _new_mpfr()
-        gmp.mpfr_set_d(mpfr_x, x, gmp.MPFR_RNDN)
+        gmp.mpfr_set_d(mpfr_x, x, get_context().round)
     elif isinstance(x, (int, long)):
         mpfr_x = _new_mpfr()
         _pyint_to_mpfr(x, mpfr_x)
     elif isinstance(x, mpz):
         mpfr_x = _new_mpfr()
-        gmp.mpfr_set_z(mpfr_x, x._mpz, gmp.MPFR_RNDN)
+        gmp.mpfr_set_z(mpfr_x, x._mpz, get_context().round)
     elif isinstance(x, mpq):
         mpfr_x = _new_mpfr()
-        gmp.mpfr_set_q(mpfr_x, x._mpq, gmp.MPFR_RNDN)
+        gmp.mpfr_set_q(mpfr_x, x._mpq, get_context().round)
     else:
         raise TypeError
 
@@ -362,21 +366,21 @@ def atan2(y, x):
         mpfr_y = y._mpfr
     elif isinstance(y, float):
         mpfr_y = _new_mpfr()
-        gmp.mpfr_set_d(mpfr_y, y, gmp.MPFR_RNDN)
+        gmp.mpfr_set_d(mpfr_y, y, get_context().round)
     elif isinstance(y, (int, long)):
         mpfr_y = _new_mpfr()
         _pyint_to_mpfr(y, mpfr_y)
     elif isinstance(y, mpz):
         mpfr_y = _new_mpfr()
-        gmp.mpfr_set_z(mpfr_y, y._mpz, gmp.MPFR_RNDN)
+        gmp.mpfr_set_z(mpfr_y, y._mpz, get_context().round)
     elif isinstance(y, mpq):
         mpfr_y = _new_mpfr()
-        gmp.mpfr_set_q(mpfr_y, y._mpq, gmp.MPFR_RNDN)
+        gmp.mpfr_set_q(mpfr_y, y._mpq, get_context().round)
     else:
         raise TypeError
 
     res = _new_mpfr(min(gmp.mpfr_get_prec(mpfr_x), gmp.mpfr_get_prec(mpfr_x)))
-    gmp.mpfr_atan2(res, mpfr_y, mpfr_x, gmp.MPFR_RNDN)
+    gmp.mpfr_atan2(res, mpfr_y, mpfr_x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -388,11 +392,11 @@ def cosh(x):
     """
     try:
         res, x = _init_check_mpfr(x)
-        gmp.mpfr_cosh(res, x, gmp.MPFR_RNDN)
+        gmp.mpfr_cosh(res, x, get_context().round)
         return mpfr._from_c_mpfr(res)
     except TypeError:
         res, x = _init_check_mpc(x)
-        gmp.mpc_cosh(res, x, gmp.MPC_RNDNN)
+        gmp.mpc_cosh(res, x, get_context()._mpc_round)
         return mpc._from_c_mpc(res)
 
 
@@ -404,11 +408,11 @@ def sinh(x):
     """
     try:
         res, x = _init_check_mpfr(x)
-        gmp.mpfr_sinh(res, x, gmp.MPFR_RNDN)
+        gmp.mpfr_sinh(res, x, get_context().round)
         return mpfr._from_c_mpfr(res)
     except TypeError:
         res, x = _init_check_mpc(x)
-        gmp.mpc_sinh(res, x, gmp.MPC_RNDNN)
+        gmp.mpc_sinh(res, x, get_context()._mpc_round)
         return mpc._from_c_mpc(res)
 
 
@@ -420,11 +424,11 @@ def tanh(x):
     """
     try:
         res, x = _init_check_mpfr(x)
-        gmp.mpfr_tanh(res, x, gmp.MPFR_RNDN)
+        gmp.mpfr_tanh(res, x, get_context().round)
         return mpfr._from_c_mpfr(res)
     except TypeError:
         res, x = _init_check_mpc(x)
-        gmp.mpc_tanh(res, x, gmp.MPC_RNDNN)
+        gmp.mpc_tanh(res, x, get_context()._mpc_round)
         return mpc._from_c_mpc(res)
 
 
@@ -442,7 +446,7 @@ def sinh_cosh(x):
         res1 = _new_mpfr()
         res2 = _new_mpfr()
         mpfr_x = res1
-        gmp.mpfr_set_d(mpfr_x, x, gmp.MPFR_RNDN)
+        gmp.mpfr_set_d(mpfr_x, x, get_context().round)
     elif isinstance(x, (int, long)):
         res1 = _new_mpfr()
         res2 = _new_mpfr()
@@ -452,15 +456,15 @@ def sinh_cosh(x):
         res1 = _new_mpfr()
         res2 = _new_mpfr()
         mpfr_x = res1
-        gmp.mpfr_set_z(mpfr_x, x._mpz, gmp.MPFR_RNDN)
+        gmp.mpfr_set_z(mpfr_x, x._mpz, get_context().round)
     elif isinstance(x, mpq):
         res1 = _new_mpfr()
         res2 = _new_mpfr()
         mpfr_x = res1
-        gmp.mpfr_set_q(mpfr_x, x._mpq, gmp.MPFR_RNDN)
+        gmp.mpfr_set_q(mpfr_x, x._mpq, get_context().round)
     else:
         raise TypeError
-    gmp.mpfr_sinh_cosh(res1, res2, mpfr_x, gmp.MPFR_RNDN)
+    gmp.mpfr_sinh_cosh(res1, res2, mpfr_x, get_context().round)
     return (mpfr._from_c_mpfr(res1), mpfr._from_c_mpfr(res2))
 
 
@@ -471,7 +475,7 @@ def sech(x):
     Return the hyperbolic secant of x.
     """
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_sech(res, x, gmp.MPFR_RNDN)
+    gmp.mpfr_sech(res, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -482,7 +486,7 @@ def csch(x):
     Return the hyperbolic cosecant of x.
     """
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_csch(res, x, gmp.MPFR_RNDN)
+    gmp.mpfr_csch(res, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -493,7 +497,7 @@ def coth(x):
     Return the hyperbolic cotangent of x.
     """
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_coth(res, x, gmp.MPFR_RNDN)
+    gmp.mpfr_coth(res, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -505,11 +509,11 @@ def acosh(x):
     """
     try:
         res, x = _init_check_mpfr(x)
-        gmp.mpfr_acosh(res, x, gmp.MPFR_RNDN)
+        gmp.mpfr_acosh(res, x, get_context().round)
         return mpfr._from_c_mpfr(res)
     except TypeError:
         res, x = _init_check_mpc(x)
-        gmp.mpc_acosh(res, x, gmp.MPC_RNDNN)
+        gmp.mpc_acosh(res, x, get_context()._mpc_round)
         return mpc._from_c_mpc(res)
 
 
@@ -521,11 +525,11 @@ def asinh(x):
     """
     try:
         res, x = _init_check_mpfr(x)
-        gmp.mpfr_asinh(res, x, gmp.MPFR_RNDN)
+        gmp.mpfr_asinh(res, x, get_context().round)
         return mpfr._from_c_mpfr(res)
     except TypeError:
         res, x = _init_check_mpc(x)
-        gmp.mpc_asinh(res, x, gmp.MPC_RNDNN)
+        gmp.mpc_asinh(res, x, get_context()._mpc_round)
         return mpc._from_c_mpc(res)
 
 
@@ -537,11 +541,11 @@ def atanh(x):
     """
     try:
         res, x = _init_check_mpfr(x)
-        gmp.mpfr_atanh(res, x, gmp.MPFR_RNDN)
+        gmp.mpfr_atanh(res, x, get_context().round)
         return mpfr._from_c_mpfr(res)
     except TypeError:
         res, x = _init_check_mpc(x)
-        gmp.mpc_atanh(res, x, gmp.MPC_RNDNN)
+        gmp.mpc_atanh(res, x, get_context()._mpc_round)
         return mpc._from_c_mpc(res)
 
 
@@ -556,7 +560,7 @@ def factorial(n):
     if isinstance(n, (int, long)):
         if 0 <= n <= MAX_UI:
             res = _new_mpfr()
-            gmp.mpfr_fac_ui(res, n, gmp.MPFR_RNDN)
+            gmp.mpfr_fac_ui(res, n, get_context().round)
             return mpfr._from_c_mpfr(res)
         elif n < 0:
             raise ValueError("factorial() of negative number")
@@ -570,7 +574,7 @@ def log1p(x):
     Return the logarithm of (1+x).
     """
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_log1p(res, x, gmp.MPFR_RNDN)
+    gmp.mpfr_log1p(res, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -581,7 +585,7 @@ def expm1(x):
     Return exponential(x) - 1.
     """
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_expm1(res, x, gmp.MPFR_RNDN)
+    gmp.mpfr_expm1(res, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -592,7 +596,7 @@ def eint(x):
     Return the exponential integral of x.
     """
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_eint(res, x, gmp.MPFR_RNDN)
+    gmp.mpfr_eint(res, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -603,7 +607,7 @@ def li2(x):
     Return the real part of dilogarithm of x.
     """
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_li2(res, x, gmp.MPFR_RNDN)
+    gmp.mpfr_li2(res, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -614,7 +618,7 @@ def gamma(x):
     Return gamma of x.
     """
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_gamma(res, x, gmp.MPFR_RNDN)
+    gmp.mpfr_gamma(res, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -625,7 +629,7 @@ def lngamma(x):
     Return logarithm of gamma(x).
     """
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_lngamma(res, x, gmp.MPFR_RNDN)
+    gmp.mpfr_lngamma(res, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -638,7 +642,7 @@ def lgamma(x):
     """
     res, x = _init_check_mpfr(x)
     sgn = ffi.new('int *')
-    gmp.mpfr_lgamma(res, sgn, x, gmp.MPFR_RNDN)
+    gmp.mpfr_lgamma(res, sgn, x, get_context().round)
     return (mpfr._from_c_mpfr(res), int(sgn[0]))
 
 
@@ -649,7 +653,7 @@ def digamma(x):
     Return digamma of x.
     """
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_digamma(res, x, gmp.MPFR_RNDN)
+    gmp.mpfr_digamma(res, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -661,9 +665,9 @@ def zeta(x):
     """
     # if isinstance(x, (int, long)) and 0 <= x <= MAX_UI:
     #     res = _new_mpfr()
-    #     gmp.mpfr_zeta_ui(res, x, gmp.MPFR_RNDN)
+    #     gmp.mpfr_zeta_ui(res, x, get_context().round)
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_zeta(res, x, gmp.MPFR_RNDN)
+    gmp.mpfr_zeta(res, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -674,7 +678,7 @@ def erf(x):
     Return error function of x.
     """
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_erf(res, x, gmp.MPFR_RNDN)
+    gmp.mpfr_erf(res, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -685,7 +689,7 @@ def erfc(x):
     Return complementary error function of x.
     """
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_erfc(res, x, gmp.MPFR_RNDN)
+    gmp.mpfr_erfc(res, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -696,7 +700,7 @@ def j0(x):
     Return the first kind Bessel function of order 0 of x.
     """
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_j0(res, x, gmp.MPFR_RNDN)
+    gmp.mpfr_j0(res, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -707,7 +711,7 @@ def j1(x):
     Return the first kind Bessel function of order 1 of x.
     """
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_j1(res, x, gmp.MPFR_RNDN)
+    gmp.mpfr_j1(res, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -720,7 +724,7 @@ def jn(x, n):
     if not (isinstance(n, (int, long)) and -sys.maxsize-1 <= n <= sys.maxsize):
         raise TypeError("yn() requires 'mpfr', 'int' arguments")
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_jn(res, n, x, gmp.MPFR_RNDN)
+    gmp.mpfr_jn(res, n, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -731,7 +735,7 @@ def y0(x):
     Return the second kind Bessel function of order 0 of x.
     """
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_y0(res, x, gmp.MPFR_RNDN)
+    gmp.mpfr_y0(res, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -742,7 +746,7 @@ def y1(x):
     Return the second kind Bessel function of order 1 of x.
     """
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_y1(res, x, gmp.MPFR_RNDN)
+    gmp.mpfr_y1(res, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -755,7 +759,7 @@ def yn(x, n):
     if not (isinstance(n, (int, long)) and -sys.maxsize-1 <= n <= sys.maxsize):
         raise TypeError("yn() requires 'mpfr', 'int' arguments")
     res, x = _init_check_mpfr(x)
-    gmp.mpfr_yn(res, n, x, gmp.MPFR_RNDN)
+    gmp.mpfr_yn(res, n, x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -770,14 +774,14 @@ def fma(x, y, z):
         res, mpfr_x = _init_check_mpfr(x)
         res, mpfr_y = _init_check_mpfr(y)
         res, mpfr_z = _init_check_mpfr(z)
-        gmp.mpfr_fma(res, mpfr_x, mpfr_y, mpfr_z, gmp.MPFR_RNDN)
+        gmp.mpfr_fma(res, mpfr_x, mpfr_y, mpfr_z, get_context().round)
         return mpfr._from_c_mpfr(res)
     except TypeError:
         # XXX Optimise
         res, mpc_x = _init_check_mpc(x)
         res, mpc_y = _init_check_mpc(y)
         res, mpc_z = _init_check_mpc(z)
-        gmp.mpc_fma(res, mpc_x, mpc_y, mpc_z, gmp.MPC_RNDNN)
+        gmp.mpc_fma(res, mpc_x, mpc_y, mpc_z, get_context()._mpc_round)
         return mpc._from_c_mpc(res)
 
 
@@ -791,7 +795,7 @@ def fms(x, y, z):
     res, mpfr_x = _init_check_mpfr(x)
     res, mpfr_y = _init_check_mpfr(y)
     res, mpfr_z = _init_check_mpfr(z)
-    gmp.mpfr_fms(res, mpfr_x, mpfr_y, mpfr_z, gmp.MPFR_RNDN)
+    gmp.mpfr_fms(res, mpfr_x, mpfr_y, mpfr_z, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -804,7 +808,7 @@ def agm(x, y):
     # XXX Optimise
     res, mpfr_x = _init_check_mpfr(x)
     res, mpfr_y = _init_check_mpfr(y)
-    gmp.mpfr_agm(res, mpfr_x, mpfr_y, gmp.MPFR_RNDN)
+    gmp.mpfr_agm(res, mpfr_x, mpfr_y, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -817,7 +821,7 @@ def hypot(x, y):
     # XXX Optimise
     res, mpfr_x = _init_check_mpfr(x)
     res, mpfr_y = _init_check_mpfr(y)
-    gmp.mpfr_hypot(res, mpfr_x, mpfr_y, gmp.MPFR_RNDN)
+    gmp.mpfr_hypot(res, mpfr_x, mpfr_y, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -828,7 +832,7 @@ def ai(x):
     Return the Airy function of x.
     """
     res, mpfr_x = _init_check_mpfr(x)
-    gmp.mpfr_ai(res, mpfr_x, gmp.MPFR_RNDN)
+    gmp.mpfr_ai(res, mpfr_x, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -840,7 +844,7 @@ def const_log2(precision=0):
     precision is specified, the default precision is used.
     """
     res = _new_mpfr(precision)
-    gmp.mpfr_const_log2(res, gmp.MPFR_RNDN)
+    gmp.mpfr_const_log2(res, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -852,7 +856,7 @@ def const_pi(precision=0):
     precision is specified, the default precision is used.
     """
     res = _new_mpfr(precision)
-    gmp.mpfr_const_pi(res, gmp.MPFR_RNDN)
+    gmp.mpfr_const_pi(res, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -864,7 +868,7 @@ def const_euler(precision=0):
     precision is specified, the default precision is used.
     """
     res = _new_mpfr(precision)
-    gmp.mpfr_const_euler(res, gmp.MPFR_RNDN)
+    gmp.mpfr_const_euler(res, get_context().round)
     return mpfr._from_c_mpfr(res)
 
 
@@ -876,5 +880,5 @@ def const_catalan(precision=0):
     precision is specified, the default precision is used.
     """
     res = _new_mpfr(precision)
-    gmp.mpfr_const_catalan(res, gmp.MPFR_RNDN)
+    gmp.mpfr_const_catalan(res, get_context().round)
     return mpfr._from_c_mpfr(res)
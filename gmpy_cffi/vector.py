@@ -0,0 +1,300 @@
+import operator
+import sys
+
+import gmpy_cffi
+from gmpy_cffi.interface import gmp, ffi
+from gmpy_cffi.convert import _pyint_to_mpz, _mpz_to_str
+from gmpy_cffi.cache import _new_mpz, _del_mpz
+from gmpy_cffi.mpz import mpz
+
+
+if sys.version > '3':
+    long = int
+    xrange = range
+
+
+def _new_vec(n):
+    """Return an array of n initialized mpz_t, cleared on collection."""
+    v = gmp.gmpy_vec_new(n)
+    if v == ffi.NULL:
+        raise MemoryError
+    return ffi.gc(v, lambda v: gmp.gmpy_vec_free(v, n))
+
+
+def _set_element(a, x):
+    if isinstance(x, mpz):
+        gmp.mpz_set(a, x._mpz)
+    elif isinstance(x, (int, long)):
+        _pyint_to_mpz(x, a)
+    else:
+        raise TypeError('mpz_vector() requires integer elements')
+
+
+def _check_status(status):
+    if status == 1:
+        raise ZeroDivisionError('mpz_vector division by zero')
+    if status == 2:
+        raise ValueError('mpz_vector pow with negative exponent')
+    if status == 3:
+        raise ValueError('mpz_vector pow with outrageous exponent')
+
+
+class mpz_vector(object):
+    """
+    mpz_vector(iterable) -> mpz_vector
+
+    Return a fixed-length array of integers stored contiguously as
+    mpz_t values. Arithmetic (+, -, *, //, %, ** and pow() with a
+    modulus) and comparisons with another mpz_vector of the same length
+    or with an integer apply elementwise, with the loop running in C;
+    comparisons return a list of bools. sum(), prod() and dot() reduce
+    the vector to an mpz.
+
+        >>> v = mpz_vector([1, 2, 3])
+        >>> (v * v + 1).tolist()
+        [mpz(2), mpz(5), mpz(10)]
+        >>> v.dot(v)
+        mpz(14)
+    """
+    __slots__ = ('_v', '_n')
+    __hash__ = None
+
+    def __init__(self, iterable=()):
+        if isinstance(iterable, mpz_vector):
+            self._n = n = iterable._n
+            self._v = _new_vec(n)
+            gmp.gmpy_vec_set(self._v, iterable._v, n)
+            return
+        values = list(iterable)
+        self._n = len(values)
+        self._v = v = _new_vec(self._n)
+        for i, x in enumerate(values):
+            _set_element(v + i, x)
+
+    @classmethod
+    def _from_c_vec(cls, v, n):
+        inst = object.__new__(cls)
+        inst._v = v
+        inst._n = n
+        return inst
+
+    def __len__(self):
+        return self._n
+
+    def _index(self, index):
+        i = operator.index(index)
+        if i < 0:
+            i += self._n
+        if not 0 <= i < self._n:
+            raise IndexError('mpz_vector index out of range')
+        return i
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            indices = xrange(*index.indices(self._n))
+            res = _new_vec(len(indices))
+            for k, i in enumerate(indices):
+                gmp.mpz_set(res + k, self._v + i)
+            return mpz_vector._from_c_vec(res, len(indices))
+        res = _new_mpz()
+        gmp.mpz_set(res, self._v + self._index(index))
+        return mpz._from_c_mpz(res)
+
+    def __setitem__(self, index, value):
+        _set_element(self._v + self._index(index), value)
+
+    def __iter__(self):
+        for i in xrange(self._n):
+            yield self[i]
+
+    def tolist(self):
+        """
+        x.tolist() -> list
+
+        Return the elements of x as a list of mpz.
+        """
+        return list(self)
+
+    def __repr__(self):
+        return 'mpz_vector([%s])' % ', '.join(
+            _mpz_to_str(self._v + i, 10) for i in xrange(self._n))
+
+    def __reduce__(self):
+        return mpz_vector, (self.tolist(),)
+
+    def __copy__(self):
+        return mpz_vector(self)
+
+    def __deepcopy__(self, memo):
+        return mpz_vector(self)
+
+    def __array__(self, dtype=None, copy=None):
+        return gmpy_cffi.numpy_support.to_numpy(
+            self, object if dtype is None else dtype)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        return gmpy_cffi.numpy_support._array_ufunc(
+            ufunc, method, inputs, kwargs)
+
+    def _operand(self, other):
+        """
+        Return (pointer, step, temporary) for an operand, or None if its
+        type is not supported. A temporary must be released with
+        _del_mpz.
+        """
+        if isinstance(other, mpz_vector):
+            if other._n != self._n:
+                raise ValueError('mpz_vector lengths differ: %d and %d' %
+                                 (self._n, other._n))
+            return other._v, 1, False
+        if isinstance(other, mpz):
+            return other._mpz, 0, False
+        if isinstance(other, (int, long)):
+            a = _new_mpz()
+            _pyint_to_mpz(other, a)
+            return a, 0, True
+        return None
+
+    def _binop(self, other, op, reflected=False):
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        b, step, temporary = operand
+        res = _new_vec(self._n)
+        if reflected:
+            status = gmp.gmpy_vec_binop(op, res, b, step, self._v, 1, self._n)
+        else:
+            status = gmp.gmpy_vec_binop(op, res, self._v, 1, b, step, self._n)
+        if temporary:
+            _del_mpz(b)
+        _check_status(status)
+        return mpz_vector._from_c_vec(res, self._n)
+
+    def __add__(self, other):
+        return self._binop(other, gmp.GMPY_VEC_ADD)
+
+    def __radd__(self, other):
+        return self._binop(other, gmp.GMPY_VEC_ADD, True)
+
+    def __sub__(self, other):
+        return self._binop(other, gmp.GMPY_VEC_SUB)
+
+    def __rsub__(self, other):
+        return self._binop(other, gmp.GMPY_VEC_SUB, True)
+
+    def __mul__(self, other):
+        return self._binop(other, gmp.GMPY_VEC_MUL)
+
+    def __rmul__(self, other):
+        return self._binop(other, gmp.GMPY_VEC_MUL, True)
+
+    def __floordiv__(self, other):
+        return self._binop(other, gmp.GMPY_VEC_FLOORDIV)
+
+    def __rfloordiv__(self, other):
+        return self._binop(other, gmp.GMPY_VEC_FLOORDIV, True)
+
+    def __mod__(self, other):
+        return self._binop(other, gmp.GMPY_VEC_MOD)
+
+    def __rmod__(self, other):
+        return self._binop(other, gmp.GMPY_VEC_MOD, True)
+
+    def __pow__(self, power, modulo=None):
+        if modulo is not None:
+            return self.powm(power, modulo)
+        return self._binop(power, gmp.GMPY_VEC_POW)
+
+    def __rpow__(self, other):
+        return self._binop(other, gmp.GMPY_VEC_POW, True)
+
+    def powm(self, exp, mod):
+        """
+        x.powm(exp, mod) -> mpz_vector
+
+        Return the elementwise (x ** exp) % mod, where exp and mod are
+        each an mpz_vector of the same length as x or an integer. The
+        result is nonnegative, and exp must be nonnegative.
+        """
+        e = m = None
+        try:
+            e = self._operand(exp)
+            m = self._operand(mod)
+            if e is None or m is None:
+                raise TypeError(
+                    'powm() requires integer or mpz_vector arguments')
+            res = _new_vec(self._n)
+            status = gmp.gmpy_vec_powm(res, self._v, 1, e[0], e[1], m[0],
+                                       m[1], self._n)
+        finally:
+            for operand in (e, m):
+                if operand is not None and operand[2]:
+                    _del_mpz(operand[0])
+        _check_status(status)
+        return mpz_vector._from_c_vec(res, self._n)
+
+    def _cmp(self, other, op):
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        b, step, temporary = operand
+        res = ffi.new('unsigned char[]', self._n)
+        gmp.gmpy_vec_cmp(op, res, self._v, 1, b, step, self._n)
+        if temporary:
+            _del_mpz(b)
+        return list(map(bool, bytearray(ffi.buffer(res))))
+
+    def __lt__(self, other):
+        return self._cmp(other, gmp.GMPY_VEC_LT)
+
+    def __le__(self, other):
+        return self._cmp(other, gmp.GMPY_VEC_LE)
+
+    def __eq__(self, other):
+        return self._cmp(other, gmp.GMPY_VEC_EQ)
+
+    def __ne__(self, other):
+        return self._cmp(other, gmp.GMPY_VEC_NE)
+
+    def __gt__(self, other):
+        return self._cmp(other, gmp.GMPY_VEC_GT)
+
+    def __ge__(self, other):
+        return self._cmp(other, gmp.GMPY_VEC_GE)
+
+    def sum(self):
+        """
+        x.sum() -> mpz
+
+        Return the sum of the elements of x.
+        """
+        res = _new_mpz()
+        gmp.gmpy_vec_sum(res, self._v, self._n)
+        return mpz._from_c_mpz(res)
+
+    def prod(self):
+        """
+        x.prod() -> mpz
+
+        Return the product of the elements of x, computed with a balanced
+        product tree.
+        """
+        res = _new_mpz()
+        gmp.gmpy_vec_prod(res, self._v, self._n)
+        return mpz._from_c_mpz(res)
+
+    def dot(self, other):
+        """
+        x.dot(y) -> mpz
+
+        Return the sum of x[i] * y[i] for the mpz_vector y of the same
+        length as x.
+        """
+        if not isinstance(other, mpz_vector):
+            raise TypeError('dot() requires an mpz_vector argument')
+        if other._n != self._n:
+            raise ValueError('mpz_vector lengths differ: %d and %d' %
+                             (self._n, other._n))
+        res = _new_mpz()
+        gmp.gmpy_vec_dot(res, self._v, other._v, self._n)
+        return mpz._from_c_mpz(res)
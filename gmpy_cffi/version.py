@@ -40,3 +40,13 @@ def mpc_version():
     support is not available.
     """
     return "MPC {0}".format(ffi.string(gmp.mpc_get_version()))
+
+
+def mpfr_tls():
+    """
+    mpfr_tls() -> bool
+
+    Return True if MPFR was built with thread-local storage, so that its
+    exception flags and caches of constants are per thread.
+    """
+    return bool(gmp.mpfr_buildopt_tls_p())
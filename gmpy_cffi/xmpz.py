@@ -0,0 +1,183 @@
+import sys
+
+from gmpy_cffi.interface import gmp, ffi
+from gmpy_cffi.convert import _pyint_to_mpz, MAX_UI
+from gmpy_cffi.mpz import mpz
+from gmpy_cffi.cache import _new_mpz, _del_mpz
+
+
+if sys.version > '3':
+    long = int
+    xrange = range
+
+
+class xmpz(mpz):
+    """
+    xmpz() -> xmpz(0)
+
+        If no argument is given, return xmpz(0).
+
+    xmpz(n) -> xmpz
+
+        Return an 'xmpz' object with a numeric value 'n' (truncating n
+        to its integer part if it's a float).
+
+    xmpz(s[, base=0]):
+
+        Return an 'xmpz' object from a string 's' made of digits in the
+        given base.
+
+    An 'xmpz' is a mutable 'mpz': the in-place operators (+=, -=, *=,
+    //=, %=, <<=, >>=) write the result into the object's own storage
+    instead of allocating a new object. Other operations return 'mpz'.
+    xmpz objects are not hashable.
+    """
+
+    __slots__ = ()
+
+    __hash__ = None
+
+    def __init__(self, n=0, base=None):
+        if isinstance(n, mpz):
+            # Never share the C value, it will be modified in place
+            self._mpz_str = self._hash = None
+            self._mpz = ffi.gc(_new_mpz(), _del_mpz)
+            gmp.mpz_set(self._mpz, n._mpz)
+        else:
+            mpz.__init__(self, n, base)
+
+    def __repr__(self):
+        return 'xmpz(%s)' % self
+
+    def __copy__(self):
+        return xmpz(self)
+
+    def __deepcopy__(self, memo):
+        return xmpz(self)
+
+    def __pos__(self):
+        # mpz returns self, which must not be shared when mutable
+        res = _new_mpz()
+        gmp.mpz_set(res, self._mpz)
+        return mpz._from_c_mpz(res)
+
+    def __iadd__(self, other):
+        a = self._mpz
+        if isinstance(other, (int, long)):
+            if 0 <= other <= MAX_UI:
+                gmp.mpz_add_ui(a, a, other)
+            elif -MAX_UI <= other < 0:
+                gmp.mpz_sub_ui(a, a, -other)
+            else:
+                oth = _new_mpz()
+                _pyint_to_mpz(other, oth)
+                gmp.mpz_add(a, a, oth)
+                _del_mpz(oth)
+        elif isinstance(other, mpz):
+            gmp.mpz_add(a, a, other._mpz)
+        else:
+            return NotImplemented
+        self._mpz_str = None
+        return self
+
+    def __isub__(self, other):
+        a = self._mpz
+        if isinstance(other, (int, long)):
+            if 0 <= other <= MAX_UI:
+                gmp.mpz_sub_ui(a, a, other)
+            elif -MAX_UI <= other < 0:
+                gmp.mpz_add_ui(a, a, -other)
+            else:
+                oth = _new_mpz()
+                _pyint_to_mpz(other, oth)
+                gmp.mpz_sub(a, a, oth)
+                _del_mpz(oth)
+        elif isinstance(other, mpz):
+            gmp.mpz_sub(a, a, other._mpz)
+        else:
+            return NotImplemented
+        self._mpz_str = None
+        return self
+
+    def __imul__(self, other):
+        a = self._mpz
+        if isinstance(other, (int, long)):
+            if -sys.maxsize - 1 <= other <= sys.maxsize:
+                gmp.mpz_mul_si(a, a, other)
+            elif 0 <= other <= MAX_UI:
+                gmp.mpz_mul_ui(a, a, other)
+            else:
+                oth = _new_mpz()
+                _pyint_to_mpz(other, oth)
+                gmp.mpz_mul(a, a, oth)
+                _del_mpz(oth)
+        elif isinstance(other, mpz):
+            gmp.mpz_mul(a, a, other._mpz)
+        else:
+            return NotImplemented
+        self._mpz_str = None
+        return self
+
+    def __ifloordiv__(self, other):
+        a = self._mpz
+        if isinstance(other, (int, long)):
+            if other == 0:
+                raise ZeroDivisionError('xmpz division by zero')
+            if 0 < other <= MAX_UI:
+                gmp.mpz_fdiv_q_ui(a, a, other)
+            else:
+                oth = _new_mpz()
+                _pyint_to_mpz(other, oth)
+                gmp.mpz_fdiv_q(a, a, oth)
+                _del_mpz(oth)
+        elif isinstance(other, mpz):
+            if gmp.mpz_sgn(other._mpz) == 0:
+                raise ZeroDivisionError('xmpz division by zero')
+            gmp.mpz_fdiv_q(a, a, other._mpz)
+        else:
+            return NotImplemented
+        self._mpz_str = None
+        return self
+
+    def __imod__(self, other):
+        a = self._mpz
+        if isinstance(other, (int, long)):
+            if other == 0:
+                raise ZeroDivisionError('xmpz modulo by zero')
+            if 0 < other <= MAX_UI:
+                gmp.mpz_fdiv_r_ui(a, a, other)
+            else:
+                oth = _new_mpz()
+                _pyint_to_mpz(other, oth)
+                gmp.mpz_fdiv_r(a, a, oth)
+                _del_mpz(oth)
+        elif isinstance(other, mpz):
+            if gmp.mpz_sgn(other._mpz) == 0:
+                raise ZeroDivisionError('xmpz modulo by zero')
+            gmp.mpz_fdiv_r(a, a, other._mpz)
+        else:
+            return NotImplemented
+        self._mpz_str = None
+        return self
+
+    def __ilshift__(self, other):
+        if not isinstance(other, (int, long, mpz)):
+            return NotImplemented
+        if other < 0:
+            raise ValueError('negative shift count')
+        if other > MAX_UI:
+            raise OverflowError('outrageous shift count')
+        gmp.mpz_mul_2exp(self._mpz, self._mpz, int(other))
+        self._mpz_str = None
+        return self
+
+    def __irshift__(self, other):
+        if not isinstance(other, (int, long, mpz)):
+            return NotImplemented
+        if other < 0:
+            raise ValueError('negative shift count')
+        if other > MAX_UI:
+            raise OverflowError('outrageous shift count')
+        gmp.mpz_fdiv_q_2exp(self._mpz, self._mpz, int(other))
+        self._mpz_str = None
+        return self
@@ -1,7 +1,5 @@
 from setuptools import setup
 
-import gmpy_cffi.interface
-
 setup(
     name='gmpy_cffi',
     version='0.1',
@@ -32,5 +30,5 @@ setup(
     ],
     packages=['gmpy_cffi'],
     zip_safe=False,
-    ext_modules=[gmpy_cffi.interface.ffi.verifier.get_extension()],
+    cffi_modules=["gmpy_cffi/_gmp_build.py:ffibuilder"],
 )
@@ -0,0 +1,6 @@
+import sys
+
+# test_aio uses async syntax, which older Pythons cannot even compile
+collect_ignore = []
+if sys.version_info < (3, 7):
+    collect_ignore.append('test_aio.py')
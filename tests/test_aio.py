@@ -0,0 +1,89 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from gmpy_cffi import mpz, mpfr, is_prime, next_prime, fac, zeta, local_context
+from gmpy_cffi import aio
+
+
+class _Executor(ThreadPoolExecutor):
+    def __init__(self, *args, **kwargs):
+        ThreadPoolExecutor.__init__(self, *args, **kwargs)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return ThreadPoolExecutor.submit(self, *args, **kwargs)
+
+
+class TestAio(object):
+    def setup_method(self, method):
+        self.saved = aio.get_executor(), aio.get_threshold()
+        self.executor = _Executor(2)
+        aio.set_executor(self.executor)
+
+    def teardown_method(self, method):
+        self.executor.shutdown()
+        aio.set_executor(self.saved[0])
+        aio.set_threshold(self.saved[1])
+
+    def test_inline(self):
+        assert asyncio.run(aio.is_prime(mpz(97)))
+        assert asyncio.run(aio.fac(5)) == 120
+        assert self.executor.submitted == 0
+
+    def test_executor(self):
+        x = mpz(2)**2000
+        assert asyncio.run(aio.next_prime(x)) == next_prime(x)
+        assert asyncio.run(aio.fac(1000)) == fac(1000)
+        assert self.executor.submitted == 2
+
+    def test_gather(self):
+        aio.set_threshold(0)
+        numbers = [mpz(2)**k - 1 for k in (89, 90, 107, 108)]
+
+        async def main():
+            return await asyncio.gather(*[aio.is_prime(n) for n in numbers])
+
+        assert asyncio.run(main()) == [is_prime(n) for n in numbers]
+
+    def test_context(self):
+        aio.set_threshold(0)
+        with local_context(precision=100) as ctx:
+            x = asyncio.run(aio.zeta(2))
+            assert ctx.inexact
+        assert x.precision == 100
+        assert x == zeta(mpfr(2, 100))
+
+    def test_errors(self):
+        aio.set_threshold(0)
+        with pytest.raises(ValueError):
+            asyncio.run(aio.fac(-1))
+        with pytest.raises(TypeError):
+            aio.set_threshold(1.5)
+        with pytest.raises(ValueError):
+            aio.set_threshold(-1)
+
+    def test_cancel(self):
+        aio.set_threshold(0)
+        started = threading.Event()
+        release = threading.Event()
+
+        def block():
+            started.set()
+            release.wait()
+
+        async def main():
+            blockers = [self.executor.submit(block) for _ in range(2)]
+            started.wait()
+            task = asyncio.ensure_future(aio.next_prime(mpz(2)**1000))
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            release.set()
+            return await aio.next_prime(mpz(2)**1000)
+
+        assert asyncio.run(main()) == next_prime(mpz(2)**1000)
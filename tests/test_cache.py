@@ -1,6 +1,13 @@
+import operator
+import threading
+
 import pytest
 
-from gmpy_cffi import set_cache, get_cache, mpz, mpq, mpfr, mpc
+from gmpy_cffi import (
+    set_cache, get_cache, warm_cache, free_cache, cache_stats,
+    reset_cache_stats, mpz, mpq, mpfr, mpc, const_pi)
+from gmpy_cffi import cache
+from gmpy_cffi.interface import ffi
 
 def _cache(f):
     size, obsize = get_cache()
@@ -49,3 +56,134 @@ class TestCache(object):
         _cache(lambda i : mpc(complex(i), (100, 0)))
         _cache(lambda i : mpc(complex(i), (50, 100)))
         _cache(lambda i : mpc(complex(i), (50000, 50000)))
+
+    def test_lazy_cache(self):
+        set_cache(100, 128)
+        assert len(cache._mpz_pool) == 0
+        x = [mpz(i) for i in range(10)]
+        del(x)
+        assert len(cache._mpz_pool) >= 10
+
+    def test_warm_cache(self):
+        set_cache(50, 128)
+        warm_cache()
+        assert len(cache._mpz_pool) == 50
+        assert len(cache._mpq_pool) == 50
+        assert len(cache._mpfr_pool) == 50
+        assert len(cache._mpc_pool) == 50
+        set_cache(100, 128)
+        assert len(cache._mpz_pool) == 0
+
+    def test_free_cache(self):
+        pi = const_pi(1000)
+        warm_cache()
+        free_cache()
+        assert len(cache._mpz_pool) == 0
+        assert const_pi(1000) == pi
+
+    def test_cache_stats(self):
+        set_cache(100, 128)
+        reset_cache_stats()
+        stats = cache_stats()
+        assert sorted(stats) == ['mpc', 'mpfr', 'mpq', 'mpz']
+        assert stats['mpz']['hits'] == stats['mpz']['misses'] == 0
+        assert stats['mpz']['fill'] == 0
+
+        x = [mpz(i) for i in range(10)]
+        stats = cache_stats()['mpz']
+        assert stats['misses'] >= 10
+        assert stats['live'] >= 10
+        assert stats['peak'] >= 10
+        del(x)
+        assert cache_stats()['mpz']['fill'] >= 10
+
+        reset_cache_stats()
+        x = [mpz(i) for i in range(10)]
+        assert cache_stats()['mpz']['hits'] >= 10
+        del(x)
+
+        reset_cache_stats()
+        assert cache_stats()['mpz']['hits'] == 0
+
+    def test_oversized_objects(self):
+        set_cache(100, 128)
+        reset_cache_stats()
+        x = mpz(1) << 100000
+        del(x)
+        assert cache_stats()['mpz']['evictions'] == 1
+        x = cache._mpz_pool.get()
+        assert x._mp_alloc <= 128
+        cache._del_mpz(x)
+
+        x = mpq(mpz(1) << 100000, 3)
+        del(x)
+        assert cache_stats()['mpq']['evictions'] == 1
+
+        x = mpfr(1, 100000)
+        del(x)
+        assert cache_stats()['mpfr']['evictions'] == 1
+
+        x = mpc(1, 1, 100000)
+        del(x)
+        assert cache_stats()['mpc']['evictions'] == 1
+
+    def test_not_implemented(self):
+        x, y, z = mpq(1, 3), mpfr(1.5), mpc(1, 2)
+        live = dict((k, v['live']) for k, v in cache_stats().items())
+        for a in (x, y, z):
+            for op in (operator.add, operator.sub, operator.mul,
+                       operator.truediv, operator.pow):
+                with pytest.raises(TypeError):
+                    op(a, [])
+                with pytest.raises(TypeError):
+                    op([], a)
+        assert dict((k, v['live'])
+                    for k, v in cache_stats().items()) == live
+
+    def test_precision_bins(self):
+        set_cache(100, 128)
+        x = [mpfr(i, 256) for i in range(10)]
+        y = [mpc(i, i, (100, 200)) for i in range(10)]
+        del(x, y)
+        reset_cache_stats()
+        x = [mpfr(i, 53) for i in range(10)]
+        assert cache_stats()['mpfr']['hits'] == 0
+        x = [mpfr(i, 256) for i in range(10)]
+        assert cache_stats()['mpfr']['hits'] == 10
+        assert all(i.precision == 256 for i in x)
+        y = [mpc(i, i, (100, 200)) for i in range(10)]
+        assert cache_stats()['mpc']['hits'] == 10
+        assert all(i.precision == (100, 200) for i in y)
+
+    def test_stale_precision_bins(self):
+        set_cache(4, 128)
+        released = []
+        pool = cache._Pool('test', released.append)
+        for key in (256, 53):
+            objs = [pool.get(key) or (key, i) for i in range(4)]
+            for obj in objs:
+                pool.put(obj, key)
+        assert len(pool) == 4
+        assert sorted(released) == [(256, i) for i in range(4)]
+        assert all(pool.get(53) is not None for i in range(4))
+        assert pool.get(256) is None
+
+    def test_threads(self):
+        errors = []
+
+        def work(k):
+            try:
+                for _ in range(200):
+                    x = [mpz(i) * k for i in range(50)]
+                    addresses = set(int(ffi.cast('uintptr_t', i._mpz)) for i in x)
+                    assert len(addresses) == len(x)
+                    assert sum(x) == k * sum(range(50))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(k,)) for k in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == []
@@ -0,0 +1,181 @@
+import threading
+import pytest
+from gmpy_cffi import (
+    mpq, mpfr, mpc, context, get_context, set_context, local_context,
+    RoundToNearest, RoundToZero, RoundUp, RoundDown, Default,
+    InexactResultError, OverflowResultError, InvalidOperationError,
+    DivisionByZeroError, RangeError)
+
+
+class TestContext(object):
+    def test_defaults(self):
+        ctx = context()
+        assert ctx.precision == 53
+        assert ctx.real_prec == ctx.imag_prec == Default
+        assert ctx.round == RoundToNearest
+        assert ctx.real_round == ctx.imag_round == Default
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            context(precision=0)
+        with pytest.raises(ValueError):
+            context(round=17)
+        with pytest.raises(ValueError):
+            context(foo=1)
+        with pytest.raises(TypeError):
+            context(precision='53')
+        with pytest.raises(ValueError):
+            context().precision = Default
+        with pytest.raises(TypeError):
+            set_context(53)
+
+    def test_copy(self):
+        ctx = context(precision=100, imag_round=RoundUp)
+        new = ctx.copy()
+        assert new is not ctx
+        assert new.precision == 100 and new.imag_round == RoundUp
+
+    def test_set_context(self):
+        saved = get_context()
+        try:
+            set_context(context(precision=100))
+            assert mpfr(1).precision == 100
+            assert repr(mpfr(1)) == "mpfr('1.0')"
+        finally:
+            set_context(saved)
+        assert mpfr(1).precision == 53
+
+
+class TestLocalContext(object):
+    def test_precision(self):
+        with local_context(precision=100) as ctx:
+            assert get_context() is ctx
+            assert (mpfr(1) / 3).precision == 100
+            assert mpc(1, 2).precision == (100, 100)
+        assert (mpfr(1) / 3).precision == 53
+
+    def test_mpc_precision(self):
+        with local_context(real_prec=60, imag_prec=70):
+            assert (mpc(1, 2) + 1).precision == (60, 70)
+
+    def test_round(self):
+        with local_context(round=RoundDown):
+            down = mpfr(1) / 3
+        with local_context(round=RoundUp):
+            up = mpfr(1) / 3
+        assert down < up
+        with local_context(round=RoundToZero):
+            assert -mpfr(1) / 3 == -down
+
+    def test_round_rsub(self):
+        with local_context(round=RoundUp):
+            assert mpq(1, 3) - mpfr(1) == mpfr('-0.66666666666666663')
+            assert mpq(1, 3) - mpc(1, 2) == mpc('-0.66666666666666663-2.0j')
+        with local_context(round=RoundDown):
+            assert mpq(1, 3) - mpfr(1) == mpfr('-0.66666666666666674')
+            assert mpq(1, 3) - mpc(1, 2) == mpc('-0.66666666666666674-2.0j')
+
+    def test_restored_on_error(self):
+        saved = get_context()
+        with pytest.raises(ZeroDivisionError):
+            with local_context(precision=100):
+                1 / 0
+        assert get_context() is saved
+
+    def test_base_context(self):
+        with local_context(context(precision=80), round=RoundUp) as ctx:
+            assert ctx.precision == 80 and ctx.round == RoundUp
+
+
+class TestFlags(object):
+    def test_sticky(self):
+        with local_context() as ctx:
+            mpfr(1) + 1
+            assert not ctx.inexact
+            mpfr(1) / 3
+            mpfr(1) + 1
+            assert ctx.inexact
+            ctx.clear_flags()
+            assert not ctx.inexact
+
+    def test_flags_stay_with_context(self):
+        outer = get_context()
+        outer.clear_flags()
+        with local_context() as ctx:
+            mpfr('inf') - mpfr('inf')
+        assert ctx.invalid
+        assert not outer.invalid
+
+    def test_copy_clears_flags(self):
+        with local_context() as ctx:
+            mpfr(1) / 3
+            assert not ctx.copy().inexact
+
+    def test_overflow(self):
+        with local_context() as ctx:
+            mpfr(2) ** (2 ** 70)
+            assert ctx.overflow and ctx.inexact
+
+    def test_traps(self):
+        with local_context(trap_inexact=True) as ctx:
+            mpfr(1) / 2
+            with pytest.raises(InexactResultError):
+                mpfr(1) / 3
+            assert ctx.inexact
+        with local_context(trap_overflow=True):
+            with pytest.raises(OverflowResultError):
+                mpfr(2) ** (2 ** 70)
+        with local_context(trap_invalid=True):
+            with pytest.raises(InvalidOperationError):
+                mpfr('inf') - mpfr('inf')
+        with local_context(trap_divzero=True):
+            with pytest.raises(DivisionByZeroError):
+                mpfr(1) / mpfr(0)
+
+    def test_trap_ignores_earlier_flags(self):
+        with local_context() as ctx:
+            mpfr(1) / 3
+            ctx.trap_inexact = True
+            mpfr(1) + 1
+
+    def test_trap_comparisons(self):
+        with local_context(trap_erange=True) as ctx:
+            with pytest.raises(RangeError):
+                mpfr('nan') < 1
+            with pytest.raises(RangeError):
+                mpfr('nan') == mpfr(1)
+            assert ctx.erange
+            mpfr(1) + 1
+
+    def test_conversions_do_not_trap_later(self):
+        with local_context(trap_inexact=True) as ctx:
+            int(mpfr(1.5))
+            mpfr(1) + 1
+            assert ctx.inexact
+
+    def test_trap_constructors(self):
+        with local_context(trap_inexact=True):
+            with pytest.raises(InexactResultError):
+                mpfr('0.1')
+            mpfr(1) + 1
+            with pytest.raises(InexactResultError):
+                mpc('0.1')
+            mpc(1) + 1
+
+
+def test_threads():
+    results = {}
+
+    def work(prec):
+        with local_context(precision=prec):
+            results[prec] = [(mpfr(1) / 3).precision for _ in range(100)]
+
+    threads = [threading.Thread(target=work, args=(prec,))
+               for prec in (30, 60, 90, 120)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for prec, precs in results.items():
+        assert set(precs) == set([prec])
+    assert get_context().precision == 53
@@ -0,0 +1,102 @@
+import pytest
+
+from gmpy_cffi import (
+    mpz, xmpz, factor, factorint, clear_factor_cache, FactorTimeoutError,
+    next_prime)
+
+
+def _product(factors):
+    n = 1
+    for p, k in factors.items():
+        n *= p ** k
+    return n
+
+
+class TestFactor(object):
+    def test_small(self):
+        assert factorint(1) == {}
+        assert factorint(2) == {2: 1}
+        assert factorint(360) == {2: 3, 3: 2, 5: 1}
+        assert factorint(mpz(9973)) == {9973: 1}
+        assert factor(360) == [2, 2, 2, 3, 3, 5]
+        assert factor(1) == []
+
+    def test_types(self):
+        f = factorint(2**64 + 1)
+        assert list(f) == [274177, 67280421310721]
+        assert all(type(p) is mpz for p in f)
+        assert all(type(k) is int for k in f.values())
+        assert all(type(p) is mpz for p in factor(720))
+
+    def test_xmpz(self):
+        clear_factor_cache()
+        assert factorint(xmpz(12)) == {2: 2, 3: 1}
+        assert factor(xmpz(12)) == [2, 2, 3]
+        assert all(type(p) is mpz for p in factor(xmpz(12)))
+
+    def test_order(self):
+        n = 7 * 3**5 * 1000003 * 2**3
+        assert list(factorint(n)) == [2, 3, 7, 1000003]
+        assert factor(n) == sorted(factor(n))
+
+    def test_large_prime(self):
+        p = 2**127 - 1
+        assert factorint(p) == {p: 1}
+
+    def test_powers(self):
+        p = next_prime(mpz(2)**40)
+        assert factorint(p**3) == {p: 3}
+        assert factorint(3**40 * 5**7) == {3: 40, 5: 7}
+        assert factorint(p**2 * 101**4) == {101: 4, p: 2}
+
+    def test_rho(self):
+        p, q = next_prime(mpz(10)**9), next_prime(mpz(10)**9 + 100)
+        assert factorint(p * q) == {p: 1, q: 1}
+
+    def test_pm1(self):
+        # p - 1 = 6 * 2 * 3 * 5 * ... * 43 is smooth
+        p = 78496567990020181
+        q = next_prime(mpz(2)**80)
+        assert factorint(p * q) == {p: 1, q: 1}
+
+    def test_ecm(self):
+        # The factors are too large for rho's iteration budget
+        n = 2**101 - 1
+        assert factorint(n) == {7432339208719: 1, 341117531003194129: 1}
+
+    def test_many(self):
+        for n in range(2, 2000):
+            f = factorint(n)
+            assert _product(f) == n
+            assert all(factorint(p) == {p: 1} for p in f)
+
+    def test_cache(self):
+        clear_factor_cache()
+        n = 2**64 + 1
+        f = factorint(n)
+        f[mpz(3)] = 1
+        assert factorint(n) == {274177: 1, 67280421310721: 1}
+        clear_factor_cache()
+        assert factorint(n) == {274177: 1, 67280421310721: 1}
+
+    def test_timeout(self):
+        clear_factor_cache()
+        p = next_prime(mpz(2)**90)
+        q = next_prime(mpz(3)**60)
+        with pytest.raises(FactorTimeoutError) as e:
+            factorint(4 * p * q, timeout=0.01)
+        assert e.value.factors == {2: 2}
+        assert e.value.cofactor == p * q
+        assert factorint(6, timeout=0) == {2: 1, 3: 1}
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            factorint(0)
+        with pytest.raises(ValueError):
+            factor(-6)
+        with pytest.raises(TypeError):
+            factorint(6.0)
+        with pytest.raises(TypeError):
+            factorint(6, timeout='1')
+        with pytest.raises(ValueError):
+            factorint(6, timeout=-1)
@@ -175,6 +175,10 @@ class TestInit(object):
         assert repr(mpc(1.5, 2.3, (60, 0))) == "mpc('1.5+2.2999999999999998j',(60,53))"
         assert repr(mpc(1.5, 2.3, 53)) == "mpc('1.5+2.2999999999999998j')"
 
+    def test_slots(self):
+        assert not hasattr(mpc(1, 2), '__dict__')
+        assert not hasattr(mpc(1, 2) + 1, '__dict__')
+
 
 class TestCmp(object):
 
@@ -5,7 +5,7 @@ import math
 import random
 import pytest
 
-from gmpy_cffi import mpfr, mpq, mpz, isinf, isnan
+from gmpy_cffi import mpfr, mpq, mpz, isinf, isnan, local_context
 from math import sqrt
 
 
@@ -92,6 +92,10 @@ class TestInit(object):
         with pytest.raises(TypeError):
             mpfr(n, 53, 10)
 
+    def test_slots(self):
+        assert not hasattr(mpfr(1.5), '__dict__')
+        assert not hasattr(mpfr(1.5) + 1, '__dict__')
+
 
 class TestMath(object):
     def test_repr(self):
@@ -365,12 +369,29 @@ class TestCmp(object):
         assert hash(mpfr()) == hash(mpfr(0.0, 100)) == 0
         assert hash(mpfr('inf')) == hash(float('inf'))
         assert hash(mpfr('-inf')) == hash(float('-inf'))
-        assert hash(mpfr('nan')) == hash(float('nan'))
+        # NaNs hash by identity since Python 3.10, as float('nan') does
+        x = mpfr('nan')
+        assert hash(x) == hash(x)
 
     @pytest.mark.parametrize('n', small_floats + large_floats)
     def test_hash(self, n):
         assert hash(mpfr(n)) == hash(n)
 
+    def test_hash_exact(self):
+        import fractions
+        x = mpfr(1) / 3
+        with local_context(precision=200):
+            y = mpfr(1) / 3
+        assert y.precision == 200
+        assert hash(y) != hash(x)
+        assert hash(mpfr(2**100)) == hash(2**100)
+        with local_context(precision=100):
+            y = mpfr(2**70 + 1) / 2**80
+            z = -y
+        assert y.precision == z.precision == 100
+        assert hash(y) == hash(fractions.Fraction(2**70 + 1, 2**80))
+        assert hash(z) == hash(fractions.Fraction(-2**70 - 1, 2**80))
+
 
 class TestOther(object):
     def test_isinf(self):
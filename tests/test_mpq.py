@@ -177,6 +177,10 @@ class TestInit(object):
         with pytest.raises(TypeError):
             mpq(1,2,3,4)
 
+    def test_slots(self):
+        assert not hasattr(mpq(1, 3), '__dict__')
+        assert not hasattr(mpq(1, 3) + 1, '__dict__')
+
 
 class TestMath(object):
 
@@ -424,11 +428,20 @@ class TestCmp(object):
         assert hash(mpq(3,1)) == hash(fractions.Fraction(3,1)) == 3
         assert hash(mpq(0)) == hash(fractions.Fraction(0,1)) == hash(0.0) == 0
 
-    @pytest.mark.xfail("sys.version.startswith('3')")
     def test_hash_big(self):
         import fractions
         assert (hash(mpq(sys.maxsize + 1, sys.maxsize)) ==
                 hash(fractions.Fraction(sys.maxsize + 1, sys.maxsize)))
+        assert hash(mpq(-3**100, 2**90 + 1)) == hash(
+            fractions.Fraction(-3**100, 2**90 + 1))
+        # denominator divisible by the hash modulus
+        if PY3:
+            p = sys.hash_info.modulus
+            assert hash(mpq(1, p)) == hash(fractions.Fraction(1, p))
+
+    def test_hash_cached(self):
+        x = mpq(2**200 + 1, 3**50)
+        assert hash(x) == hash(x) == hash(mpq(2**200 + 1, 3**50))
 
     @pytest.mark.xfail("sys.version.startswith('2')", reason="python2 comparison")
     @pytest.mark.parametrize('n', invalids)
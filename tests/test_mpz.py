@@ -1,8 +1,11 @@
 from __future__ import division
 
 import sys
+from fractions import Fraction
 import pytest
-from gmpy_cffi import mpz, MAX_UI
+from gmpy_cffi import mpz, mpq, mpfr, MAX_UI
+from gmpy_cffi import convert
+from gmpy_cffi.interface import gmp, ffi
 
 
 PY3 = sys.version.startswith('3')
@@ -63,6 +66,15 @@ class TestInit(object):
         with pytest.raises(TypeError):
             mpz(n)
 
+    @pytest.mark.parametrize('n', [2**64, -2**64 - 1, 3**5000, -7**4000 + 1])
+    def test_init_huge(self, n):
+        assert int(mpz(n)) == n
+        assert int(mpz(n) + 1) == n + 1
+
+    def test_slots(self):
+        assert not hasattr(mpz(1), '__dict__')
+        assert not hasattr(mpz(1) + 1, '__dict__')
+
 
 class TestMath(object):
     numbers = [-1, 0, 1, sys.maxsize, -sys.maxsize - 1, MAX_UI, MAX_UI + 1]
@@ -406,5 +418,23 @@ class TestCmp(object):
     def test_hash(self):
         assert hash(mpz(1)) == 1
         assert hash(mpz(-2)) == -2
-        assert hash(mpz(sys.maxsize)) == sys.maxsize
-        assert hash(mpz(sys.maxsize+1)) == -sys.maxsize - 1
+        assert hash(mpz(sys.maxsize)) == hash(sys.maxsize)
+        assert hash(mpz(sys.maxsize+1)) == hash(sys.maxsize+1)
+
+    @pytest.mark.parametrize('n', [2**64, -2**64, 3**2000, -7**1500 - 1])
+    def test_hash_big(self, n):
+        assert hash(mpz(n)) == hash(n)
+        assert hash(mpz(n)) == hash(mpz(n))
+        assert {n: 1}[mpz(n)] == 1
+
+    @pytest.mark.skipif(not PY3, reason='hashes via hash(long) on Python 2')
+    @pytest.mark.parametrize('n', [2**64, -2**64, 3**2000, -7**1500 - 1])
+    def test_hash_wide_modulus(self, n, monkeypatch):
+        # The mpz_tdiv_r path taken when P does not fit in unsigned long
+        modulus = ffi.new('mpz_t')
+        gmp.mpz_init(modulus)
+        convert._pylong_to_mpz(sys.hash_info.modulus, modulus)
+        monkeypatch.setattr(convert, '_hash_modulus', modulus)
+        assert hash(mpz(n)) == hash(n)
+        assert hash(mpq(n, 3)) == hash(Fraction(n, 3))
+        assert hash(mpfr(n, 100)) == hash(Fraction(int(mpfr(n, 100))))
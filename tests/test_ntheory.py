@@ -1,6 +1,10 @@
+import threading
+
 import pytest
 
 from gmpy_cffi import mpz, mpq, mpfr, is_prime, next_prime, gcd, gcdext, lcm, invert, jacobi, legendre, kronecker, fac, bincoef, fib, fib2, lucas, lucas2
+from gmpy_cffi import batch_gcd, batch_mod
+from gmpy_cffi import is_strong_prp, is_strong_lucas_prp, is_strong_selfridge_prp, is_bpsw_prp, is_prime_many, primerange
 
 
 class Test_ntheory(object):
@@ -30,6 +34,29 @@ class Test_ntheory(object):
         with pytest.raises(ValueError):
             is_prime(5, -4)
 
+    def test_is_prime_many(self):
+        values = list(range(-20, 20000, 7)) + [mpz(2)**89 - 1, 2**64 + 1,
+                                              2**127 - 1, 16411 * 16417]
+        expected = [is_prime(x) for x in values]
+        assert is_prime_many(values) == expected
+        assert is_prime_many(iter(values), 10) == expected
+        m = is_prime_many(values, mask=True)
+        assert type(m) is mpz
+        assert [bool(m >> i & 1) for i in range(len(values))] == expected
+        assert is_prime_many([]) == []
+        assert is_prime_many([], mask=True) == 0
+        assert is_prime_many([4, 5, 7], mask=True) == 6
+        # large values are trial divided by the remainder tree
+        p = next_prime(mpz(2)**1500)
+        q = next_prime(mpz(2)**700)
+        values = ([p + k for k in range(0, 400, 2)] +
+                  [p, -p, p * q, p * 65537, p * 1048583, 0, 1, 2, 65537, 9])
+        assert is_prime_many(values) == [is_prime(x) for x in values]
+        with pytest.raises(TypeError):
+            is_prime_many([1.0])
+        with pytest.raises(ValueError):
+            is_prime_many([5], 0)
+
     def test_next_prime(self):
         assert next_prime(3) == mpz(5)
         assert next_prime(mpz(10000)) == mpz(10007)
@@ -38,6 +65,63 @@ class Test_ntheory(object):
         with pytest.raises(TypeError):
             next_prime(mpq(1, 4))
 
+    def test_is_strong_prp(self):
+        assert is_strong_prp(2, 3)
+        assert not is_strong_prp(1, 3)
+        assert not is_strong_prp(10, 3)
+        assert is_strong_prp(mpz(9973), 2)
+        assert [n for n in range(3, 10000, 2) if is_strong_prp(n, 2) and
+                not is_prime(n)] == [2047, 3277, 4033, 4681, 8321]
+        assert is_strong_prp(2**127 - 1, 3)
+        assert not is_strong_prp(2**127 + 1, 2)
+        with pytest.raises(ValueError):
+            is_strong_prp(9, 1)
+        with pytest.raises(ValueError):
+            is_strong_prp(9, 6)
+        with pytest.raises(TypeError):
+            is_strong_prp(9, 2.0)
+
+    def test_is_strong_lucas_prp(self):
+        assert is_strong_lucas_prp(101, 3, 1)
+        assert is_strong_lucas_prp(mpz(2)**89 - 1, 1, -1)
+        assert not is_strong_lucas_prp(101 * 103, 3, 1)
+        assert is_strong_lucas_prp(5459, 1, 2)
+        assert [n for n in range(3, 20000, 2) if n % 5 and
+                is_strong_lucas_prp(n, 1, -1) and not is_prime(n)] == [
+            4181, 5777, 10877, 13201, 15251]
+        assert not is_strong_lucas_prp(1, 3, 1)
+        with pytest.raises(ValueError):
+            is_strong_lucas_prp(101, 2, 1)
+        with pytest.raises(ValueError):
+            is_strong_lucas_prp(15, 3, 1)
+
+    def test_is_strong_selfridge_prp(self):
+        assert is_strong_selfridge_prp(2)
+        assert is_strong_selfridge_prp(3)
+        assert is_strong_selfridge_prp(5)
+        assert not is_strong_selfridge_prp(25)
+        assert [n for n in range(3, 100000, 2)
+                if is_strong_selfridge_prp(n) and not is_prime(n)] == [
+            5459, 5777, 10877, 16109, 18971, 22499, 24569, 25199, 40309,
+            58519, 75077, 97439]
+        assert is_strong_selfridge_prp(2**127 - 1)
+
+    def test_is_bpsw_prp(self):
+        assert [n for n in range(-10, 30000) if is_bpsw_prp(n)] == list(
+            primerange(0, 30000))
+        assert is_bpsw_prp(mpz(2)**64 - 59)
+        assert not is_bpsw_prp(2**64 - 1)
+        # strong pseudoprimes to the bases 2, 3, ..., 23 and 2, ..., 41
+        assert not is_bpsw_prp(3825123056546413051)
+        assert not is_bpsw_prp(3317044064679887385961981)
+        assert is_bpsw_prp(2**127 - 1)
+        assert is_bpsw_prp(4547337172376300111955330758342147474062293202868155909489)
+        assert not is_bpsw_prp(4547337172376300111955330758342147474062293202868155909393)
+        assert not is_bpsw_prp((2**61 - 1) * (2**89 - 1))
+        assert not is_bpsw_prp(mpz(2)**200)
+        with pytest.raises(TypeError):
+            is_bpsw_prp(mpq(1, 2))
+
     def test_gcd(self):
         assert gcd(4, 6) == mpz(2)
         assert gcd(5, 0) == mpz(5)
@@ -147,3 +231,51 @@ class Test_ntheory(object):
             lucas2(-1)
         with pytest.raises(TypeError):
             lucas2(45894575342551390123)
+
+    def test_batch_mod(self):
+        moduli = [mpz(7), 2**64 + 13, 3, 10**30 + 57, 1, 2**89 - 1, 641]
+        x = 3**500 + 11
+        assert batch_mod(x, moduli) == [x % m for m in moduli]
+        assert batch_mod(-x, moduli) == [-x % m for m in moduli]
+        assert batch_mod(x, [5]) == [x % 5]
+        assert batch_mod(x, []) == []
+        assert all(type(r) is mpz for r in batch_mod(x, moduli))
+        with pytest.raises(ValueError):
+            batch_mod(x, [3, 0])
+        with pytest.raises(ValueError):
+            batch_mod(x, [-3])
+        with pytest.raises(TypeError):
+            batch_mod(x, [3.0])
+
+    def test_batch_gcd(self):
+        p, q, r, s, t = [next_prime(mpz(2)**64 * k) for k in (3, 5, 7, 11, 13)]
+        moduli = [p * q, r * s, p * t, 2**61 - 1, s * 5, r * s]
+        expected = []
+        for i, m in enumerate(moduli):
+            others = 1
+            for j, n in enumerate(moduli):
+                if i != j:
+                    others *= n
+            expected.append(gcd(m, others))
+        assert batch_gcd(moduli) == expected
+        assert batch_gcd(moduli)[:4] == [p, r * s, p, 1]
+        assert batch_gcd([p * q]) == [1]
+        assert batch_gcd([]) == []
+        with pytest.raises(ValueError):
+            batch_gcd([15, 0])
+
+
+def test_threads_concurrent_calls():
+    # Only checks that concurrent calls give the right results
+    numbers = [next_prime(mpz(2)**(1000 + k)) for k in range(8)]
+    results = {}
+
+    def work(k):
+        results[k] = is_prime(numbers[k]) and not is_prime(numbers[k] * 3)
+
+    threads = [threading.Thread(target=work, args=(k,)) for k in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == dict((k, True) for k in range(8))
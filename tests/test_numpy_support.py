@@ -0,0 +1,112 @@
+import subprocess
+import sys
+
+import pytest
+
+from gmpy_cffi import (
+    mpz, mpq, mpfr, mpz_vector, mpz_array_from_numpy, to_numpy)
+
+numpy = pytest.importorskip('numpy')
+
+
+class TestFromNumpy(object):
+    def test_int64(self):
+        a = numpy.array([0, 1, -1, 2**62, -2**63, 2**63 - 1], numpy.int64)
+        v = mpz_array_from_numpy(a)
+        assert isinstance(v, mpz_vector)
+        assert v.tolist() == a.tolist()
+
+    def test_other_dtypes(self):
+        assert mpz_array_from_numpy(
+            numpy.array([2**64 - 1, 0], numpy.uint64)).tolist() == [
+                2**64 - 1, 0]
+        assert mpz_array_from_numpy(
+            numpy.array([1, -2], numpy.int8)).tolist() == [1, -2]
+        assert mpz_array_from_numpy(
+            numpy.array([True, False])).tolist() == [1, 0]
+        assert mpz_array_from_numpy(
+            numpy.array([1.5, -2.5, 1e20])).tolist() == [1, -2, 10**20]
+        assert mpz_array_from_numpy(
+            numpy.array([2**100, mpz(3)], object)).tolist() == [2**100, 3]
+
+    def test_non_contiguous(self):
+        a = numpy.arange(10, dtype=numpy.int64)[::3]
+        assert mpz_array_from_numpy(a).tolist() == [0, 3, 6, 9]
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            mpz_array_from_numpy(numpy.zeros((2, 2), numpy.int64))
+        with pytest.raises(ValueError):
+            mpz_array_from_numpy(numpy.array([numpy.nan]))
+        with pytest.raises(TypeError):
+            mpz_array_from_numpy(numpy.array(['1']))
+
+
+class TestToNumpy(object):
+    def test_mpz_vector(self):
+        v = mpz_vector([1, -2, 2**70])
+        a = to_numpy(v)
+        assert a.dtype == numpy.float64
+        assert a.tolist() == [1.0, -2.0, float(2**70)]
+        assert to_numpy(v[:2], numpy.int64).tolist() == [1, -2]
+        assert to_numpy(v, object).tolist() == [1, -2, 2**70]
+        assert numpy.asarray(v).dtype == object
+
+    def test_int64_range(self):
+        v = mpz_vector([-2**63, 2**63 - 1, 0])
+        assert to_numpy(v, numpy.int64).tolist() == [-2**63, 2**63 - 1, 0]
+        with pytest.raises(OverflowError):
+            to_numpy(mpz_vector([2**63]), numpy.int64)
+        with pytest.raises(OverflowError):
+            to_numpy(mpz_vector([-2**63 - 1]), numpy.int64)
+
+    def test_sequences(self):
+        assert to_numpy([mpz(3), mpz(-4)]).tolist() == [3.0, -4.0]
+        assert to_numpy([mpq(1, 4), mpq(-3, 2)]).tolist() == [0.25, -1.5]
+        assert to_numpy([mpfr(0.5), mpfr(-1.25)]).tolist() == [0.5, -1.25]
+        assert to_numpy([mpz(1), mpq(1, 2), 3]).tolist() == [1.0, 0.5, 3.0]
+
+    def test_object_array(self):
+        a = numpy.array([[mpz(1), mpz(2)], [mpz(3), mpz(4)]], object)
+        res = to_numpy(a, numpy.int64)
+        assert res.shape == (2, 2)
+        assert res.tolist() == [[1, 2], [3, 4]]
+
+    def test_invalid(self):
+        with pytest.raises(TypeError):
+            to_numpy([mpq(1, 2)], numpy.int64)
+        with pytest.raises(TypeError):
+            to_numpy([mpz(1)], numpy.float32)
+
+
+class TestUfuncs(object):
+    def test_binary(self):
+        v = mpz_vector([1, 2, 3])
+        a = numpy.array([10, 20, 30])
+        assert numpy.add(v, a).tolist() == [11, 22, 33]
+        assert isinstance(a - v, mpz_vector)
+        assert (a - v).tolist() == [9, 18, 27]
+        assert numpy.multiply(v, numpy.int64(2)).tolist() == [2, 4, 6]
+        assert numpy.power(v, 100)[2] == 3**100
+        assert numpy.floor_divide(a, v).tolist() == [10, 10, 10]
+
+    def test_comparisons(self):
+        v = mpz_vector([1, 2, 3])
+        res = numpy.less(v, numpy.array([2, 2, 2]))
+        assert res.dtype == bool
+        assert res.tolist() == [True, False, False]
+
+    def test_reduce(self):
+        v = mpz_vector([2**70, 3, 5])
+        assert numpy.add.reduce(v) == 2**70 + 8
+        assert numpy.multiply.reduce(v) == 15 * 2**70
+
+    def test_unsupported(self):
+        v = mpz_vector([1, 2])
+        with pytest.raises(TypeError):
+            numpy.sqrt(v)
+
+
+def test_lazy_import():
+    code = 'import sys, gmpy_cffi; assert "numpy" not in sys.modules'
+    subprocess.check_call([sys.executable, '-c', code])
@@ -0,0 +1,46 @@
+import subprocess
+import sys
+
+import pytest
+from gmpy_cffi import mpz, mpq, mpfr, is_prime, gcd, exp, local_context
+from gmpy_cffi.parallel import pmap
+
+
+def _add(a, b):
+    return a + b
+
+
+class TestPmap(object):
+    def test_ntheory(self):
+        numbers = [mpz(2)**127 - 1, mpz(2)**128 + 1] + list(range(100))
+        assert list(pmap(is_prime, numbers, workers=2)) == [
+            is_prime(n) for n in numbers]
+
+    def test_several_iterables(self):
+        a = [mpz(3)**k for k in range(50)]
+        b = [mpz(6)**k for k in range(50)]
+        assert list(pmap(gcd, a, b, workers=2, chunksize=7)) == a
+
+    def test_types(self):
+        a = [mpz(1), mpq(1, 3), mpfr(1.5)]
+        assert list(pmap(_add, a, a, workers=2)) == [
+            mpz(2), mpq(2, 3), mpfr(3)]
+
+    def test_context(self):
+        with local_context(precision=100):
+            results = list(pmap(exp, [0.5, 1.5], workers=2))
+            assert results == [exp(0.5), exp(1.5)]
+        assert all(x.precision == 100 for x in results)
+
+    def test_invalid(self):
+        with pytest.raises(TypeError):
+            pmap(is_prime)
+        with pytest.raises(ValueError):
+            pmap(is_prime, [1], workers=0)
+        with pytest.raises(TypeError):
+            pmap(is_prime, [1], processes=2)
+
+
+def test_lazy_import():
+    code = 'import sys, gmpy_cffi; assert "multiprocessing" not in sys.modules'
+    subprocess.check_call([sys.executable, '-c', code])
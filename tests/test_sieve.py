@@ -0,0 +1,68 @@
+import itertools
+
+import pytest
+
+from gmpy_cffi import mpz, primerange, primes, is_prime, next_prime
+
+
+def _next_primes(a, b):
+    res = []
+    p = next_prime(a - 1)
+    while p < b:
+        res.append(int(p))
+        p = next_prime(p)
+    return res
+
+
+class TestPrimerange(object):
+    def test_small(self):
+        assert list(primerange(0, 30)) == [2, 3, 5, 7, 11, 13, 17, 19, 23,
+                                           29]
+        assert list(primerange(-10, 3)) == [2]
+        assert list(primerange(2, 3)) == [2]
+        assert list(primerange(3, 4)) == [3]
+        assert list(primerange(4, 5)) == []
+        assert list(primerange(10, 10)) == []
+        assert list(primerange(20, 10)) == []
+        assert list(primerange(mpz(10), mpz(20))) == [11, 13, 17, 19]
+
+    def test_count(self):
+        assert sum(1 for p in primerange(0, 10**6)) == 78498
+        assert sum(1 for p in primerange(10**6, 2 * 10**6)) == 70435
+
+    def test_segments(self):
+        # crosses several segment boundaries
+        a = 10**12
+        assert list(primerange(a, a + 10**6)) == _next_primes(a, a + 10**6)
+
+    def test_large(self):
+        a = 2**62 - 1000
+        assert list(primerange(a, a + 2000)) == _next_primes(a, a + 2000)
+
+    def test_types(self):
+        a = 2**64 - 1000
+        res = list(primerange(a, a + 2000))
+        assert res == _next_primes(a, a + 2000)
+        assert all(type(p) is int for p in res if p < 2**64)
+        assert all(type(p) is mpz for p in res if p > 2**64)
+        assert all(type(p) is int for p in primerange(0, 100))
+
+    def test_errors(self):
+        with pytest.raises(TypeError):
+            primerange(1.0, 10)
+        with pytest.raises(TypeError):
+            primerange(1, None)
+
+
+class TestPrimes(object):
+    def test_primes(self):
+        assert list(itertools.islice(primes(), 5)) == [2, 3, 5, 7, 11]
+        assert list(itertools.islice(primes(90), 3)) == [97, 101, 103]
+        p = list(itertools.islice(primes(), 100000))
+        assert p[-1] == 1299709
+        assert all(is_prime(x) for x in p[-100:])
+
+    def test_mpz(self):
+        assert next(primes(mpz(2)**100)) == next_prime(mpz(2)**100)
+        with pytest.raises(TypeError):
+            primes('2')
@@ -76,6 +76,12 @@ class TestTrig(object):
             mpc('1.1015144315669947-0.36368439983078849j'))
         assert sin_cos(mpc(0.5+0.7j)) == (sin(mpc(0.5+0.7j)), cos(mpc(0.5+0.7j)))
 
+    def test_sin_cos_recycled(self):
+        # released objects keep their value when they are reused
+        x = mpfr(3)
+        del x
+        assert sin_cos(0.5) == (sin(0.5), cos(0.5))
+
     def test_sec(self):
         assert sec(0.5) == mpfr('1.139493927324549')
 
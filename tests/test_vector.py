@@ -0,0 +1,138 @@
+import copy
+import pickle
+
+import pytest
+
+from gmpy_cffi import mpz, mpz_vector
+
+
+class TestVector(object):
+    a = [5, -7, 9, 0, 2**100]
+    b = [2, 3, -4, 6, -3**50]
+
+    def test_init(self):
+        v = mpz_vector(self.a)
+        assert len(v) == 5
+        assert v.tolist() == self.a
+        assert all(type(x) is mpz for x in v)
+        assert mpz_vector().tolist() == []
+        assert mpz_vector(mpz(i) for i in range(3)).tolist() == [0, 1, 2]
+        assert mpz_vector(v).tolist() == self.a
+        with pytest.raises(TypeError):
+            mpz_vector([1, 2.5])
+
+    def test_repr(self):
+        assert repr(mpz_vector([1, -2, 3])) == 'mpz_vector([1, -2, 3])'
+        assert repr(mpz_vector()) == 'mpz_vector([])'
+
+    def test_items(self):
+        v = mpz_vector(self.a)
+        assert v[0] == 5 and v[-1] == 2**100
+        assert v[1:4].tolist() == self.a[1:4]
+        assert v[::-2].tolist() == self.a[::-2]
+        v[1] = mpz(17)
+        v[-2] = 2**70
+        assert v.tolist() == [5, 17, 9, 2**70, 2**100]
+        with pytest.raises(IndexError):
+            v[5]
+        with pytest.raises(TypeError):
+            v['a']
+        with pytest.raises(TypeError):
+            hash(v)
+
+    def test_arithmetic(self):
+        v, w = mpz_vector(self.a), mpz_vector(self.b)
+        pairs = list(zip(self.a, self.b))
+        assert (v + w).tolist() == [x + y for x, y in pairs]
+        assert (v - w).tolist() == [x - y for x, y in pairs]
+        assert (v * w).tolist() == [x * y for x, y in pairs]
+        assert (v // w).tolist() == [x // y for x, y in pairs]
+        assert (v % w).tolist() == [x % y for x, y in pairs]
+
+    def test_scalar(self):
+        v = mpz_vector(self.a)
+        assert (v + 1).tolist() == [x + 1 for x in self.a]
+        assert (1 - v).tolist() == [1 - x for x in self.a]
+        assert (v * mpz(3)).tolist() == [x * 3 for x in self.a]
+        assert (2**80 // v[:3]).tolist() == [2**80 // x for x in self.a[:3]]
+        assert (v % -7).tolist() == [x % -7 for x in self.a]
+        assert (v ** 3).tolist() == [x ** 3 for x in self.a]
+        assert (2 ** mpz_vector([0, 3, 10])).tolist() == [1, 8, 1024]
+
+    def test_pow(self):
+        v = mpz_vector([3, -2, 0, 7])
+        e = mpz_vector([0, 5, 3, 2])
+        assert (v ** e).tolist() == [1, -32, 0, 49]
+        assert (2 ** e).tolist() == [1, 32, 8, 4]
+        with pytest.raises(ValueError):
+            v ** -1
+        with pytest.raises(ValueError):
+            v ** mpz_vector([1, 2, -3, 4])
+        with pytest.raises(ValueError):
+            v ** 2**100
+
+    def test_powm(self):
+        v = mpz_vector(self.a)
+        m = mpz_vector([11, 13, 17, 19, 23])
+        assert v.powm(2**70, m).tolist() == [
+            pow(x, 2**70, y) for x, y in zip(self.a, [11, 13, 17, 19, 23])]
+        assert pow(v, 5, 1000).tolist() == [pow(x, 5, 1000) for x in self.a]
+        with pytest.raises(ZeroDivisionError):
+            v.powm(2, mpz_vector([1, 2, 3, 0, 5]))
+        with pytest.raises(ValueError):
+            v.powm(-1, 7)
+        with pytest.raises(TypeError):
+            v.powm(2, 7.0)
+
+    def test_division_by_zero(self):
+        v = mpz_vector(self.a)
+        with pytest.raises(ZeroDivisionError):
+            v // 0
+        with pytest.raises(ZeroDivisionError):
+            v % mpz_vector([1, 2, 3, 0, 5])
+        with pytest.raises(ZeroDivisionError):
+            1 // v
+
+    def test_length_mismatch(self):
+        with pytest.raises(ValueError):
+            mpz_vector([1, 2]) + mpz_vector([1, 2, 3])
+        with pytest.raises(ValueError):
+            mpz_vector([1, 2]).dot(mpz_vector([1]))
+
+    def test_unsupported(self):
+        v = mpz_vector([1, 2])
+        with pytest.raises(TypeError):
+            v + 1.5
+        with pytest.raises(TypeError):
+            v.dot([1, 2])
+
+    def test_comparisons(self):
+        v, w = mpz_vector(self.a), mpz_vector(self.b)
+        pairs = list(zip(self.a, self.b))
+        assert (v < w) == [x < y for x, y in pairs]
+        assert (v <= w) == [x <= y for x, y in pairs]
+        assert (v == v) == [True] * 5
+        assert (v != w) == [x != y for x, y in pairs]
+        assert (v > 0) == [x > 0 for x in self.a]
+        assert (0 >= v) == [0 >= x for x in self.a]
+        assert (v == mpz(9)) == [x == 9 for x in self.a]
+
+    def test_reductions(self):
+        v, w = mpz_vector(self.a), mpz_vector(self.b)
+        assert v.sum() == sum(self.a)
+        assert v.dot(w) == sum(x * y for x, y in zip(self.a, self.b))
+        r = mpz_vector(range(1, 101))
+        p = 1
+        for i in range(1, 101):
+            p *= i
+        assert r.prod() == p
+        assert mpz_vector().sum() == 0
+        assert mpz_vector().prod() == 1
+        assert type(v.sum()) is mpz
+
+    def test_copy_pickle(self):
+        v = mpz_vector(self.a)
+        c = copy.copy(v)
+        c[0] = 1
+        assert v[0] == 5
+        assert pickle.loads(pickle.dumps(v)).tolist() == self.a
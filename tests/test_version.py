@@ -1,7 +1,8 @@
 import re
 import pytest
 
-from gmpy_cffi import version, mp_version, mpfr_version, mpc_version
+from gmpy_cffi import (
+    version, mp_version, mpfr_version, mpc_version, mpfr_tls)
 
 
 class TestVersion:
@@ -24,3 +25,6 @@ class TestVersion:
         s = mpc_version()
         assert isinstance(s, str)
         assert s.startswith('MPC ')
+
+    def test_mpfr_tls(self):
+        assert mpfr_tls() in (True, False)
@@ -0,0 +1,93 @@
+from __future__ import division
+
+import sys
+import pytest
+from gmpy_cffi import xmpz, mpz, MAX_UI
+
+
+class TestInit(object):
+    @pytest.mark.parametrize('n', [0, 1, -123, sys.maxsize + 1, '0x1f'])
+    def test_init(self, n):
+        if isinstance(n, str):
+            assert xmpz(n, 0) == 31
+        else:
+            assert xmpz(n) == n
+
+    def test_init_copies(self):
+        a = mpz(5)
+        b = xmpz(a)
+        b += 1
+        assert a == 5
+        c = xmpz(b)
+        c += 1
+        assert b == 6 and c == 7
+
+    def test_repr(self):
+        assert repr(xmpz(42)) == 'xmpz(42)'
+
+    def test_unhashable(self):
+        with pytest.raises(TypeError):
+            hash(xmpz(1))
+
+
+class TestInplace(object):
+    values = [0, 1, -1, 7, -7, MAX_UI, -MAX_UI, 2 * MAX_UI + 3,
+              -2 * MAX_UI - 3, mpz(11), mpz(-2 * MAX_UI)]
+
+    @pytest.mark.parametrize('b', values)
+    def test_add_sub_mul(self, b):
+        x = xmpz(1234567)
+        ident = id(x)
+        x += b
+        assert x == 1234567 + b
+        x -= b
+        assert x == 1234567
+        x *= b
+        assert x == 1234567 * b
+        assert id(x) == ident and type(x) is xmpz
+
+    @pytest.mark.parametrize('b', [v for v in values if v != 0])
+    def test_floordiv_mod(self, b):
+        x = xmpz(-12345678901234567890)
+        x //= b
+        assert x == -12345678901234567890 // int(b)
+        x = xmpz(-12345678901234567890)
+        x %= b
+        assert x == -12345678901234567890 % int(b)
+
+    def test_zero_division(self):
+        x = xmpz(1)
+        with pytest.raises(ZeroDivisionError):
+            x //= 0
+        with pytest.raises(ZeroDivisionError):
+            x %= mpz(0)
+
+    def test_shift(self):
+        x = xmpz(3)
+        x <<= 100
+        assert x == 3 << 100
+        x >>= mpz(99)
+        assert x == 6
+        with pytest.raises(ValueError):
+            x <<= -1
+
+    def test_invalid(self):
+        x = xmpz(1)
+        with pytest.raises(TypeError):
+            x += []
+
+    def test_str_updates(self):
+        x = xmpz(9)
+        assert str(x) == '9'
+        x += 1
+        assert str(x) == '10'
+
+    def test_pos_copies(self):
+        a = xmpz(5)
+        b = +a
+        assert type(b) is mpz and b == 5
+        a += 1
+        assert b == 5
+
+    def test_binary_ops_return_mpz(self):
+        assert type(xmpz(2) + 3) is mpz